@@ -0,0 +1,65 @@
+# Measures the memory held per UpgradeCost/ScrapReward object as a CompactParseObject, against the same class as a regular ParseObject.
+# Objects are created the way Module._p_levels_data creates them, and memory is measured with tracemalloc while they are alive.
+#
+# Usage: python benchmarks/bench_compact_records.py [--count N]
+
+import sys
+import os
+import argparse
+import tracemalloc
+
+src_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+sys.path.insert(0, src_dir)
+sys.path.insert(0, os.path.join(src_dir, 'parse'))
+
+os.environ.setdefault('SHOULD_PARSE', 'false')
+
+from parsers.object import ParseObject
+from parsers.upgrade_cost import UpgradeCost
+from parsers.scrap_reward import ScrapReward
+
+class DictUpgradeCost(ParseObject):
+    """UpgradeCost as a regular ParseObject, as it was before"""
+    objects = dict()
+    has_output_file = False
+
+    def __init__(self, id, currency_ref, amount):
+        super().__init__(id, {
+            "currency_ref": currency_ref,
+            "amount": amount
+        })
+
+    def _parse(self):
+        self.currency_ref = self.source_data.get("currency_ref")
+        self.amount = self.source_data.get("amount")
+
+def measure(cls, ids: list, currency_ref: str) -> int:
+    """Returns the bytes allocated and still held after creating one object of cls per id"""
+    cls.objects = dict()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for i, obj_id in enumerate(ids):
+        cls(obj_id, currency_ref, i)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    cls.objects = dict()
+    return after - before
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the memory of CompactParseObject records")
+    parser.add_argument("--count", type=int, default=100_000)
+    args = parser.parse_args()
+
+    # ids are created up front so they are not counted, as they are shared with the objects dict
+    ids = [f"DA_Module_Benchmark{i // 13}_{i % 13}" for i in range(args.count)]
+    currency_ref = "OBJID_Currency::DA_Meta_Currency_Alloys"
+
+    regular = measure(DictUpgradeCost, ids, currency_ref)
+    results = {cls.__name__: measure(cls, ids, currency_ref) for cls in (UpgradeCost, ScrapReward)}
+    print(f"{args.count} objects each, including the class objects dict")
+    print(f"Regular ParseObject: {regular / args.count:.1f} bytes/object")
+    for name, compact in results.items():
+        print(f"{name + ':':<20} {compact / args.count:.1f} bytes/object ({(regular - compact) / regular * 100:.1f}% less)")
+
+if __name__ == "__main__":
+    main()
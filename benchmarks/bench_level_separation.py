@@ -0,0 +1,88 @@
+# Benchmarks Module._separate_constants_and_variables against its previous implementation, which compared every key of every level
+# against the first level, then rebuilt each level's variables by checking every key of every level again.
+# Runs over generated level tables shaped like module and ability scalars: 13 levels, a share of the keys varying between levels.
+#
+# Usage: python benchmarks/bench_level_separation.py [--tables N] [--keys N] [--variable-shares 0 0.1 0.5] [--repeats N]
+
+import sys
+import os
+import argparse
+import json
+import random
+import time
+
+os.environ.setdefault('SHOULD_PARSE', 'false')
+os.environ.setdefault('EXPORT_DIR', '/tmp/bench_export')
+os.environ.setdefault('OUTPUT_DIR', '/tmp/bench_output')
+
+src_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+sys.path.insert(0, src_dir)
+sys.path.insert(0, os.path.join(src_dir, 'parse'))
+
+from parsers.module import Module
+
+def previous_separate_constants_and_variables(levels_data):
+    first_level_data = levels_data[0]
+    non_constants = dict()
+    for level in levels_data[1:]:
+        for key, value in level.items():
+            if key in first_level_data and first_level_data[key] != value:
+                non_constants[key] = True
+
+    parsed_levels_variable_stats = []
+    parsed_constant_stats = dict()
+    for i, level in enumerate(levels_data):
+        parsed_level_variable_stats = dict()
+        for key, value in level.items():
+            if i == 0 and key not in non_constants:
+                parsed_constant_stats[key] = value
+            if key in non_constants:
+                parsed_level_variable_stats[key] = level[key]
+        if parsed_level_variable_stats:
+            parsed_levels_variable_stats.append(parsed_level_variable_stats)
+
+    ret = {}
+    if parsed_constant_stats:
+        ret["constants"] = parsed_constant_stats
+    if parsed_levels_variable_stats:
+        ret["variables"] = parsed_levels_variable_stats
+    return ret
+
+def make_tables(rng: random.Random, num_tables: int, num_keys: int, variable_share: float) -> list:
+    tables = []
+    for _ in range(num_tables):
+        variable = [rng.random() < variable_share for _ in range(num_keys)]
+        tables.append([{f"Key{k}": (rng.random() if variable[k] else float(k)) for k in range(num_keys)} for _ in range(13)])
+    return tables
+
+def timed(func, repeats: int) -> float:
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Module._separate_constants_and_variables against its previous implementation")
+    parser.add_argument("--tables", type=int, default=1000, help="Level tables, one per module or ability scalars")
+    parser.add_argument("--keys", type=int, default=30, help="Keys per level")
+    parser.add_argument("--variable-shares", type=float, nargs='+', default=[0.0, 0.1, 0.5], help="Share of the keys that vary between levels")
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    module = Module.__new__(Module)
+    current = lambda tables: [module._separate_constants_and_variables(levels) for levels in tables]
+    previous = lambda tables: [previous_separate_constants_and_variables(levels) for levels in tables]
+
+    print(f"{'variable share':>14} {'previous ms':>12} {'current ms':>12} {'speedup':>8}")
+    for variable_share in args.variable_shares:
+        tables = make_tables(random.Random(24), args.tables, args.keys, variable_share)
+        if json.dumps(current(tables)) != json.dumps(previous(tables)):
+            raise AssertionError(f"Separation differs from the previous implementation with variable share {variable_share}")
+        previous_time = timed(lambda: previous(tables), args.repeats)
+        current_time = timed(lambda: current(tables), args.repeats)
+        print(f"{variable_share:>14} {previous_time * 1000:>12.2f} {current_time * 1000:>12.2f} {previous_time / current_time:>7.2f}x")
+
+if __name__ == "__main__":
+    main()
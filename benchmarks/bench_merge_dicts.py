@@ -0,0 +1,87 @@
+# Benchmarks merge_dicts against its previous implementation, which removed blank values by rescanning the merged result at every level.
+# Merges generated template chains: each layer overrides part of a nested tree, as ability templates and their children do.
+# Times the chain merged pairwise, as the parsers resolve templates recursively, and merged in one merge_dicts() call.
+#
+# Usage: python benchmarks/bench_merge_dicts.py [--layers 2 4 8] [--depths 2 4 6] [--width N] [--repeats N]
+
+import sys
+import os
+import argparse
+import random
+import time
+
+src_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+sys.path.insert(0, src_dir)
+
+from utils import merge_dicts, remove_blank_values
+
+def previous_merge_dicts(base: dict, overlay: dict) -> dict:
+    result = dict(base if base else {})
+    if not overlay:
+        return result
+    for key, value in overlay.items():
+        if value is not None and value != []:
+            base_value = result.get(key)
+            if base_value is not None and type(value) != type(base_value):
+                raise TypeError(f"Type mismatch for key '{key}': {type(value)} vs {type(base_value)}")
+            if isinstance(value, dict) and isinstance(base_value, dict):
+                result[key] = previous_merge_dicts(base_value, value)
+            else:
+                result[key] = value
+    return remove_blank_values(result)
+
+def make_tree(rng: random.Random, depth: int, width: int, override: bool) -> dict:
+    """A nested dict of the given depth. Overriding layers only set some of the keys, some of them to None or [], which are ignored."""
+    tree = {} if override else {"unset_name": "", "unset_tags": {}} # blank values of the root template, removed by the merge
+    for i in range(width):
+        if override and rng.random() < 0.5:
+            continue
+        key = f"key_{i}"
+        if depth > 1 and i % 2 == 0:
+            tree[key] = make_tree(rng, depth - 1, width, override)
+        elif override and rng.random() < 0.2:
+            tree[key] = rng.choice([None, []])
+        else:
+            tree[key] = rng.randint(0, 100)
+    return tree
+
+def make_chain(num_layers: int, depth: int, width: int) -> list:
+    rng = random.Random(num_layers * 100 + depth)
+    return [make_tree(rng, depth, width, override=i > 0) for i in range(num_layers)]
+
+def fold(merge, chain: list) -> dict:
+    result = chain[0]
+    for overlay in chain[1:]:
+        result = merge(result, overlay)
+    return result
+
+def timed(func, repeats: int) -> float:
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark merge_dicts over template chains of increasing length and nesting depth")
+    parser.add_argument("--layers", type=int, nargs='+', default=[2, 4, 8], help="Number of layers in each chain")
+    parser.add_argument("--depths", type=int, nargs='+', default=[2, 4, 6], help="Nesting depth of each layer")
+    parser.add_argument("--width", type=int, default=6, help="Keys per dict")
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'layers':>6} {'depth':>5} {'previous ms':>12} {'pairwise ms':>12} {'one call ms':>12} {'speedup':>8}")
+    for num_layers in args.layers:
+        for depth in args.depths:
+            chain = make_chain(num_layers, depth, args.width)
+            expected = fold(previous_merge_dicts, chain)
+            if fold(merge_dicts, chain) != expected or merge_dicts(*chain) != expected:
+                raise AssertionError(f"merge_dicts differs from the previous implementation on {num_layers} layers of depth {depth}")
+            previous = timed(lambda: fold(previous_merge_dicts, chain), args.repeats)
+            pairwise = timed(lambda: fold(merge_dicts, chain), args.repeats)
+            one_call = timed(lambda: merge_dicts(*chain), args.repeats)
+            print(f"{num_layers:>6} {depth:>5} {previous * 1000:>12.2f} {pairwise * 1000:>12.2f} {one_call * 1000:>12.2f} {previous / one_call:>7.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+# Benchmarks sort_dict and remove_blank_values against their previous recursive implementations,
+# which rebuilt every dict and compared each value against [None, "", [], {}] with ==.
+# Runs over generated object registries shaped like the parsed output: many objects of nested dicts and lists,
+# both unsorted and already sorted (as when an output dict is sorted again), and over one deeply nested dict.
+#
+# Usage: python benchmarks/bench_output_dicts.py [--objects N] [--depth N] [--repeats N]
+
+import sys
+import os
+import argparse
+import random
+import time
+
+src_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+sys.path.insert(0, src_dir)
+
+from utils import sort_dict, remove_blank_values
+
+def previous_sort_dict(d: dict, num_levels: int = -1) -> dict:
+    if not isinstance(d, dict):
+        return d
+    if num_levels == 0:
+        return d
+    num_levels = num_levels if num_levels > 0 else float('inf')
+    sorted_dict = {}
+    for key in sorted(d.keys()):
+        sorted_dict[key] = previous_sort_dict(d[key], num_levels - 1)
+    return sorted_dict
+
+PREVIOUS_EMPTY_VALUES = [None, "", [], {}]
+def previous_remove_blank_values(d: dict) -> dict:
+    if d in PREVIOUS_EMPTY_VALUES:
+        return d
+    if not isinstance(d, dict):
+        return d
+    res = {}
+    for k, v in d.items():
+        if v not in PREVIOUS_EMPTY_VALUES:
+            res_v = previous_remove_blank_values(v)
+            if res_v not in PREVIOUS_EMPTY_VALUES:
+                res[k] = res_v
+    return res
+
+def make_object(rng: random.Random, depth: int) -> dict:
+    """A parsed object: scalar attributes, lists of values and refs, nested dicts, and some blank values"""
+    obj = {}
+    for i in rng.sample(range(40), 12):
+        roll = rng.random()
+        if depth > 0 and roll < 0.25:
+            obj[f"attr_{i}"] = make_object(rng, depth - 1)
+        elif roll < 0.35:
+            obj[f"attr_{i}"] = rng.choice([None, "", [], {}])
+        elif roll < 0.5:
+            obj[f"attr_{i}"] = [{"id": f"OBJID_{rng.randint(0, 999)}"} for _ in range(3)]
+        else:
+            obj[f"attr_{i}"] = rng.choice([rng.randint(0, 1000), rng.random(), f"value_{rng.randint(0, 99)}"])
+    return obj
+
+def make_deep(depth: int) -> dict:
+    root = {}
+    innermost = root
+    for i in range(depth):
+        innermost["z"] = i
+        innermost["blank"] = ""
+        innermost["next"] = {}
+        innermost = innermost["next"]
+    return root
+
+def timed(func, repeats: int) -> float:
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark sort_dict and remove_blank_values against their previous recursive implementations")
+    parser.add_argument("--objects", type=int, default=500, help="Objects in the generated registry")
+    parser.add_argument("--depth", type=int, default=500, help="Nesting depth of the deep dict, below the recursion limit so the previous implementations can run")
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = random.Random(17)
+    registry = {f"Object_{i}": make_object(rng, 3) for i in rng.sample(range(args.objects), args.objects)}
+    sorted_registry = sort_dict(registry)
+    deep = make_deep(args.depth)
+
+    cases = [
+        ("sort_dict unsorted registry", previous_sort_dict, sort_dict, registry),
+        ("sort_dict sorted registry", previous_sort_dict, sort_dict, sorted_registry),
+        ("sort_dict deep", previous_sort_dict, sort_dict, deep),
+        ("remove_blank_values registry", previous_remove_blank_values, remove_blank_values, registry),
+        ("remove_blank_values deep", previous_remove_blank_values, remove_blank_values, deep),
+    ]
+    print(f"{'case':<30} {'previous ms':>12} {'current ms':>12} {'speedup':>8}")
+    for name, previous, current, data in cases:
+        expected = previous(data)
+        result = current(data)
+        if result != expected or (isinstance(expected, dict) and list(result) != list(expected)):
+            raise AssertionError(f"{name}: result differs from the previous implementation")
+        previous_time = timed(lambda: previous(data), args.repeats)
+        current_time = timed(lambda: current(data), args.repeats)
+        print(f"{name:<30} {previous_time * 1000:>12.2f} {current_time * 1000:>12.2f} {previous_time / current_time:>7.2f}x")
+
+if __name__ == "__main__":
+    main()
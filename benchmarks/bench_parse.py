@@ -0,0 +1,75 @@
+# Runs a full parse over a synthetic export (see synthetic_export.py) and reports the wall time, CPU time, peak memory and JSON reads of each phase.
+# The parse runs in a child process, so memory is measured from a fresh interpreter and repeated runs do not share caches.
+# The report is PHASE_PROFILER's, as written to PROFILE_REPORT_FILE, with the scale of the generated export added.
+#
+# Usage: python benchmarks/bench_parse.py [--work-dir DIR] [--reuse-export] [--report-file FILE] [--modules N] [--languages N] [--template-depth N] [...]
+# Any further arguments are passed on to the parse, i.e. --drop-source-data true or --output-workers 1.
+
+import sys
+import os
+import json
+import argparse
+import tempfile
+import subprocess
+
+root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+src_dir = os.path.join(root_dir, 'src')
+sys.path.insert(0, root_dir) # options_schema, found through pyproject.toml in the working dir
+sys.path.insert(0, src_dir)
+
+from synthetic_export import generate_export, add_scale_arguments, scale_kwargs
+
+def run_child(args):
+    """Runs parse.main in this process, with options from args"""
+    from optionsconfig import init_options, ArgumentWriter
+    from options import set_options
+    parser = argparse.ArgumentParser()
+    ArgumentWriter().add_arguments(parser)
+    set_options(init_options(parser.parse_args(args)))
+    from parse.parse import main as parse_main
+    parse_main()
+
+def run_parse(work_dir: str, export_dir: str, output_dir: str, report_file: str, parse_args: list) -> None:
+    command = [sys.executable, os.path.abspath(__file__), "--child",
+               "--should-parse", "true", "--export-dir", export_dir, "--output-dir", output_dir,
+               "--texture-output-dir", os.path.join(work_dir, "textures"),
+               "--profile-report-file", report_file, "--log-level", "WARNING", *parse_args]
+    subprocess.run(command, cwd=root_dir, check=True)
+
+def main():
+    if sys.argv[1:2] == ["--child"]:
+        run_child(sys.argv[2:])
+        return
+
+    parser = argparse.ArgumentParser(description="Benchmark a full parse of a generated synthetic export")
+    parser.add_argument("--work-dir", default=os.path.join(tempfile.gettempdir(), "wrfrontiers_bench"), help="Directory for the export and output")
+    parser.add_argument("--reuse-export", action="store_true", help="Parse the export already in --work-dir instead of generating one")
+    parser.add_argument("--report-file", default=None, help="File to write the report to. Defaults to parse_profile.json in --work-dir")
+    add_scale_arguments(parser)
+    args, parse_args = parser.parse_known_args()
+
+    export_dir = os.path.join(args.work_dir, "export")
+    output_dir = os.path.join(args.work_dir, "output")
+    report_file = args.report_file or os.path.join(args.work_dir, "parse_profile.json")
+    if args.reuse_export and os.path.exists(export_dir):
+        scale = {"reused": True}
+    else:
+        scale = generate_export(export_dir, **scale_kwargs(args))
+
+    run_parse(args.work_dir, export_dir, output_dir, report_file, parse_args)
+
+    with open(report_file, 'r', encoding='utf-8') as f:
+        report = json.load(f)
+    report["export"] = scale
+    report["parse_args"] = parse_args
+    with open(report_file, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=4)
+
+    print(f"{'phase':<28}{'wall s':>9}{'cpu s':>9}{'peak MB':>10}{'json calls':>12}{'json MB':>10}")
+    for phase in report["phases"] + [dict(report["total"], name="total")]:
+        print(f"{phase['name']:<28}{phase['wall_s']:>9.3f}{phase['cpu_s']:>9.3f}{phase['peak_rss_mb']:>10.1f}"
+              f"{phase['json_calls']:>12}{phase['json_bytes_read'] / (1024 * 1024):>10.2f}")
+    print(f"Report written to {report_file}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+# Benchmarks process_key_to_parser_function with its compiled entries cached (as when parsing) against compiling every key on every call,
+# which is equivalent to the previous behaviour of re-interpreting the config map per call.
+# Records every call made while parsing modules (Module, CharacterModule, Ability and what they reference) from EXPORT_DIR, then replays them.
+# Parsers in the recorded maps are replaced by a pass-through of the same shape, so only the dispatch overhead is measured.
+#
+# Usage: python benchmarks/bench_parser_plans.py [--repeats N] [any run.py arguments, i.e. --export-dir]
+
+import sys
+import os
+import argparse
+import time
+from collections import Counter
+
+src_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+sys.path.insert(0, src_dir)
+sys.path.insert(0, os.path.join(src_dir, 'parse'))
+
+from optionsconfig import init_options, ArgumentWriter
+from options import set_options
+
+def _pass_through(value):
+    return value
+
+def _stub_parsers(config):
+    """Same config shape, with any parser callable replaced by _pass_through"""
+    if callable(config):
+        return _pass_through
+    if isinstance(config, tuple) and config and callable(config[0]):
+        return (_pass_through,) + config[1:]
+    if isinstance(config, dict) and callable(config.get('parser')):
+        return {**config, 'parser': _pass_through}
+    return config
+
+def record_calls():
+    import utils
+    import parsers.object
+    import parsers.ability
+    import parsers.character_module
+    from parsers.localization import parse_localizations
+    from parsers.module import parse_modules
+
+    recorded = []
+    original = utils.process_key_to_parser_function
+    def recorder(key_to_parser_function_map, data, obj=None, log_descriptor="", set_attrs=True, default_configuration={}):
+        recorded.append((
+            {key: _stub_parsers(config) for key, config in key_to_parser_function_map.items()},
+            data,
+            obj.__class__ if obj is not None else None,
+            log_descriptor,
+            set_attrs,
+            {key: _stub_parsers(value) for key, value in default_configuration.items()},
+        ))
+        return original(key_to_parser_function_map, data, obj, log_descriptor, set_attrs, default_configuration)
+
+    for module in (parsers.object, parsers.ability, parsers.character_module):
+        module.process_key_to_parser_function = recorder
+    try:
+        parse_localizations()
+        parse_modules()
+    finally:
+        for module in (parsers.object, parsers.ability, parsers.character_module):
+            module.process_key_to_parser_function = original
+    return recorded
+
+def replay(recorded, cold: bool) -> float:
+    import utils
+    from loguru import logger
+
+    logger.disable("utils") # unknown property warnings were already logged while recording
+    start = time.perf_counter()
+    for key_to_parser_function_map, data, obj_class, log_descriptor, set_attrs, default_configuration in recorded:
+        if cold:
+            utils.PARSER_PLAN_CACHE.clear()
+        obj = None
+        if obj_class is not None:
+            obj = obj_class.__new__(obj_class)
+            obj.id = "benchmark"
+        utils.process_key_to_parser_function(key_to_parser_function_map, data, obj, log_descriptor, set_attrs, default_configuration)
+    elapsed = time.perf_counter() - start
+    logger.enable("utils")
+    return elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark compiled parser plans of process_key_to_parser_function")
+    parser.add_argument("--repeats", type=int, default=5)
+    ArgumentWriter().add_arguments(parser)
+    args = parser.parse_args()
+    set_options(init_options(args))
+
+    recorded = record_calls()
+    classes = Counter(obj_class.__name__ if obj_class is not None else "<no obj>" for _, _, obj_class, _, _, _ in recorded)
+    num_keys = sum(len(data) for _, data, _, _, _, _ in recorded)
+    print(f"Recorded {len(recorded)} calls over {num_keys} keys: {dict(classes.most_common())}")
+
+    cold = min(replay(recorded, cold=True) for _ in range(args.repeats))
+    replay(recorded, cold=False) # warm the cache
+    warm = min(replay(recorded, cold=False) for _ in range(args.repeats))
+    print(f"Compiled per call: {cold * 1000:.1f} ms ({cold / len(recorded) * 1e6:.2f} us/call)")
+    print(f"Cached plans:      {warm * 1000:.1f} ms ({warm / len(recorded) * 1e6:.2f} us/call)")
+    print(f"Speedup:           {cold / warm:.2f}x")
+
+if __name__ == "__main__":
+    main()
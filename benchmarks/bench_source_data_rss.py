@@ -0,0 +1,87 @@
+# Measures the peak RSS of a full parse with DROP_SOURCE_DATA off and on.
+# Each parse runs in its own child process, so each peak is measured from a fresh interpreter.
+# The output dirs of both runs are compared afterwards, to confirm dropping source_data does not change the output.
+#
+# Usage, from the repo root: python benchmarks/bench_source_data_rss.py [any run.py arguments, i.e. --export-dir --output-dir]
+# Linux/macOS only (os.wait4). The output dir of each run is OUTPUT_DIR suffixed with _keep or _drop.
+
+import sys
+import os
+import argparse
+import filecmp
+import subprocess
+
+root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+src_dir = os.path.join(root_dir, 'src')
+sys.path.insert(0, root_dir) # options_schema, found through pyproject.toml in the working dir
+sys.path.insert(0, src_dir)
+
+from optionsconfig import init_options, ArgumentWriter
+from options import set_options
+
+def run_child(args):
+    """Runs parse.main in this process, with options from args"""
+    parser = argparse.ArgumentParser()
+    ArgumentWriter().add_arguments(parser)
+    set_options(init_options(parser.parse_args(args)))
+    from parse.parse import main as parse_main
+    parse_main()
+
+def measure(args, drop_source_data: bool, output_dir: str) -> int:
+    """Returns the peak RSS in MB of a child process parsing with the given args"""
+    command = [sys.executable, os.path.abspath(__file__), "--child", *args,
+               "--should-parse", "true", "--drop-source-data", str(drop_source_data).lower(), "--output-dir", output_dir]
+    process = subprocess.Popen(command, cwd=root_dir, stdout=subprocess.DEVNULL)
+    _, status, rusage = os.wait4(process.pid, 0)
+    if os.waitstatus_to_exitcode(status) != 0:
+        raise RuntimeError(f"Parse exited with status {os.waitstatus_to_exitcode(status)}: {' '.join(command)}")
+    # ru_maxrss is in KB on Linux, bytes on macOS
+    return rusage.ru_maxrss / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+def diff_dirs(left: str, right: str) -> list:
+    """Returns the relative paths of files that differ or only exist in one of left and right"""
+    comparison = filecmp.dircmp(left, right)
+    differences = comparison.left_only + comparison.right_only
+    _, mismatch, errors = filecmp.cmpfiles(left, right, comparison.common_files, shallow=False)
+    differences += mismatch + errors
+    for sub_dir in comparison.common_dirs:
+        differences += [os.path.join(sub_dir, path) for path in diff_dirs(os.path.join(left, sub_dir), os.path.join(right, sub_dir))]
+    return differences
+
+def main():
+    if sys.argv[1:2] == ["--child"]:
+        run_child(sys.argv[2:])
+        return
+
+    # Only the output dir is needed here, the options are validated by each child
+    parser = argparse.ArgumentParser(description="Benchmark the peak RSS of a full parse with and without DROP_SOURCE_DATA")
+    parser.add_argument("--output-dir", required=True)
+    args, _ = parser.parse_known_args()
+    # Forward every argument except the ones this benchmark sets itself
+    forwarded = []
+    argv = sys.argv[1:]
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        i += 1
+        if arg.split('=')[0] in ("--should-parse", "--drop-source-data", "--output-dir"):
+            if '=' not in arg and i < len(argv) and not argv[i].startswith("--"):
+                i += 1 # and its value
+            continue
+        forwarded.append(arg)
+
+    output_dir = args.output_dir.rstrip('/\\')
+    keep = measure(forwarded, False, output_dir + "_keep")
+    drop = measure(forwarded, True, output_dir + "_drop")
+    print(f"Peak RSS keeping source_data:  {keep:.1f} MB")
+    print(f"Peak RSS dropping source_data: {drop:.1f} MB")
+    print(f"Reduction:                     {keep - drop:.1f} MB ({(keep - drop) / keep * 100:.1f}%)")
+
+    differences = diff_dirs(output_dir + "_keep", output_dir + "_drop")
+    if differences:
+        print(f"Output differs in {len(differences)} files, i.e. {differences[:5]}")
+        sys.exit(1)
+    print("Output is identical")
+
+if __name__ == "__main__":
+    main()
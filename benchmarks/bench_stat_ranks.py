@@ -0,0 +1,88 @@
+# Benchmarks StatRankTable against the previous stat ranking of Analysis, which rescanned every module's level diffs for each stat,
+# then rescanned every stat's ranks for each module to build the percentiles.
+# Runs over generated level diffs of increasing module and stat counts.
+#
+# Usage: python benchmarks/bench_stat_ranks.py [--modules 250 1000 4000] [--stats N] [--repeats N]
+
+import sys
+import os
+import argparse
+import random
+import time
+
+parse_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src', 'parse')
+sys.path.insert(0, parse_dir)
+
+from stat_rank_table import StatRankTable
+
+def previous_ranks(level_diffs_by_module, more_is_better_by_stat):
+    stat_ranks = {key: {} for key in more_is_better_by_stat}
+    for stat_key in stat_ranks:
+        module_increases = []
+        for module_id, module_diff_data in level_diffs_by_module.items():
+            percent_increase = module_diff_data['stats_percent_increase'].get(stat_key)
+            if percent_increase is not None:
+                module_increases.append((module_id, percent_increase))
+        module_increases.sort(key=lambda x: (float('-inf') if isinstance(x[1], str) else x[1]), reverse=not more_is_better_by_stat[stat_key])
+        for rank, (module_id, _) in enumerate(module_increases[::-1]):
+            stat_ranks[stat_key][module_id] = rank
+
+    per_module_ranks = {}
+    for module_id in level_diffs_by_module:
+        my_module_ranks = {
+            stat: stat_ranks[stat].get(module_id, 0) / len(stat_ranks[stat]) if stat in stat_ranks and len(stat_ranks[stat]) > 0 else 0
+            for stat in stat_ranks if module_id in stat_ranks[stat]
+        }
+        per_module_ranks[module_id] = dict(sorted(my_module_ranks.items()))
+
+    level_diffs_by_stat = {
+        stat_key: {module_id: level_diffs_by_module[module_id]['stats_percent_increase'][stat_key] for module_id in stat_rank}
+        for stat_key, stat_rank in stat_ranks.items()
+    }
+    return per_module_ranks, level_diffs_by_stat
+
+def current_ranks(level_diffs_by_module, more_is_better_by_stat):
+    table = StatRankTable(level_diffs_by_module, more_is_better_by_stat)
+    return table.percentiles_by_module(), table.level_diffs_by_stat()
+
+def make_level_diffs(rng: random.Random, num_modules: int, num_stats: int) -> dict:
+    """Each module has a few stats of its category, as weapons, shoulders and torsos do"""
+    stat_keys = [f"Stat{i:03}" for i in range(num_stats)]
+    level_diffs_by_module = {}
+    for i in range(num_modules):
+        category_stats = stat_keys[(i % 10) * num_stats // 10:((i % 10) + 1) * num_stats // 10]
+        increases = {key: rng.choice([round(rng.uniform(-1, 3), 2), "+5.0"]) if rng.random() < 0.05 else round(rng.uniform(-1, 3), 2)
+                     for key in sorted(rng.sample(category_stats, min(len(category_stats), 8)))}
+        level_diffs_by_module[f"OBJID_Module::DA_Module_{i:05}"] = {'stats_percent_increase': increases}
+    return level_diffs_by_module
+
+def timed(func, repeats: int) -> float:
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark StatRankTable against the previous stat ranking")
+    parser.add_argument("--modules", type=int, nargs='+', default=[250, 1000, 4000], help="Modules with level diffs")
+    parser.add_argument("--stats", type=int, default=200, help="Distinct stats to rank")
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'modules':>7} {'previous ms':>12} {'current ms':>12} {'speedup':>8}")
+    for num_modules in args.modules:
+        rng = random.Random(num_modules)
+        level_diffs_by_module = make_level_diffs(rng, num_modules, args.stats)
+        more_is_better_by_stat = {f"Stat{i:03}": rng.random() < 0.8 for i in range(args.stats)}
+        expected = previous_ranks(level_diffs_by_module, more_is_better_by_stat)
+        previous_time = timed(lambda: previous_ranks(level_diffs_by_module, more_is_better_by_stat), args.repeats)
+        result = current_ranks(level_diffs_by_module, more_is_better_by_stat)
+        if result != expected or [list(d) for d in result[1].values()] != [list(d) for d in expected[1].values()]:
+            raise AssertionError(f"Ranks differ from the previous implementation on {num_modules} modules")
+        current_time = timed(lambda: current_ranks(level_diffs_by_module, more_is_better_by_stat), args.repeats)
+        print(f"{num_modules:>7} {previous_time * 1000:>12.2f} {current_time * 1000:>12.2f} {previous_time / current_time:>7.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,496 @@
+# Generates a synthetic export with the structure of WRFrontiers/Content, so parse.main can be run and measured without a real export.
+# Covers what a full parse reads: DA_Meta_Root with bot presets, factory presets and game modes, DA_Module_* files with their
+# character modules, module scalers and levels, abilities with Template chains, pilots with talents, powerups, the progression table
+# and localization tables for each language. Values are deterministic for a given scale.
+#
+# Usage: python benchmarks/synthetic_export.py <export_dir> [--modules N] [--languages N] [--template-depth N] [--presets N] [--pilots N]
+
+import os
+import sys
+import json
+import shutil
+import argparse
+
+GAME_NAME = "WRFrontiers"
+CONTENT_DIR = f"{GAME_NAME}/Content"
+
+# Paths that parsers join onto EXPORT_DIR with Windows separators. Elsewhere they are a single file name containing backslashes,
+# so each is also linked under that literal name. See link_windows_roots().
+WINDOWS_ROOTS = [
+    "Localization/Game",
+    "Sparrow/Mechanics/DA_Meta_Root.json",
+    "Sparrow/Mechanics/Meta/Entities/Modules",
+    "Sparrow/Pilots/PilotsDataAssets",
+    "Sparrow/Mechanics/Powerups",
+]
+
+RARITIES = ["Common", "Uncommon", "Rare", "Epic"]
+CURRENCIES = ["DA_Meta_Currency_Alloys", "DA_Meta_Currency_Intel"]
+# Levels upgraded with Intel rather than Alloys, as in analysis.DISCOUNT_COST_MAP
+INTEL_UPGRADE_LEVELS = (3, 5, 9, 13)
+
+# (module type, module category, has a weapon character module, has an ability), named as in parsers/module_group.py and analysis.py
+MODULE_KINDS = [
+    ("Chassis", "Chassis", False, False),
+    ("Torso", "Torso", False, True),
+    ("Shoulder", "Shoulder", False, False),
+    ("Weapon", "Weapon", True, False),
+    ("WeaponHeavy", "Weapon", True, False),
+    ("Ability2", "Ability", False, True),
+    ("TitanWeapon", "Weapon", True, False),
+]
+
+# Stat keys in the module levels of each module category
+CATEGORY_STATS = {
+    "Chassis": ["Armor"],
+    "Torso": ["Armor", "ShieldAmount"],
+    "Shoulder": ["ShieldAmount", "ShieldRegeneration", "ShieldDelayReduction"],
+    "Weapon": ["DamageArmor", "DamageNoArmor", "TimeToReload"],
+    "Ability": ["Cooldown"],
+}
+
+# Stat key in module levels: (ModuleStat asset name, MoreIsBetter), named as mapped in parsers/stat_maps.py
+MODULE_STATS = {
+    "Armor": ("Armor", True),
+    "Cooldown": ("Cooldown", False),
+    "ShieldAmount": ("ShieldAmount", True),
+    "ShieldRegeneration": ("ShieldRegeneration", True),
+    "ShieldDelayReduction": ("ShieldDelayReduction", True),
+    "DamageArmor": ("ArmorDamage", True),
+    "DamageNoArmor": ("ShieldDamage", True),
+    "TimeToReload": ("ReloadingTime", False),
+    "Duration": ("Duration", True),
+}
+
+def color(seed: int) -> dict:
+    r, g, b = (seed * 37) % 256, (seed * 73) % 256, (seed * 151) % 256
+    return {"R": r, "G": g, "B": b, "A": 255, "Hex": f"{r:02X}{g:02X}{b:02X}FF"}
+
+class SyntheticExport:
+    def __init__(self, export_dir: str, languages: int):
+        self.export_dir = export_dir
+        self.languages = ["en"] + [f"l{i}" for i in range(1, languages)]
+        self.strings = dict() # {table_namespace: {key: english}}
+
+    # Files and assets
+
+    def write(self, relative_path: str, data) -> None:
+        """Writes data to CONTENT_DIR/relative_path.json"""
+        file_path = os.path.join(self.export_dir, *CONTENT_DIR.split('/'), *relative_path.split('/')) + ".json"
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+
+    @staticmethod
+    def asset(relative_path: str, index: int | None = None) -> dict:
+        """ObjectPath to CONTENT_DIR/relative_path.json, at index if given, else at 0"""
+        name = relative_path.split('/')[-1]
+        return {"ObjectName": f"Class'{name}'", "ObjectPath": f"/Game/{relative_path}.{name if index is None else index}"}
+
+    @staticmethod
+    def image(relative_path: str) -> dict:
+        name = relative_path.split('/')[-1]
+        return {"AssetPathName": f"/Game/{relative_path}.{name}", "SubPathString": ""}
+
+    def text(self, table: str, key: str, english: str) -> dict:
+        """Localized text in string table ST_<table>, registered so every language's localization contains it"""
+        self.strings.setdefault(table, dict())[key] = english
+        return {"TableId": f"/Game/Localization/StringTables/ST_{table}.ST_{table}", "Key": key, "SourceString": english}
+
+    def write_bp(self, relative_path: str, properties: dict, template: dict | None = None) -> dict:
+        """Writes a blueprint with its class default object at index 1, and returns the asset of the blueprint"""
+        name = relative_path.split('/')[-1]
+        cdo = {"Type": f"{name}_C", "Name": f"Default__{name}_C", "Class": f"UScriptClass'{name}_C'", "Properties": properties}
+        if template is not None:
+            cdo["Template"] = template
+        self.write(relative_path, [
+            {"Type": "BlueprintGeneratedClass", "Name": f"{name}_C", "ClassDefaultObject": self.asset(relative_path, 1)},
+            cdo,
+        ])
+        return self.asset(relative_path, 0)
+
+    def write_data_asset(self, relative_path: str, properties: dict, asset_type: str = "PrimaryDataAsset") -> dict:
+        name = relative_path.split('/')[-1]
+        self.write(relative_path, [{"Type": asset_type, "Name": name, "Properties": properties}])
+        return self.asset(relative_path)
+
+    # Shared objects
+
+    def write_shared(self):
+        for table in ["Modules", "Abilities", "Pilots", "Meta", "Component_Tags"]:
+            self.write(f"Localization/StringTables/ST_{table}", [{"Type": "StringTable", "Name": f"ST_{table}", "StringTable": {"TableNamespace": table}}])
+
+        self.rarities = dict()
+        for i, rarity in enumerate(RARITIES):
+            rarity_asset = self.write_data_asset(f"Sparrow/Mechanics/Meta/Rarity/DA_Rarity_{rarity}", {
+                "RarityInfo": {"Name": self.text("Meta", f"Rarity_{rarity}", rarity), "RarityColor": color(i)},
+            })
+            self.rarities[rarity] = self.write_data_asset(f"Sparrow/Mechanics/Meta/Rarity/DA_ModuleRarity_{rarity}", {
+                "SortOrder": i, "RarityDataAsset": rarity_asset,
+            })
+
+        for currency in CURRENCIES:
+            self.write_data_asset(f"Sparrow/Mechanics/Meta/Currencies/{currency}", {
+                "HumanName": self.text("Meta", currency, currency.split('_')[-1]),
+                "WalletIcon": self.image(f"Sparrow/UI/Icons/Currency/T_{currency}"),
+                "ID": currency,
+            })
+
+        self.faction = self.write_data_asset("Sparrow/Mechanics/Meta/Factions/DA_Faction_Synthetic", {
+            "Name": self.text("Meta", "Faction_Synthetic", "Synthetic Industries"),
+            "Image": self.image("Sparrow/UI/Icons/Factions/T_Faction_Synthetic"),
+            "Color": color(7),
+        })
+        character_class = self.write_data_asset("Sparrow/Mechanics/Meta/Classes/DA_CharacterClass_Assault", {
+            "Name": self.text("Meta", "Class_Assault", "Assault"),
+            "Description": self.text("Meta", "Class_Assault_Desc", "Deals damage up close."),
+            "ImageSmall": self.image("Sparrow/UI/Icons/Classes/T_Class_Assault_Small"),
+        })
+        self.module_class = self.write_data_asset("Sparrow/Mechanics/Meta/Classes/DA_ModuleClass_Assault", {
+            "CharacterClassDataAsset": character_class,
+        })
+        self.module_tags = [self.write_data_asset(f"Sparrow/Mechanics/Meta/Tags/DA_ModuleTag_{tag}", {
+            "HumanName": self.text("Modules", f"Tag_{tag}", tag),
+            "TextColor": color(i),
+            "BackgroundColor": color(i + 1),
+        }) for i, tag in enumerate(["Kinetic", "Energy", "Explosive"])]
+
+        self.module_stats = {stat_key: self.write_data_asset(f"Sparrow/Mechanics/Meta/Stats/DA_ModuleStat_{stat_name}", {
+            "StatName": self.text("Modules", f"Stat_{stat_name}", stat_name),
+            "ParamKey": stat_name,
+            "UnitScaler": 1.0,
+            "MoreIsBetter": more_is_better,
+            "NumFractionDigits": 1,
+        }) for stat_key, (stat_name, more_is_better) in MODULE_STATS.items()}
+        self.module_stats_table = self.write_data_asset("Sparrow/Mechanics/Meta/Stats/DA_ModuleStatsTable", {
+            "AllModuleStats": {param_key: asset for param_key, asset in self.module_stats.items()},
+        })
+
+        categories = {category: self.write_data_asset(f"Sparrow/Mechanics/Meta/Categories/DA_ModuleCategory_{category}", {
+            "HumanName": self.text("Modules", f"DA_ModuleCategory_{category}", category),
+            "SortOrder": i,
+            "UIStats": [self.module_stats[stats[0]]],
+        }) for i, (category, stats) in enumerate(CATEGORY_STATS.items())}
+        self.module_types = dict()
+        self.socket_types = dict()
+        for i, (type_name, category, _, _) in enumerate(MODULE_KINDS):
+            self.module_types[type_name] = self.write_data_asset(f"Sparrow/Mechanics/Meta/Types/DA_ModuleType_{type_name}", {
+                "Category": categories[category],
+                "HumanName": self.text("Component_Tags", f"Type_{type_name}", type_name),
+                "TagColor": color(i),
+                "IsRootModule": type_name == "Chassis",
+                "CharacterType": "ESCharacterType::Mech",
+            })
+            # One socket type per module type, so exclusive socket matching has a unique solution
+            self.socket_types[type_name] = self.write_data_asset(f"Sparrow/Mechanics/Meta/Sockets/DA_ModuleSocketType_{type_name}", {
+                "HumanName": self.text("Component_Tags", f"Socket_{type_name}", type_name),
+                "CompatibleModules": [self.module_types[type_name]],
+                "Required": type_name in ("Chassis", "Torso"),
+            })
+
+        self.movement_type = self.write_data_asset("Sparrow/Mechanics/Meta/Movement/DA_MovementType_Legs", {
+            "MaxMobility": 100,
+            "ChassisType": "ESChassisType::Legs",
+        })
+
+    # Abilities
+
+    def write_ability_templates(self, template_depth: int, num_chains: int = 4):
+        """Ability templates, num_chains chains of template_depth templates each. Returns the last template of each chain."""
+        self.ability_template_chains = []
+        for chain in range(num_chains):
+            template = None
+            for depth in range(template_depth):
+                path = f"Sparrow/Mechanics/Abilities/Templates/BP_AbilityTemplate_{chain}_{depth}"
+                self.write_bp(path, {
+                    "Cooldown": 10.0 + depth,
+                    "CooldownPolicy": "ESAbilityCooldownPolicy::AfterDeactivation",
+                    "CastDuration": 0.5 * depth,
+                    "ActivationChargePoints": 100 * (depth + 1),
+                    "TargetingType": "ESAbilityTargetingType::Self",
+                    "bDeactivateIfOwnerDie": depth % 2 == 0,
+                }, template=template)
+                template = self.asset(path, 1)
+            self.ability_template_chains.append(template)
+
+    def write_ability(self, name: str, seed: int) -> dict:
+        return self.write_bp(f"Sparrow/Mechanics/Abilities/{name}/BP_Ability_{name}", {
+            "Name": self.text("Abilities", f"Ability_{name}_Name", f"Ability {name}"),
+            "Description": self.text("Abilities", f"Ability_{name}_Desc", f"Boosts {{PrimaryParameter}} for {{SecondaryParameter}} seconds ({name})."),
+            "PrimaryParameter": 1.0 + seed % 5,
+            "SecondaryParameter": 2.0 + seed % 3,
+            "Cooldown": 12.0 + seed % 7,
+            "Icon": self.image(f"Sparrow/UI/Icons/Abilities/T_Ability_{name}"),
+        }, template=self.ability_template_chains[seed % len(self.ability_template_chains)])
+
+    # Modules
+
+    def write_scaler(self, path: str, rarity_index: int, num_levels: int, stats: list, seed: int, primary: str | None = None, secondary: str | None = None) -> dict:
+        levels = []
+        for level in range(1, num_levels + 1):
+            level_data = {
+                "Level": level,
+                "UpgradeCurrency": "DA_Meta_Currency_Intel" if level in INTEL_UPGRADE_LEVELS else "DA_Meta_Currency_Alloys",
+                "UpgradeCost": 0 if level == 1 else 1000 * (rarity_index + 1) * level,
+                "FirstScrapRewardAmount": 300 * (rarity_index + 1) * level,
+                "FirstScrapRewardCurrency": CURRENCIES[0],
+                "SecondScrapRewardAmount": 2 * level,
+                "SecondScrapRewardCurrency": CURRENCIES[1],
+                "Health": 10 * level, # flavor stat, dropped by the parser
+            }
+            for i, stat in enumerate(stats):
+                level_data[stat] = round(100.0 * (1 + seed % 11) * (1 + 0.1 * level) + i, 2)
+            if primary is not None:
+                level_data["PrimaryParameter"] = round(1.0 + 0.25 * level + seed % 3, 2)
+            if secondary is not None:
+                level_data["SecondaryParameter"] = 5.0
+            levels.append(level_data)
+        properties = {"LevelsData": levels, "DefaultArmor": 100.0 + seed, "ModuleName": f"Module{seed}"}
+        if primary is not None:
+            properties["PrimaryStatMetaInformation"] = self.module_stats[primary]
+        if secondary is not None:
+            properties["SecondaryStatMetaInformation"] = self.module_stats[secondary]
+        return self.write_data_asset(path, properties, asset_type="SModuleScaler")
+
+    def write_character_module(self, name: str, seed: int, weapon: bool, ability: dict | None) -> dict:
+        path = f"Sparrow/Mechanics/Meta/Entities/CharacterModules/BP_{name}"
+        properties = {
+            "ModuleLevel": 1 + seed % 17,
+            "TorsoSocket": "Torso",
+        }
+        if name.startswith("Chassis"):
+            properties["MovementType"] = self.movement_type
+        if ability is not None:
+            properties["Abilities"] = [ability]
+        if weapon:
+            firing_behavior = self.write_data_asset(f"{path}_FiringBehavior", {
+                "TimeBetweenShots": 0.1 + (seed % 5) / 10,
+                "Spread": 1.5,
+                "ProjectilesPerShot": 1 + seed % 3,
+                "DirectDamage": 50.0 + seed,
+            }, asset_type="SFiringBehavior")
+            properties["FireModes"] = [self.write_data_asset(f"{path}_FireMode", {
+                "FiringBehavior": firing_behavior,
+                "SwitchingType": "ESFireModeSwitchingType::Auto",
+            }, asset_type="SFireMode")]
+            properties["ModuleScaler"] = self.write_data_asset(f"{path}_Scaler", {
+                "DefaultClipSize": 20 + seed % 10,
+                "DefaultTimeToReload": 2.5,
+                "DefaultDirectDamage": 50.0 + seed,
+            }, asset_type="SModuleScaler")
+            properties["ReloadType"] = "ESWeaponReloadType::Clip"
+        # The blueprint's class default object is referenced by the module, not the blueprint itself
+        self.write_bp(path, properties)
+        return {"ObjectPath": f"/Game/{path}.0"}
+
+    def write_module(self, index: int, levels: int):
+        type_name, category, weapon, has_ability = MODULE_KINDS[index % len(MODULE_KINDS)]
+        ready = index % 10 != 0
+        name = f"{type_name}{index:05d}"
+        rarity_index = index % len(RARITIES)
+        rarity = RARITIES[rarity_index]
+        module_path = f"Sparrow/Mechanics/Meta/Entities/Modules/DA_Module_{name}"
+
+        ability = self.write_ability(name, index) if has_ability else None
+        character_module = self.write_character_module(name, index, weapon, ability)
+        module_scaler = self.write_scaler(f"Sparrow/Mechanics/Meta/Entities/ModuleScalers/DA_ModuleScaler_{name}", rarity_index, levels, CATEGORY_STATS[category], index)
+        properties = {
+            "ProductionStatus": "ESProductionStatus::Ready" if ready else "ESProductionStatus::InDevelopment",
+            "InventoryIcon": self.image(f"Sparrow/UI/Icons/Modules/T_Module_{name}"),
+            "ModuleRarity": self.rarities[rarity],
+            "CharacterModules": [{"Key": "ESCharacterModuleMountWay::Default", "Value": character_module}],
+            "ModuleTags": [self.module_tags[index % len(self.module_tags)]],
+            "ModuleScaler": module_scaler,
+            "Title": self.text("Modules", f"Module_{name}_Title", f"{type_name} {index}"),
+            "Description": self.text("Modules", f"Module_{name}_Desc", f"A synthetic {type_name.lower()} module."),
+            "TextTags": [self.text("Modules", f"Tag_{category}", category)],
+            "Faction": self.faction,
+            "ModuleClasses": [self.module_class],
+            "ModuleStatsTable": self.module_stats_table,
+            "ModuleType": self.module_types[type_name],
+            "Sockets": [{"Type": self.socket_types[kind[0]]} for kind in MODULE_KINDS if kind[0] in ("Shoulder", "Weapon")] if type_name == "Torso" else [],
+            "Levels": [],
+            "ID": name,
+        }
+        if has_ability:
+            properties["AbilityScalers"] = [self.write_scaler(f"Sparrow/Mechanics/Meta/Entities/ModuleScalers/DA_AbilityScaler_{name}", rarity_index, levels, [], index, primary="Duration", secondary="Cooldown")]
+
+        # Like the real files, the module data asset is not the first element
+        self.write(module_path, [
+            {"Type": "BlueprintGeneratedClass", "Name": f"DA_Module_{name}_C"},
+            {"Type": "SCharacterModuleDataAsset", "Name": f"DA_Module_{name}", "Properties": properties},
+        ])
+        return type_name, {"ObjectPath": f"/Game/{module_path}.1"}, ready
+
+    # Presets, pilots and the meta root
+
+    def write_pilots(self, num_pilots: int):
+        talent_type = self.write_data_asset("Sparrow/Pilots/TalentTypes/DA_PilotTalentType_Offense", {
+            "Name": self.text("Pilots", "TalentType_Offense", "Offense"),
+        })
+        talents = [self.write_data_asset(f"Sparrow/Pilots/Talents/DA_PilotTalent_{i}", {
+            "Name": self.text("Pilots", f"Talent_{i}_Name", f"Talent {i}"),
+            "Description": self.text("Pilots", f"Talent_{i}_Desc", f"Improves something by {i}%."),
+            "Image": self.image(f"Sparrow/UI/Icons/Talents/T_Talent_{i}"),
+        }) for i in range(10)]
+        self.pilots = []
+        for i in range(num_pilots):
+            levels = []
+            for level in range(5):
+                levels.append(self.write_data_asset(f"Sparrow/Pilots/Levels/DA_PilotLevel_{i}_{level}", {
+                    "TalentType": talent_type,
+                    "CurrencyCost": {"Currency": None, "Amount": 0},
+                    # Each talent belongs to one level, across all pilots
+                    "Talents": [talents[2 * level + (i % 2)], talents[2 * level + 1 - (i % 2)]],
+                }))
+            path = f"Sparrow/Pilots/PilotsDataAssets/{'CommonPilots/' if i % 2 else ''}DA_Pilot_{i}"
+            self.pilots.append(self.write_data_asset(path, {
+                "FirstName": self.text("Pilots", f"Pilot_{i}_FirstName", f"Pilot{i}"),
+                "SecondName": {"CultureInvariantString": " "},
+                "Faction": self.faction,
+                "Levels": levels,
+            }))
+        os.makedirs(os.path.join(self.export_dir, *CONTENT_DIR.split('/'), "Sparrow", "Pilots", "PilotsDataAssets", "CommonPilots"), exist_ok=True)
+
+    def write_preset(self, name: str, modules_by_type: dict, seed: int, titan: bool = False) -> dict:
+        def pick(type_name, offset=0):
+            candidates = modules_by_type.get(type_name, [])
+            return candidates[(seed + offset) % len(candidates)] if candidates else None
+
+        entries = []
+        def add(type_name, socket, parent_index, offset=0):
+            module = pick(type_name, offset)
+            if module is not None:
+                entries.append({"Module": module, "ParentSocket": socket, "ParentModuleIndex": parent_index, "Level": 1 + seed % 13})
+        add("Chassis", "None", -1)
+        add("Torso", "Torso", 0)
+        add("Shoulder", "Shoulder_L", 1)
+        add("Shoulder", "Shoulder_R", 1, offset=seed % 2)
+        add("TitanWeapon" if titan else "Weapon", "Weapon_L", 1)
+        add("WeaponHeavy", "Weapon_R", 1)
+        add("Ability2", "Ability", 1)
+        properties = {
+            "Name": self.text("Meta", f"Preset_{name}", f"Preset {name}"),
+            "Icon": self.image(f"Sparrow/UI/Icons/Presets/T_Preset_{name}"),
+            "CharacterType": "ESCharacterType::Titan" if titan else "ESCharacterType::Mech",
+            "Modules": entries,
+        }
+        if self.pilots:
+            properties["Pilot"] = {"PilotAsset": self.pilots[seed % len(self.pilots)], "Level": 1 + seed % 5}
+        return self.write_data_asset(f"Sparrow/Mechanics/Presets/DA_CharacterPreset_{name}", properties)
+
+    def write_meta_root(self, modules_by_type: dict, num_presets: int):
+        factory_presets = [self.write_preset(f"Factory{i}", modules_by_type, i) for i in range(num_presets)]
+        default_presets = self.write_data_asset("Sparrow/Mechanics/Presets/DA_DefaultPresets", {"Presets": factory_presets})
+
+        by_level = []
+        by_league = []
+        for i in range(max(1, num_presets // 2)):
+            drop_team = self.write_data_asset(f"Sparrow/Mechanics/Bots/DA_DropTeam_{i}", {
+                "Characters": [self.write_preset(f"Bot{i}_{j}", modules_by_type, i + j, titan=j == 0) for j in range(3)],
+            })
+            bot_preset = self.write_data_asset(f"Sparrow/Mechanics/Bots/DA_BotAIPreset_{i}", {
+                "Preset": {"SkillRate": 0.5 + i % 5 / 10, "LevelInterval": {"Min": i, "Max": i + 2}, "DropTeams": [drop_team]},
+            })
+            by_level.append({"Key": i + 1, "Value": bot_preset})
+            league_path = f"Sparrow/Mechanics/Leagues/DA_League_{i}"
+            self.write_data_asset(league_path, {"LeagueName": self.text("Meta", f"League_{i}", f"League {i}"), "LeagueId": i})
+            by_league.append({"Key": self.asset(league_path)["ObjectPath"], "Value": bot_preset})
+
+        hangar = self.write_data_asset("Sparrow/Mechanics/GameModes/DA_GameMode_Hangar", {"ID": "Hangar"})
+        self.write_data_asset("Sparrow/Mechanics/DA_Meta_Root", {
+            "GameModes": [hangar], # without a DisplayName, so not parsed as a playable game mode
+            "DedicatedBotPresets": {"BotPresetsByLevel": by_level, "BotPresetByLeague": by_league},
+            "DefaultPresets": default_presets,
+        }, asset_type="SMetaRootDataAsset")
+
+    def write_progression_table(self, modules: list):
+        levels = []
+        for i in range(20):
+            reward = {
+                "ReputationPoints": 0,
+                "Currencies": [{"Currency": self.asset(f"Sparrow/Mechanics/Meta/Currencies/{CURRENCIES[i % 2]}"), "Amount": 100 * (i + 1)}],
+                "Blueprints": [modules[i % len(modules)]] if modules else [],
+                "Characters": [],
+                "Premium": [],
+            }
+            levels.append({"ReputationCost": 1000 * (i + 1), "Reward": reward})
+        self.write_data_asset("Sparrow/Mechanics/DA_ProgressionTable", {"Levels": levels, "ID": "ProgressionTable"})
+
+    def write_powerups(self):
+        for group, powerup in [("Personal", "DoubleDamage"), ("Teams", "RegenArmor")]:
+            path = f"Sparrow/Mechanics/Powerups/{group}/{powerup}/BP_PowerUp_{powerup}"
+            self.write_bp(path, {
+                "BuffDuration": 15.0,
+                "Score": 10,
+                "MinimapIcon": self.image(f"Sparrow/UI/Icons/Powerups/T_PowerUp_{powerup}"),
+            })
+
+    def write_localizations(self):
+        for lang_code in self.languages:
+            tables = {table: {key: english if lang_code == "en" else f"[{lang_code}] {english}" for key, english in strings.items()}
+                      for table, strings in sorted(self.strings.items())}
+            self.write(f"Localization/Game/{lang_code}/Game", tables)
+
+    def link_windows_roots(self):
+        """Links each of WINDOWS_ROOTS under its literal Windows path, i.e. a file named 'WRFrontiers\\Content\\Localization\\Game'"""
+        if os.sep == '\\':
+            return
+        for root in WINDOWS_ROOTS:
+            target = os.path.join(self.export_dir, *CONTENT_DIR.split('/'), *root.split('/'))
+            link = os.path.join(self.export_dir, f"{CONTENT_DIR}/{root}".replace('/', '\\'))
+            if not os.path.lexists(link):
+                os.symlink(target, link)
+
+def generate_export(export_dir: str, modules: int = 200, languages: int = 3, template_depth: int = 3, presets: int = 10, pilots: int = 6, levels: int = 13) -> dict:
+    """
+    Writes a synthetic export to export_dir, replacing any previous one.
+    Returns a summary of the generated tree.
+    """
+    if os.path.exists(export_dir):
+        shutil.rmtree(export_dir)
+    os.makedirs(export_dir)
+    export = SyntheticExport(export_dir, languages)
+    export.write_shared()
+    export.write_ability_templates(template_depth)
+
+    modules_by_type = dict()
+    module_assets = []
+    for i in range(modules):
+        type_name, module_asset, ready = export.write_module(i, levels)
+        if ready:
+            # Presets only use modules in production, as analysis expects of factory presets
+            modules_by_type.setdefault(type_name, []).append(module_asset)
+        module_assets.append(module_asset)
+
+    export.write_pilots(pilots)
+    export.write_meta_root(modules_by_type, presets)
+    export.write_progression_table(module_assets)
+    export.write_powerups()
+    export.write_localizations()
+    export.link_windows_roots()
+
+    num_files = sum(len(file_names) for _, _, file_names in os.walk(export_dir))
+    num_bytes = sum(os.path.getsize(os.path.join(dir_path, file_name)) for dir_path, _, file_names in os.walk(export_dir) for file_name in file_names)
+    return {"modules": modules, "languages": len(export.languages), "template_depth": template_depth, "presets": presets, "files": num_files, "bytes": num_bytes}
+
+def add_scale_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--modules", type=int, default=200, help="Number of DA_Module_* files")
+    parser.add_argument("--languages", type=int, default=3, help="Number of localization languages, including en")
+    parser.add_argument("--template-depth", type=int, default=3, help="Length of each ability Template chain")
+    parser.add_argument("--presets", type=int, default=10, help="Number of factory presets, and twice the number of bot AI presets")
+    parser.add_argument("--pilots", type=int, default=6, help="Number of pilots")
+
+def scale_kwargs(args) -> dict:
+    return {"modules": args.modules, "languages": args.languages, "template_depth": args.template_depth, "presets": args.presets, "pilots": args.pilots}
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic WRFrontiers export")
+    parser.add_argument("export_dir")
+    add_scale_arguments(parser)
+    args = parser.parse_args()
+    summary = generate_export(args.export_dir, **scale_kwargs(args))
+    print(json.dumps(summary))
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -34,6 +34,92 @@ OPTIONS_SCHEMA = {
         "help": "Directory where the exported game JSON files are stored.",
         "example": Path("C:/WRFrontiersDB/ExportData")
     },
+    "JSON_CACHE_MAX_MB": {
+        "env": "JSON_CACHE_MAX_MB",
+        "arg": "--json-cache-max-mb",
+        "type": int,
+        "default": 1024,
+        "section": "Parse",
+        "depends_on": ["SHOULD_PARSE"],
+        "help": "Memory budget in megabytes of source JSON for the decoded export file cache. 0 disables caching.",
+        "help_extended": "Shared assets like DA_Meta_Root.json and ability templates are otherwise re-read for every reference."
+    },
+    "LOCALIZATION_WORKERS": {
+        "env": "LOCALIZATION_WORKERS",
+        "arg": "--localization-workers",
+        "type": int,
+        "default": 0,
+        "section": "Parse",
+        "depends_on": ["SHOULD_PARSE"],
+        "help": "Number of worker processes that decode localization files in parallel. 0 uses one per CPU, 1 loads them serially."
+    },
+    "MODULE_WORKERS": {
+        "env": "MODULE_WORKERS",
+        "arg": "--module-workers",
+        "type": int,
+        "default": 1,
+        "section": "Parse",
+        "depends_on": ["SHOULD_PARSE"],
+        "help": "Number of worker processes that parse module files in parallel. 0 uses one per CPU, 1 parses them serially.",
+        "help_extended": "The objects parsed by each worker are merged in file order, so the output is the same as parsing serially. Ignored when INCREMENTAL_MANIFEST_FILE is set."
+    },
+    "OUTPUT_WORKERS": {
+        "env": "OUTPUT_WORKERS",
+        "arg": "--output-workers",
+        "type": int,
+        "default": 0,
+        "section": "Parse",
+        "depends_on": ["SHOULD_PARSE"],
+        "help": "Number of threads, and worker processes for the largest classes, that write the parsed output files in parallel. 0 uses one per CPU, 1 writes them serially."
+    },
+    "LAZY_LOCALIZATION": {
+        "env": "LAZY_LOCALIZATION",
+        "arg": "--lazy-localization",
+        "type": bool,
+        "default": False,
+        "section": "Parse",
+        "depends_on": ["SHOULD_PARSE"],
+        "help": "Whether to decode each localization table only when it is first used, instead of holding every language fully in memory.",
+        "help_extended": "Localization output files are then streamed from the export one table at a time. Reduces peak memory on exports with many languages."
+    },
+    "DROP_SOURCE_DATA": {
+        "env": "DROP_SOURCE_DATA",
+        "arg": "--drop-source-data",
+        "type": bool,
+        "default": False,
+        "section": "Parse",
+        "depends_on": ["SHOULD_PARSE"],
+        "help": "Whether to release each parsed object's raw export data as soon as it is parsed, instead of keeping it until the output files are written.",
+        "help_extended": "Reduces peak memory of a full parse. The output files are unchanged."
+    },
+    "EXPORT_INDEX_FILE": {
+        "env": "EXPORT_INDEX_FILE",
+        "arg": "--export-index-file",
+        "type": Path,
+        "default": None,
+        "section": "Parse",
+        "help": "Optional file to save the scanned index of EXPORT_DIR to, so later runs against the same unmodified export skip the scan.",
+        "example": Path("C:/WRFrontiersDB/export_index.json")
+    },
+    "INCREMENTAL_MANIFEST_FILE": {
+        "env": "INCREMENTAL_MANIFEST_FILE",
+        "arg": "--incremental-manifest-file",
+        "type": Path,
+        "default": None,
+        "section": "Parse",
+        "help": "Optional file to record the export files each parsed object consumed. When set, later runs only re-parse objects whose source files changed.",
+        "help_extended": "Objects with unchanged sources are restored from the state saved in this file. Any change to parser code or localization files causes a full parse.",
+        "example": Path("C:/WRFrontiersDB/source_manifest.json")
+    },
+    "PROFILE_REPORT_FILE": {
+        "env": "PROFILE_REPORT_FILE",
+        "arg": "--profile-report-file",
+        "type": Path,
+        "default": None,
+        "section": "Parse",
+        "help": "Optional file to write the JSON report of each parse phase's wall time, CPU time, peak memory and export files read to. Defaults to parse_profile.json next to OUTPUT_DIR.",
+        "example": Path("C:/WRFrontiersDB/parse_profile.json")
+    },
     "SHOULD_PUSH_DATA": {
         "env": "SHOULD_PUSH_DATA",
         "arg": "--should-push-data",
@@ -60,4 +60,10 @@ def set_options(options):
     Args:
         options: The Options instance from init_options()
     """
-    OPTIONS._set(options)
\ No newline at end of file
+    OPTIONS._set(options)
+
+def get_options():
+    """
+    Returns the Options instance set by set_options(), i.e. to pass to a worker process.
+    """
+    return OPTIONS._options
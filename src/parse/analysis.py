@@ -1,6 +1,7 @@
 import sys
 import os
 import json
+from functools import cached_property
 
 # Add parent dirs to sys path for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -21,6 +22,7 @@ from parsers.upgrade_cost import UpgradeCost
 from parsers.scrap_reward import ScrapReward
 from parsers.character_preset import CharacterPreset
 from parsers.ability import Ability
+from stat_rank_table import StatRankTable
 
 INTEL_CURRENCY_REF = 'OBJID_Currency::DA_Meta_Currency_Intel'
 ALLOY_CURRENCY_REF = 'OBJID_Currency::DA_Meta_Currency_Alloys'
@@ -90,41 +92,77 @@ DISCOUNT_COST_MAP = {
 }
 
 class Analysis:
-    def __init__(self):
-        # Upgrade cost & Scrap reward
-        self.cost_scrap_frequency_map = self.get_frequency_map()
-        self.standard_cost_and_scrap = self.determine_standard_cost_and_scrap(self.cost_scrap_frequency_map)
-        self.discount_cost = self.determine_discount_cost(self.standard_cost_and_scrap)
-
-        # Level Diffs per module
-        res = self.get_level_diffs_per_module()
-        self.level_diffs_by_module = res['level_diffs']
-        distinct_stat_keys = res['distinct_stat_keys']
-
-        # Ranking of diffs per module, level diff per stat
-        stat_ranks = self.get_ranks_per_stat(self.level_diffs_by_module, distinct_stat_keys)
-        ranks_per_module = self.get_ranks_per_module(stat_ranks, module_ids=self.level_diffs_by_module.keys())
-        for module_id, rank in ranks_per_module.items():
-            self.level_diffs_by_module[module_id]['stats_percentile'] = rank
-        self.level_diffs_by_stat = self.get_level_diffs_per_stat(self.level_diffs_by_module, stat_ranks)
-
-        # Determine cost of each module
-        self.modules_upgrade_costs = self.get_modules_upgrade_costs(self.standard_cost_and_scrap)
+    """
+    Each stage is computed on first access and kept, so it is computed at most once per instance.
+    Enrichment reads the standard upgrade costs and analyze() reads every stage, so a run shares one instance between them.
+    """
+
+    ################################
+    #   Stages, computed lazily    #
+    ################################
+    # Upgrade cost & Scrap reward
+    @cached_property
+    def cost_scrap_frequency_map(self):
+        return self.get_frequency_map()
+
+    @cached_property
+    def standard_cost_and_scrap(self):
+        return self.determine_standard_cost_and_scrap(self.cost_scrap_frequency_map)
+
+    @cached_property
+    def discount_cost(self):
+        return self.determine_discount_cost(self.standard_cost_and_scrap)
+
+    # Level Diffs per module, without ranks or upgrade costs
+    @cached_property
+    def _level_diffs(self):
+        return self.get_level_diffs_per_module()
+
+    # Ranking of diffs per stat
+    @cached_property
+    def stat_rank_table(self):
+        return self.get_stat_rank_table(self._level_diffs['level_diffs'], self._level_diffs['distinct_stat_keys'])
+
+    @cached_property
+    def level_diffs_by_module(self):
+        level_diffs_by_module = self._level_diffs['level_diffs']
+        for module_id, percentiles in self.stat_rank_table.percentiles_by_module().items():
+            level_diffs_by_module[module_id]['stats_percentile'] = percentiles
         # Add upgrade cost to lvl diff per module, but not the ranking
-        self.level_diffs_by_module = self.add_upgrade_cost_to_level_diffs(self.level_diffs_by_module, self.modules_upgrade_costs)
+        return self.add_upgrade_cost_to_level_diffs(level_diffs_by_module, self.modules_upgrade_costs)
+
+    @cached_property
+    def level_diffs_by_stat(self):
+        return self.stat_rank_table.level_diffs_by_stat()
+
+    # Determine cost of each module
+    @cached_property
+    def modules_upgrade_costs(self):
+        return self.get_modules_upgrade_costs(self.standard_cost_and_scrap)
 
-        # Determine upgrade costs of each factory preset
-        self.factory_preset_upgrade_costs = self.calculate_factory_preset_upgrade_costs(self.standard_cost_and_scrap)
+    # Determine upgrade costs of each factory preset
+    @cached_property
+    def factory_preset_upgrade_costs(self):
+        return self.calculate_factory_preset_upgrade_costs(self.standard_cost_and_scrap)
 
-        # Determine grand total upgrade costs of production only modules, and 2 of each shoulder rather than 1
-        self.total_upgrade_costs = self.calculate_total_upgrade_costs(self.modules_upgrade_costs)
+    # Determine grand total upgrade costs of production only modules, and 2 of each shoulder rather than 1
+    @cached_property
+    def total_upgrade_costs(self):
+        return self.calculate_total_upgrade_costs(self.modules_upgrade_costs)
 
-        # Embed "Primary" and "Secondary" in ability descriptions to know which is which
-        self.ability_primary_secondary_descriptions = self.analyze_ability_descriptions()
-        self.ability_primary_secondary_descriptions_md = self.generate_ability_descriptions_md(self.ability_primary_secondary_descriptions)
+    # Embed "Primary" and "Secondary" in ability descriptions to know which is which
+    @cached_property
+    def ability_primary_secondary_descriptions(self):
+        return self.analyze_ability_descriptions()
 
-        # Analyze shoulder profiles
-        self.shoulder_profiles = self.analyze_shoulder_profiles()
+    @cached_property
+    def ability_primary_secondary_descriptions_md(self):
+        return self.generate_ability_descriptions_md(self.ability_primary_secondary_descriptions)
+
+    # Analyze shoulder profiles
+    @cached_property
+    def shoulder_profiles(self):
+        return self.analyze_shoulder_profiles()
 
     ########################################
     #      Upgrade Cost & Scrap Reward     #
@@ -471,57 +509,22 @@ class Analysis:
             'distinct_stat_keys': distinct_stat_keys
         }
 
-    def get_ranks_per_stat(self, level_diffs_by_module, distinct_stat_keys):
+    def get_stat_rank_table(self, level_diffs_by_module, distinct_stat_keys):
         stat_keys_to_not_rank = {'PrimaryParameter', 'SecondaryParameter'}
         stat_keys_to_rank = [key for key in distinct_stat_keys if key not in stat_keys_to_not_rank]
 
         from parsers.stat import Stat
 
-        def rank_stats(level_diffs_by_module, stat_keys_to_rank):
-            stat_ranks = {key: {} for key in stat_keys_to_rank}
-            for stat_key in stat_ranks:
-                module_increases = []
-                for module_id, module_diff_data in level_diffs_by_module.items():
-                    percent_increase = module_diff_data['stats_percent_increase'].get(stat_key)
-                    if percent_increase is not None:
-                        module_increases.append((module_id, percent_increase))
-                
-                stat_obj = Stat.objects.get(stat_key)
-                if stat_obj is not None:
-                    module_stat = ModuleStat.get_from_ref(stat_obj.module_stat_ref)
-                    more_is_better = getattr(module_stat, 'more_is_better', True)
-                else:
-                    logger.warning(f"Stat {stat_key} not found in Stat.objects. Defaulting to more_is_better = True")
-                    more_is_better = True
-
-                should_reverse = not more_is_better
-                module_increases.sort(key=lambda x: (float('-inf') if isinstance(x[1], str) else x[1]), reverse=should_reverse)
-                for rank, (module_id, _) in enumerate(module_increases[::-1]):
-                    stat_ranks[stat_key][module_id] = rank
-            return stat_ranks
-        return rank_stats(level_diffs_by_module, stat_keys_to_rank)
-
-    @staticmethod
-    def get_ranks_per_module(stat_ranks, module_ids: list):
-        per_module_ranks = {}
-        for module_id in module_ids:
-            my_module_ranks = {
-                stat: stat_ranks[stat].get(module_id, 0) / len(stat_ranks[stat]) if stat in stat_ranks and len(stat_ranks[stat]) > 0 else 0
-                for stat in stat_ranks if module_id in stat_ranks[stat]
-            }
-            per_module_ranks[module_id] = dict(sorted(my_module_ranks.items()))
-        return per_module_ranks
-
-    @staticmethod
-    def get_level_diffs_per_stat(level_diffs_by_module, stat_ranks):
-        verbose_stat_ranks = {
-            stat_key: {
-                module_id: level_diffs_by_module[module_id]['stats_percent_increase'][stat_key]
-                for module_id in stat_rank
-            }
-            for stat_key, stat_rank in stat_ranks.items()
-        }
-        return verbose_stat_ranks
+        more_is_better_by_stat = {}
+        for stat_key in stat_keys_to_rank:
+            stat_obj = Stat.objects.get(stat_key)
+            if stat_obj is not None:
+                module_stat = ModuleStat.get_from_ref(stat_obj.module_stat_ref)
+                more_is_better_by_stat[stat_key] = getattr(module_stat, 'more_is_better', True)
+            else:
+                logger.warning(f"Stat {stat_key} not found in Stat.objects. Defaulting to more_is_better = True")
+                more_is_better_by_stat[stat_key] = True
+        return StatRankTable(level_diffs_by_module, more_is_better_by_stat)
     
     ############################
     #   Module Upgrade Costs   #
@@ -1060,6 +1063,8 @@ def round_val(value):
         return value
     return round(value, 5) #decimal places
 
-def analyze():
-    analysis = Analysis()
+def analyze(analysis: Analysis = None):
+    """Write every analysis stage to file, reusing the stages already computed by analysis if given"""
+    if analysis is None:
+        analysis = Analysis()
     analysis.to_file()
\ No newline at end of file
@@ -24,6 +24,7 @@ from exclusive_module_socket_matching import (
 )
 from parsers.rarity_upgrade_cost import RarityUpgradeCost
 from parsers.stat import Stat
+from analysis import Analysis, INTEL_CURRENCY_REF, ALLOY_CURRENCY_REF, DISCOUNT_COST_MAP
 
 PILOT_TYPE_LEGENDARY_REF = 'OBJID_PilotType::DA_PilotType_Legendary.0'
 
@@ -45,24 +46,60 @@ def ref_to_id(ref):
         return ref
     return ref.split('::')[1]
 
-def is_virtual_bot_module(module):
-    module_type_ref = getattr(module, 'module_type_ref', None)
-    if not module_type_ref:
-        return False
-    
-    # Get the module group for this module type
-    group_id = ModuleGroup.get_group_id_for_type(ref_to_id(module_type_ref))
-    if not group_id:
-        return False
-    
-    # Check if this module group is marked as a virtual bot module
-    module_group = ModuleGroup.objects.get(group_id)
-    if not module_group:
-        return False
-    
-    return getattr(module_group, 'virtual_bot_module', False)
+class EnrichmentIndex:
+    """
+    Lookups over the parsed objects that several enrich_* steps need, built once after the module groups are generated
+    instead of being recomputed for every module of every preset.
+    """
+    def __init__(self):
+        self.module_group_ids = dict() # {module_id: group_id}, of modules whose module type belongs to a module group
+        self.virtual_bot_module_ids = set() # ids of modules whose module group makes up virtual bots
+        self.preset_module_ids = dict() # {preset_id: [module_id]}, aligned with preset.modules, None for an entry without a module_ref
+        self.factory_preset_ids_by_module = dict() # {module_id: [preset_id]}, the factory presets using each module, sorted by id
+        self.ai_preset_slugs = dict() # {preset_id: slug of its English name}, of the non-factory presets in the drop teams of BotAIPresets, in the order first reached
+        self.preset_titan_weapon_ids = dict() # {preset_id: [module_id]}, the titan weapon modules of each preset in ai_preset_slugs
+
+    def build(self) -> None:
+        for module_id, module in Module.objects.items():
+            module_type_ref = getattr(module, 'module_type_ref', None)
+            if not module_type_ref:
+                continue
+            group_id = ModuleGroup.get_group_id_for_type(ref_to_id(module_type_ref))
+            if not group_id:
+                continue
+            self.module_group_ids[module_id] = group_id
 
-def enrich():
+            # Check if this module group is marked as a virtual bot module
+            module_group = ModuleGroup.objects.get(group_id)
+            if module_group and getattr(module_group, 'virtual_bot_module', False):
+                self.virtual_bot_module_ids.add(module_id)
+
+        for preset_id, preset in CharacterPreset.objects.items():
+            self.preset_module_ids[preset_id] = [ref_to_id(module_data.get('module_ref')) for module_data in preset.modules]
+
+        for preset_id in sorted(CharacterPreset.objects):
+            if not getattr(CharacterPreset.objects[preset_id], 'is_factory_preset', False):
+                continue
+            for module_id in self.preset_module_ids[preset_id]:
+                preset_ids = self.factory_preset_ids_by_module.setdefault(module_id, [])
+                if not preset_ids or preset_ids[-1] != preset_id:
+                    preset_ids.append(preset_id)
+
+        for bot_ai in BotAIPreset.objects.values():
+            for drop_team_ref in getattr(bot_ai, 'drop_teams_refs', []):
+                drop_team = DropTeam.objects.get(ref_to_id(drop_team_ref))
+                if not drop_team or not hasattr(drop_team, 'character_presets_refs'):
+                    continue
+                for preset_ref in drop_team.character_presets_refs:
+                    preset_id = ref_to_id(preset_ref)
+                    preset = CharacterPreset.objects.get(preset_id)
+                    if not preset or getattr(preset, 'is_factory_preset', False) or preset_id in self.ai_preset_slugs:
+                        continue
+                    self.ai_preset_slugs[preset_id] = slugify(get_default_string(preset.name) or preset_id)
+                    self.preset_titan_weapon_ids[preset_id] = [module_id for module_id in self.preset_module_ids[preset_id]
+                                                               if self.module_group_ids.get(module_id) == 'titan-weapon']
+
+def enrich(analysis: Analysis = None):
     logger.info("Starting enrichment phase...")
     
     # 0. Shoulder Stats
@@ -72,28 +109,25 @@ def enrich():
     Stat.generate_all()
     # 1. Module Groups
     ModuleGroup.generate_all()
-    for module in Module.objects.values():
-        module_type_ref = getattr(module, 'module_type_ref', None)
-        if module_type_ref:
-            type_id = ref_to_id(module_type_ref)
-            group_id = ModuleGroup.get_group_id_for_type(type_id)
-            if group_id:
-                module.module_group_ref = ModuleGroup.id_to_ref(group_id)
+    index = EnrichmentIndex()
+    index.build()
+    for module_id, group_id in index.module_group_ids.items():
+        Module.objects[module_id].module_group_ref = ModuleGroup.id_to_ref(group_id)
 
     # 2. Module socket exclusivity
     enrich_module_socket_type_exclusivity()
 
     # 3. Character Presets - Weapon Module Refs
-    enrich_character_presets_with_weapon_refs()
+    enrich_character_presets_with_weapon_refs(index)
 
     # 4. Virtual Bots & Bot Refs
-    enrich_modules_with_bots()
+    enrich_modules_with_bots(index)
 
     # 5. Pilot Talents
     enrich_pilot_talents()
 
     # 6. Rarity Upgrade Costs
-    enrich_rarity_upgrade_costs()
+    enrich_rarity_upgrade_costs(analysis)
 
 def enrich_module_socket_type_exclusivity():
     logger.info("Enriching module socket type exclusivity...")
@@ -113,19 +147,17 @@ def enrich_module_socket_type_exclusivity():
     for type_id, socket_id in type_to_socket.items():
         ModuleType.objects[type_id].exclusive_module_socket_type_ref = ModuleSocketType.id_to_ref(socket_id)
 
-def enrich_character_presets_with_weapon_refs():
+def enrich_character_presets_with_weapon_refs(index: EnrichmentIndex):
     logger.info("Enriching character presets with weapon module refs...")
     
-    for preset in CharacterPreset.objects.values():
+    for preset_id, preset in CharacterPreset.objects.items():
         weapon_module_ref = None
         
         # Iterate over modules to find the weapon
-        for module_data in preset.modules:
-            module_ref = module_data.get('module_ref')
-            if not module_ref:
+        for module_data, module_id in zip(preset.modules, index.preset_module_ids[preset_id]):
+            if not module_id:
                 continue
                 
-            module_id = ref_to_id(module_ref)
             module = Module.objects.get(module_id)
             
             if not module:
@@ -146,47 +178,41 @@ def enrich_character_presets_with_weapon_refs():
                         if module_category and hasattr(module_category, 'name'):
                             category_name = getattr(module_category.name, 'Key', '') if hasattr(module_category.name, 'Key') else str(module_category.name)
                             if category_name == 'DA_ModuleCategory_Weapon' or 'Weapon' in category_name:
-                                weapon_module_ref = module_ref
+                                weapon_module_ref = module_data['module_ref']
                                 break
         
         # Set the weapon_module_ref on the preset
         if weapon_module_ref:
             preset.weapon_module_ref = weapon_module_ref
 
-def enrich_modules_with_bots():
+def enrich_modules_with_bots(index: EnrichmentIndex):
     logger.info("Generating Virtual Bots and enriching modules with virtual_bot_ref and shoulder_side...")
     
     # Filter factory presets
     factory_presets = {id: p for id, p in CharacterPreset.objects.items() if getattr(p, 'is_factory_preset', False)}
     
-    # Deterministic order
-    sorted_preset_ids = sorted(factory_presets.keys())
-    
     core_module_to_bot_id = {}
     module_id_to_sides = {} # {module_id: set(['L', 'R'])}
     virtual_bots = {}
+    virtual_bot_core_module_refs = {} # {bot_id: set(core_module_refs)}
 
-    all_virtual_bot_module_ids = [id for id, m in Module.objects.items() if is_virtual_bot_module(m)]
+    all_virtual_bot_module_ids = [id for id in Module.objects if id in index.virtual_bot_module_ids]
 
     for module_id in all_virtual_bot_module_ids:
         if module_id in core_module_to_bot_id:
             continue
 
-        # Find first factory preset that uses this core module
-        first_preset_id = None
-        for pid in sorted_preset_ids:
-            preset = factory_presets[pid]
-            if any(ref_to_id(m['module_ref']) == module_id for m in preset.modules):
-                first_preset_id = pid
-                break
+        # Find first factory preset by id that uses this core module
+        preset_ids = index.factory_preset_ids_by_module.get(module_id)
+        first_preset_id = preset_ids[0] if preset_ids else None
         
         if first_preset_id:
             preset = factory_presets[first_preset_id]
             
             # Find the Chassis or Torso module to use as the bot's name
+            preset_module_ids = index.preset_module_ids[first_preset_id]
             bot_name_localization = preset.name # Fallback to preset name
-            for m_data in preset.modules:
-                m_id = ref_to_id(m_data['module_ref'])
+            for m_id in preset_module_ids:
                 if m_id in Module.objects:
                     module = Module.objects[m_id]
                     group_ref = getattr(module, 'module_group_ref', None)
@@ -199,9 +225,8 @@ def enrich_modules_with_bots():
             bot_id = slugify(bot_name_str)
 
             # Map all virtual bot modules in this preset to this bot_id
-            for m_data in preset.modules:
-                m_id = ref_to_id(m_data['module_ref'])
-                if m_id in Module.objects and is_virtual_bot_module(Module.objects[m_id]):
+            for m_id in preset_module_ids:
+                if m_id in index.virtual_bot_module_ids:
                     if m_id not in core_module_to_bot_id:
                         core_module_to_bot_id[m_id] = bot_id
 
@@ -220,13 +245,14 @@ def enrich_modules_with_bots():
                     has_distinct_shoulders=has_distinct,
                     icon_path=getattr(preset, 'icon', None)
                 )
+                virtual_bot_core_module_refs[bot_id] = set()
 
             # Add virtual bot modules to bot
-            for m_data in preset.modules:
-                m_id = ref_to_id(m_data['module_ref'])
-                if m_id in Module.objects and is_virtual_bot_module(Module.objects[m_id]):
+            for m_data, m_id in zip(preset.modules, preset_module_ids):
+                if m_id in index.virtual_bot_module_ids:
                     m_ref = Module.id_to_ref(m_id)
-                    if m_ref not in virtual_bots[bot_id].core_module_refs:
+                    if m_ref not in virtual_bot_core_module_refs[bot_id]:
+                        virtual_bot_core_module_refs[bot_id].add(m_ref)
                         virtual_bots[bot_id].core_module_refs.append(m_ref)
                     
                     # Track sides for shoulder modules
@@ -239,8 +265,7 @@ def enrich_modules_with_bots():
     # Associate factory presets with bots
     for pid, preset in factory_presets.items():
         assigned_bot_id = None
-        for m_data in preset.modules:
-            m_id = ref_to_id(m_data['module_ref'])
+        for m_id in index.preset_module_ids[pid]:
             if m_id in core_module_to_bot_id:
                 assigned_bot_id = core_module_to_bot_id[m_id]
                 break
@@ -254,47 +279,19 @@ def enrich_modules_with_bots():
     logger.info("Checking AI bots for titan weapons...")
     logger.info(f"Found {len(BotAIPreset.objects)} AI bots")
     
-    for bot_ai in BotAIPreset.objects.values():
-        if not hasattr(bot_ai, 'drop_teams_refs'):
+    for preset_id, bot_slug in index.ai_preset_slugs.items():
+        # Find the virtual bot with the same name
+        if bot_slug not in virtual_bots:
             continue
-            
-        for drop_team_ref in bot_ai.drop_teams_refs:
-            drop_team_id = ref_to_id(drop_team_ref)
-            drop_team = DropTeam.objects.get(drop_team_id)
-            
-            if not drop_team or not hasattr(drop_team, 'character_presets_refs'):
-                continue
-                
-            # Find character presets in this drop team
-            for preset_ref in drop_team.character_presets_refs:
-                preset_id = ref_to_id(preset_ref)
-                preset = CharacterPreset.objects.get(preset_id)
-                
-                if not preset or getattr(preset, 'is_factory_preset', False):
-                    continue
-                    
-                # Check if this preset has titan weapons
-                bot_name = get_default_string(preset.name) or preset_id
-                bot_slug = slugify(bot_name)
-                
-                # Look for titan weapons in this preset
-                for m_data in preset.modules:
-                    m_id = ref_to_id(m_data['module_ref'])
-                    if m_id in Module.objects:
-                        module = Module.objects[m_id]
-                        module_type_ref = getattr(module, 'module_type_ref', None)
-                        if module_type_ref:
-                            type_id = ref_to_id(module_type_ref)
-                            group_id = ModuleGroup.get_group_id_for_type(type_id)
-                            if group_id == 'titan-weapon':
-                                # Find the virtual bot with the same name
-                                if bot_slug in virtual_bots:
-                                    m_ref = Module.id_to_ref(m_id)
-                                    if m_ref not in virtual_bots[bot_slug].core_module_refs:
-                                        virtual_bots[bot_slug].core_module_refs.append(m_ref)
-                                        # Also update the core_module_to_bot_id mapping
-                                        core_module_to_bot_id[m_id] = bot_slug
-                                        logger.info(f"Added titan weapon {m_id} to virtual bot {bot_slug} from AI bot {bot_name}")
+        for m_id in index.preset_titan_weapon_ids[preset_id]:
+            m_ref = Module.id_to_ref(m_id)
+            if m_ref not in virtual_bot_core_module_refs[bot_slug]:
+                virtual_bot_core_module_refs[bot_slug].add(m_ref)
+                virtual_bots[bot_slug].core_module_refs.append(m_ref)
+                # Also update the core_module_to_bot_id mapping
+                core_module_to_bot_id[m_id] = bot_slug
+                bot_name = get_default_string(CharacterPreset.objects[preset_id].name) or preset_id
+                logger.info(f"Added titan weapon {m_id} to virtual bot {bot_slug} from AI bot {bot_name}")
 
     # Finally, enrich Module objects with virtual_bot_ref and shoulder_side
     for module_id, module in Module.objects.items():
@@ -360,12 +357,11 @@ def enrich_pilot_talents():
         
         talent.pilots_with_this_talent.sort(key=sort_key)
 
-def enrich_rarity_upgrade_costs():
+def enrich_rarity_upgrade_costs(analysis: Analysis = None):
     logger.info("Enriching Rarity Upgrade Costs...")
-    from analysis import Analysis, INTEL_CURRENCY_REF, ALLOY_CURRENCY_REF, DISCOUNT_COST_MAP
-    
-    # Instantiate Analysis to get the standard cost map
-    analysis = Analysis()
+    # The standard cost map, computed once and reused by analyze() when the analysis is shared
+    if analysis is None:
+        analysis = Analysis()
     
     for rarity_ref, levels_data in analysis.standard_cost_and_scrap.items():
         costs = {}
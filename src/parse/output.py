@@ -0,0 +1,57 @@
+# Add parent dirs to sys path
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+from utils import OPTIONS, logger, write_json_object_file, timed_call, PHASE_PROFILER
+from parsers.object import ParseObject
+from parsers.image import Image
+
+def get_output_classes() -> list:
+    """
+    Returns every imported ParseObject subclass that has an output file, sorted by name.
+    """
+    classes = dict()
+    for cls in ParseObject._all_subclasses():
+        if not cls.has_output_file or 'objects' not in cls.__dict__:
+            # Bases without their own objects registry, i.e. CompactParseObject, have nothing to write
+            continue
+        if cls.__name__ in classes and classes[cls.__name__] is not cls:
+            # Imported through two module paths, i.e. parsers.x and parse.parsers.x, which splits its objects between two registries
+            raise ValueError(f"ParseObject subclass {cls.__name__} is defined twice, in {classes[cls.__name__].__module__} and {cls.__module__}")
+        classes[cls.__name__] = cls
+    return [classes[name] for name in sorted(classes)]
+
+def write_output_files():
+    """
+    Writes the output file of every ParseObject subclass, plus Image.json.
+    Files are written concurrently, each by a single task, so their content does not depend on scheduling.
+    Threads write most classes, the serialization of heavy_output classes is done in worker processes.
+    """
+    classes = get_output_classes()
+    num_workers = OPTIONS.output_workers or os.cpu_count() or 1
+    os.makedirs(os.path.join(OPTIONS.output_dir, 'Objects'), exist_ok=True)
+
+    if num_workers <= 1:
+        for cls in classes:
+            PHASE_PROFILER.record_task(cls.__name__, timed_call(cls.to_file))
+        PHASE_PROFILER.record_task("Image", timed_call(Image.to_file))
+        return
+
+    logger.debug(f"Writing {len(classes)} output files with {num_workers} threads and worker processes")
+    # Spawned rather than forked, as forking while the writer threads run can deadlock
+    process_context = multiprocessing.get_context("spawn")
+    num_processes = max(1, min(num_workers, sum(1 for cls in classes if cls.heavy_output)))
+    with ThreadPoolExecutor(max_workers=num_workers) as thread_executor, ProcessPoolExecutor(max_workers=num_processes, mp_context=process_context) as process_executor:
+        futures = dict()
+        for cls in classes:
+            if cls.heavy_output:
+                futures[cls.__name__] = process_executor.submit(timed_call, write_json_object_file, cls.output_file_path(), cls.sorted_object_dicts())
+            else:
+                futures[cls.__name__] = thread_executor.submit(timed_call, cls.to_file)
+        futures["Image"] = thread_executor.submit(timed_call, Image.to_file)
+        for name, future in futures.items():
+            PHASE_PROFILER.record_task(name, future.result()) # re-raises any error from writing
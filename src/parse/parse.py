@@ -11,7 +11,7 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 if current_dir not in sys.path:
     sys.path.append(current_dir)
 
-from utils import clear_dir
+from utils import clear_dir, JSON_FILE_CACHE, EXPORT_INDEX, SOURCE_MANIFEST, SNAKE_CASE_CONVERTER, PHASE_PROFILER, logger
 from options import OPTIONS
 
 from parsers.module import *
@@ -29,78 +29,66 @@ from parsers.module_group import ModuleGroup
 from parsers.shop_card import ShopCard, parse_shop_cards
 from parsers.rarity_upgrade_cost import RarityUpgradeCost
 from parsers.stat import Stat
+from parsers.object import ParseObject
+from output import write_output_files
+
+def incremental_fingerprint_files():
+    """Files that every parsed object implicitly depends on: the parser code, and the localization every parser looks names up in."""
+    parse_dir = os.path.dirname(os.path.abspath(__file__))
+    files = [os.path.join(os.path.dirname(parse_dir), 'utils.py')]
+    parsers_dir = os.path.join(parse_dir, 'parsers')
+    files.extend(os.path.join(parsers_dir, file) for file in os.listdir(parsers_dir) if file.endswith('.py'))
+    localization_source_path = os.path.join(OPTIONS.export_dir, r"WRFrontiers\Content\Localization\Game")
+    for dir_path, _, file_names in os.walk(localization_source_path):
+        files.extend(os.path.join(dir_path, file) for file in file_names if file.endswith('.json'))
+    return files
+
+def profile_report_file():
+    """PROFILE_REPORT_FILE, else parse_profile.json next to the output dir"""
+    if OPTIONS.profile_report_file is not None:
+        return OPTIONS.profile_report_file
+    return os.path.join(os.path.dirname(os.path.abspath(OPTIONS.output_dir)), 'parse_profile.json')
+
 def main():
     """Main parsing function - uses global OPTIONS singleton."""
-    os.makedirs(OPTIONS.output_dir, exist_ok=True)
-    clear_dir(OPTIONS.output_dir)
-
-    parse_localizations()
-    parse_modules() #module relies on english localization being added to each key just as a helpful Ctrl+F reference
-    parse_pilots()  # Pilot parser relies on module data being parsed first
-    parse_progression_table()
-    parse_game_modes()
-    parse_bot_ai_presets()
-    parse_factory_presets()
-    parse_powerups()
-    parse_shop_cards()
-    enrich()
-    analyze()
-
-
-    ProgressionTable.to_file()
-    Currency.to_file()
-    ContentUnlock.to_file()
-    Decal.to_file()
-    CustomizationType.to_file()
-    CustomizationRarity.to_file()
-    Rarity.to_file()
-    GroupReward.to_file()
-    Material.to_file()
-    Weathering.to_file()
-    Skin.to_file()
-
-    Module.to_file()
-    ModuleRarity.to_file()
-    RarityUpgradeCost.to_file()
-    CharacterModule.to_file()
-    Ability.to_file()
-    Faction.to_file()
-    ModuleClass.to_file()
-    CharacterClass.to_file()
-    ModuleTag.to_file()
-    ModuleType.to_file()
-    ModuleGroup.to_file()
-    ModuleCategory.to_file()
-    ModuleSocketType.to_file()
-    ModuleStat.to_file()
-    Stat.to_file()
-    ModuleStatsTable.to_file()
-    UpgradeCost.to_file()
-    ScrapReward.to_file()
-    MovementType.to_file()
-
-    Pilot.to_file()
-    PilotType.to_file()
-    PilotClass.to_file()
-    PilotPersonality.to_file()
-    PilotTalentType.to_file()
-    PilotTalent.to_file()
-
-    GameMode.to_file()
-    BotNames.to_file()
-    HonorReward.to_file()
-
-    BotAIPreset.to_file()
-    DropTeam.to_file()
-    CharacterPreset.to_file()
-    League.to_file()
-
-    CharacterPreset.to_file()
-
-    VirtualBot.to_file()
-
-    Powerup.to_file()
-    ShopCard.to_file()
-
-    Localization.to_file()
-    Image.to_file()
\ No newline at end of file
+    with PHASE_PROFILER.phase("setup"):
+        os.makedirs(OPTIONS.output_dir, exist_ok=True)
+        if OPTIONS.incremental_manifest_file is not None:
+            # Loaded before clearing, in case the manifest is kept in the output dir
+            SOURCE_MANIFEST.load(OPTIONS.incremental_manifest_file, OPTIONS.export_dir, incremental_fingerprint_files())
+        clear_dir(OPTIONS.output_dir)
+        JSON_FILE_CACHE.configure(max_bytes=OPTIONS.json_cache_max_mb * 1024 * 1024)
+        EXPORT_INDEX.build(OPTIONS.export_dir, OPTIONS.export_index_file)
+        ParseObject.drop_source_data = OPTIONS.drop_source_data
+
+    parse_steps = [
+        parse_localizations,
+        parse_modules, #module relies on english localization being added to each key just as a helpful Ctrl+F reference
+        parse_pilots,  # Pilot parser relies on module data being parsed first
+        parse_progression_table,
+        parse_game_modes,
+        parse_bot_ai_presets,
+        parse_factory_presets,
+        parse_powerups,
+        parse_shop_cards,
+    ]
+    for parse_step in parse_steps:
+        with PHASE_PROFILER.phase(parse_step.__name__):
+            parse_step()
+    if SOURCE_MANIFEST.enabled:
+        # Saved before enrichment, which derives data across all objects
+        SOURCE_MANIFEST.save(OPTIONS.incremental_manifest_file)
+        logger.info(f"Incremental parse stats: {SOURCE_MANIFEST.stats()}")
+    # Shared, so the stages enrichment reads are not computed again by analyze()
+    analysis = Analysis()
+    with PHASE_PROFILER.phase("enrich"):
+        enrich(analysis)
+    with PHASE_PROFILER.phase("analyze"):
+        analyze(analysis)
+
+    with PHASE_PROFILER.phase("write_output_files"):
+        write_output_files()
+
+    PHASE_PROFILER.save(profile_report_file())
+    logger.info(f"Export file cache stats: {JSON_FILE_CACHE.stats()}")
+    logger.debug(f"snake_case memo stats: {SNAKE_CASE_CONVERTER.stats()}")
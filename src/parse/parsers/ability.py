@@ -3,14 +3,16 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from parse.parsers.module_tag import ModuleTag
+from parsers.module_tag import ModuleTag
 from parsers.object import ParseObject
-from utils import logger, ParseTarget, ParseAction, process_key_to_parser_function, asset_to_asset_path, asset_to_data, asset_path_to_data, parse_colon_colon, parse_curve, merge_dicts
+from utils import logger, ParseTarget, ParseAction, process_key_to_parser_function, asset_to_asset_path, asset_to_data, asset_path_to_data, parse_colon_colon, parse_curve, merge_dicts, copy_containers
 from parsers.image import parse_image_asset_path
 from parsers.localization_table import parse_localization
 
 class Ability(ParseObject):
     objects = dict()  # Dictionary to hold all Class instances
+    heavy_output = True
+    memoize_templates = True  # many abilities share a chain of base templates
 
     def _parse(self):
         if 'ClassDefaultObject' in self.source_data:
@@ -24,7 +26,11 @@ class Ability(ParseObject):
 
         # Locate WeaponInfos under the misc attribute and move it to the weapon_char_module_ref attribute
         if hasattr(self, 'misc') and 'spawn_actor_action' in self.misc and 'ActorClass' in self.misc['spawn_actor_action'] and 'WeaponInfos' in self.misc['spawn_actor_action']['ActorClass']:
-            self.weapon_char_module_ref = self.misc['spawn_actor_action']['ActorClass'].pop('WeaponInfos')
+            # Copied on the way down, as the merged data can share dicts with templates and cached JSON
+            spawn_actor_action = dict(self.misc['spawn_actor_action'])
+            actor_class = spawn_actor_action['ActorClass'] = dict(spawn_actor_action['ActorClass'])
+            self.weapon_char_module_ref = actor_class.pop('WeaponInfos')
+            self.misc = {**self.misc, 'spawn_actor_action': spawn_actor_action}
 
     def _parse_from_data(self, source_data: dict):
         props = source_data.get("Properties")
@@ -337,33 +343,34 @@ class Ability(ParseObject):
     def _p_pulling_action(self, data: dict):
         logger.debug(f"Parsing pulling action for {self.id}")
 
-        data = asset_to_data(data)
-        if 'Template' in data:
-            template_data = self._p_pulling_action(data["Template"])
-        else:
-            template_data = {}
-
-        if 'Properties' not in data:
-            my_data = {}
-        else:
-            key_to_parser_function = {
-                "PulledActor": parse_colon_colon,
-                "DistanceRange": lambda x: x['max'],
-                "PullingEntryDuration": "value",
-                "PullingEntryBlendExponent": "value",
-                "ForceRange": "value",
-                "PullingForceEasingFunction": None,
-                "PullingEntryEasingFunction": None,
-                "PullingFx": None,
-            }
-
-            my_data = self._process_key_to_parser_function(
-                key_to_parser_function, data["Properties"], log_descriptor="PullingAction", set_attrs=False, default_configuration={
-                    'target': ParseTarget.MATCH_KEY
-                }
-            )
+        key_to_parser_function = {
+            "PulledActor": parse_colon_colon,
+            "DistanceRange": lambda x: x['max'],
+            "PullingEntryDuration": "value",
+            "PullingEntryBlendExponent": "value",
+            "ForceRange": "value",
+            "PullingForceEasingFunction": None,
+            "PullingEntryEasingFunction": None,
+            "PullingFx": None,
+        }
 
-        return merge_dicts(template_data, my_data)
+        # Parse each action of the template chain, then merge them at once from the root template
+        layers = []
+        data = asset_to_data(data)
+        while True:
+            if 'Properties' not in data:
+                layers.append({})
+            else:
+                layers.append(self._process_key_to_parser_function(
+                    key_to_parser_function, data["Properties"], log_descriptor="PullingAction", set_attrs=False, default_configuration={
+                        'target': ParseTarget.MATCH_KEY
+                    }
+                ))
+            if 'Template' not in data:
+                break
+            data = asset_to_data(data["Template"])
+
+        return merge_dicts({}, *reversed(layers))
 
     def _p_vertical_accel_curve(self, data: dict):
         data = asset_to_data(data)["Properties"]
@@ -380,31 +387,33 @@ class Ability(ParseObject):
         )
 
     def _p_hacking_cast_action(self, data: dict):
-        data = asset_to_data(data)
-
-        parsed_data = {}
-        if 'Properties' in data:
-            key_to_parser_function = {
-                "MaxRange": "value",
-                "HackingFx": None,
-                "TargetPosParam": None,
-                "HackingFailedParam": None,
-                "HackingTimeParam": None,
-                "TargetCameraFX": None,
-                "GetHackingTarget": None,
-            }
-
-            parsed_data = self._process_key_to_parser_function(
-                key_to_parser_function, data["Properties"], log_descriptor="HackingCastAction", set_attrs=False, default_configuration={
-                    'target': ParseTarget.MATCH_KEY
-                }
-            )
-
-        if 'Template' in data:
-            parsed_template_data = self._p_hacking_cast_action(data["Template"])
-            parsed_data = merge_dicts(parsed_template_data, parsed_data)
+        key_to_parser_function = {
+            "MaxRange": "value",
+            "HackingFx": None,
+            "TargetPosParam": None,
+            "HackingFailedParam": None,
+            "HackingTimeParam": None,
+            "TargetCameraFX": None,
+            "GetHackingTarget": None,
+        }
 
-        return parsed_data
+        # Parse each action of the template chain, then merge them at once from the root template
+        layers = []
+        data = asset_to_data(data)
+        while True:
+            parsed_data = {}
+            if 'Properties' in data:
+                parsed_data = self._process_key_to_parser_function(
+                    key_to_parser_function, data["Properties"], log_descriptor="HackingCastAction", set_attrs=False, default_configuration={
+                        'target': ParseTarget.MATCH_KEY
+                    }
+                )
+            layers.append(parsed_data)
+            if 'Template' not in data:
+                break
+            data = asset_to_data(data["Template"])
+
+        return merge_dicts(*reversed(layers))
 
     def _p_effect_type(self, data: str):
         etype = parse_colon_colon(data)
@@ -673,7 +682,7 @@ class Ability(ParseObject):
         data = asset_to_data(data)
         if 'Properties' not in data:
             return
-        return data["Properties"]
+        return copy_containers(data["Properties"])
     
     def _p_actor_class(self, data):
         return p_actor_class(data)
@@ -790,7 +799,7 @@ def p_focus_component(data: dict):
     data = asset_to_data(data)
     if 'Properties' not in data:
         return
-    return data["Properties"]
+    return copy_containers(data["Properties"])
 
 def p_damage_applier(data: dict):
     data = asset_to_data(data)["Properties"]
@@ -871,7 +880,7 @@ def p_pushing_settings(data: dict):
     if 'Properties' not in data:
         return
     else:
-        return data["Properties"]
+        return copy_containers(data["Properties"])
 
 def p_transf_sphere_component(data: dict):
     data = asset_to_data(data)
@@ -925,7 +934,7 @@ def p_modifier(data):
         if 'Properties' not in data:
             return
         props = data["Properties"]
-        return props["Value"]
+        return copy_containers(props["Value"])
     else:
         return data
 
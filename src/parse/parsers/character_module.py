@@ -11,6 +11,7 @@ from loguru import logger
 
 class CharacterModule(ParseObject):
     objects = dict()  # Dictionary to hold all CharacterModule instances
+    heavy_output = True
     
     def _parse(self):
         class_default_object = self.source_data["ClassDefaultObject"]
@@ -5,7 +5,7 @@ import os
 from loguru import logger
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from utils import asset_to_file_path, OPTIONS, normalize_path, parse_hex
+from utils import asset_to_file_path, OPTIONS, normalize_path, parse_hex, SOURCE_MANIFEST
 
 import json
 
@@ -17,6 +17,8 @@ class Image():
             raise TypeError("Image path must be a string.")
         if image_path not in self.image_paths:
             self.image_paths[image_path] = True
+        if SOURCE_MANIFEST.enabled:
+            SOURCE_MANIFEST.record_image_path(image_path)
 
     @classmethod
     def to_file(cls):
@@ -4,28 +4,118 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import json
+import re
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 
-from utils import OPTIONS, logger, get_json_data
+from utils import OPTIONS, logger, get_json_data, stream_json_object, PHASE_PROFILER
+from options import set_options, get_options
+from optionsconfig import setup_logging
 
 from parsers.object import ParseObject
 
+# A JSON string (group 1), optionally followed by a colon when it is an object key (group 2), or a container bracket
+_JSON_TOKEN_PATTERN = re.compile(rb'("[^"\\]*(?:\\.[^"\\]*)*")(\s*:)?|[{}\[\]]')
+
+def index_table_namespaces(file_path: str) -> dict | None:
+    """
+    Finds the byte span of each TableNamespace's table in a localization file without decoding the tables.
+    Returns:
+        {table_namespace: (start, end)} in file order, or None if the file is not an object of tables
+    """
+    with open(file_path, 'rb') as f:
+        raw = f.read()
+
+    table_spans = {}
+    depth = 0
+    table_namespace = None
+    table_start = None
+    for match in _JSON_TOKEN_PATTERN.finditer(raw):
+        token = match.group()
+        if match.group(1) is not None:
+            if depth != 1:
+                continue
+            if match.group(2) is not None and table_namespace is None:
+                table_namespace = json.loads(match.group(1))
+                table_start = match.end()
+            else:
+                return None # top-level value is not a table
+        elif token in (b'{', b'['):
+            if depth == 1 and table_namespace is None:
+                return None
+            depth += 1
+        else:
+            depth -= 1
+            if depth == 1 and table_namespace is not None:
+                # Re-assigning a duplicate namespace keeps its first position but the last value, same as json.load
+                table_spans[table_namespace] = (table_start, match.end())
+                table_namespace = None
+
+    if depth != 0 or table_namespace is not None:
+        return None
+    return table_spans
+
 class Localization(ParseObject):
     objects = dict()  # Dictionary to hold all Localization instances
+    incremental = False  # Covered by the SOURCE_MANIFEST fingerprint instead, as every parser localizes
+    drop_source_data = False  # source_data holds the localization tables themselves
+
+    # Set by create_lazy(). Tables of a lazy Localization are decoded into source_data on first use.
+    _source_file = None
+    _table_spans = {}
 
     def _parse(self):
         pass
 
+    @classmethod
+    def create_lazy(cls, lang_code: str, source_file: str, table_spans: dict):
+        """
+        Creates a Localization that decodes each table from source_file only when it is first localized from.
+        table_spans: see index_table_namespaces()
+        """
+        localization = cls(lang_code, {})
+        localization._source_file = source_file
+        localization._table_spans = table_spans
+        return localization
+
+    def _read_table(self, table_namespace):
+        start, end = self._table_spans[table_namespace]
+        with open(self._source_file, 'rb') as f:
+            f.seek(start)
+            return json.loads(f.read(end - start))
+
+    def _get_table(self, table_namespace):
+        """Returns the table for a namespace, decoding it first if this is a lazy Localization. None if not found."""
+        table = self.source_data.get(table_namespace)
+        if table is None and table_namespace in self._table_spans:
+            logger.trace(f"Decoding localization table {table_namespace} for lang_code {self.id}")
+            table = self._read_table(table_namespace)
+            self.source_data[table_namespace] = table
+        return table
+
     def _to_file(self):
         """
         Saves the localization data to a JSON file in the output path.
         """
         if not isinstance(self.source_data, dict):
             raise ValueError(f"Localization source data is not a dictionary: {type(self.source_data)}")
-        
-        file_path = os.path.join(OPTIONS.output_dir, f'Localization\{self.id}.json')
+
+        file_path = os.path.join(OPTIONS.output_dir, 'Localization', f'{self.id}.json')
         os.makedirs(os.path.dirname(file_path), exist_ok=True)
         with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(self.source_data, f, indent=4, ensure_ascii=False)
+            if self._source_file is None:
+                json.dump(self.source_data, f, indent=4, ensure_ascii=False)
+            else:
+                # One table at a time, without decoding every table into memory at once
+                stream_json_object(f, self._iter_tables())
+
+    def _iter_tables(self):
+        """Yields (table_namespace, table) of a lazy Localization in file order. Tables not yet decoded are not kept, this is their last use."""
+        for table_namespace in self._table_spans:
+            table = self.source_data.get(table_namespace)
+            if table is None:
+                table = self._read_table(table_namespace)
+            yield table_namespace, table
 
     def localize_from_name(self, name_dict: dict):
         """
@@ -44,40 +134,99 @@ class Localization(ParseObject):
         """
         if fallback_str == -1:
             fallback_str = key
-        if table_namespace not in self.source_data:
+        table = self._get_table(table_namespace)
+        if table is None:
             logger.debug(f"Localization table namespace not found: {table_namespace}")
             return fallback_str
-        if key not in self.source_data[table_namespace]:
+        if key not in table:
             logger.debug(f"Localization key not found for lang_code {self.id}: {key} in namespace: {table_namespace}")
             return fallback_str
-        return self.source_data[table_namespace][key]
-    
+        return table[key]
+
     @classmethod
     def to_file(cls):
         for localization in cls.objects.values():
             localization._to_file()
 
-def parse_localizations():
-    localization_source_path = os.path.join(OPTIONS.export_dir, r"WRFrontiers\Content\Localization\Game")
+def _load_localization_dir(dir_path: str, lazy: bool = False) -> list:
+    """
+    Decodes every localization file of one language, or only indexes its tables if lazy.
+    Module-level so it can be pickled to a worker process.
+    Returns:
+        [(file_path, source_data, table_spans)] in file name order, where exactly one of source_data and table_spans is None
+    """
+    loaded = []
+    for file_name in sorted(os.listdir(dir_path)):
+        if not file_name.endswith('.json'):
+            continue
 
-    for dir_name in os.listdir(localization_source_path):
-        if not os.path.isdir(os.path.join(localization_source_path, dir_name)):
+        file_path = os.path.join(dir_path, file_name)
+        table_spans = index_table_namespaces(file_path) if lazy else None
+        if table_spans is not None:
+            loaded.append((file_path, None, table_spans))
             continue
 
-        lang_code = dir_name
+        source_data = get_json_data(file_path, use_cache=False) # read once, too large to keep in JSON_FILE_CACHE
+        if not isinstance(source_data, dict):
+            raise ValueError(f"Localization file does not contain a JSON object: {file_path}")
+        loaded.append((file_path, source_data, None))
+    return loaded
+
+def _init_localization_worker(options):
+    """
+    Initializes a parse_localizations() worker process with the options of the main process.
+    Module-level so it can be pickled to a worker process.
+    """
+    set_options(options)
+    setup_logging(log_file=options.log_file, log_level=options.log_level)
+
+def _load_localization_dir_in_worker(dir_path: str, lazy: bool) -> tuple:
+    """
+    _load_localization_dir() in a worker process, also returning the JSON reads it made so the main process can profile them.
+    Module-level so it can be pickled to a worker process.
+    Returns:
+        (loaded, json_calls, json_bytes_read)
+    """
+    json_calls, json_bytes_read = PHASE_PROFILER.json_reads()
+    loaded = _load_localization_dir(dir_path, lazy)
+    end_json_calls, end_json_bytes_read = PHASE_PROFILER.json_reads()
+    return loaded, end_json_calls - json_calls, end_json_bytes_read - json_bytes_read
+
+def parse_localizations():
+    localization_source_path = os.path.join(OPTIONS.export_dir, r"WRFrontiers\Content\Localization\Game")
+    lazy = OPTIONS.lazy_localization
+
+    # Sorted so Localization.objects has the same order regardless of worker scheduling
+    lang_dirs = []
+    for dir_name in sorted(os.listdir(localization_source_path)):
         dir_path = os.path.join(localization_source_path, dir_name)
-        
-        for file_name in os.listdir(dir_path):
-            if not file_name.endswith('.json'):
-                continue
+        if os.path.isdir(dir_path):
+            lang_dirs.append((dir_name, dir_path))
 
-            file_path = os.path.join(dir_path, file_name)
-            source_data = get_json_data(file_path)
-            if not isinstance(source_data, dict):
-                raise ValueError(f"Localization file does not contain a JSON object: {file_path}")
+    num_workers = OPTIONS.localization_workers or os.cpu_count() or 1
+    num_workers = min(num_workers, len(lang_dirs))
+    if num_workers <= 1:
+        loaded_langs = [_load_localization_dir(dir_path, lazy) for _, dir_path in lang_dirs]
+    else:
+        logger.debug(f"Loading {len(lang_dirs)} localizations with {num_workers} worker processes")
+        # Spawned rather than forked, as forking while the profiler's sampler thread runs can deadlock
+        process_context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=num_workers, mp_context=process_context, initializer=_init_localization_worker,
+                                 initargs=(get_options(),)) as executor:
+            results = list(executor.map(_load_localization_dir_in_worker, [dir_path for _, dir_path in lang_dirs], [lazy] * len(lang_dirs)))
+        loaded_langs = []
+        for loaded, json_calls, json_bytes_read in results:
+            loaded_langs.append(loaded)
+            PHASE_PROFILER.add_json_reads(json_calls, json_bytes_read)
 
-            logger.debug(f"Parsing localization for language: {lang_code} from file: {file_path}")
-            localization = Localization(lang_code, source_data)
+    for (lang_code, _), loaded in zip(lang_dirs, loaded_langs):
+        for file_path, source_data, table_spans in loaded:
+            if table_spans is not None:
+                logger.debug(f"Indexed {len(table_spans)} lazy localization tables for language: {lang_code} from file: {file_path}")
+                localization = Localization.create_lazy(lang_code, file_path, table_spans)
+            else:
+                logger.debug(f"Parsing localization for language: {lang_code} from file: {file_path}")
+                localization = Localization(lang_code, source_data)
 
 if __name__ == "__main__":
-    parse_localizations()
\ No newline at end of file
+    parse_localizations()
@@ -10,6 +10,7 @@ from utils import path_to_file_name
 
 class LocalizationTable(ParseObject):
     objects = dict()  # Dictionary to hold all LocalizationTable instances
+    has_output_file = False  # Only used to resolve table namespaces while parsing
     
     def _parse(self):
         self.table_namespace = self.source_data["StringTable"]["TableNamespace"]
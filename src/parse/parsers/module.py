@@ -3,7 +3,14 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from utils import ParseTarget, logger, path_to_id, get_json_data, asset_to_data, asset_path_to_data, parse_colon_colon, OPTIONS
+import math
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+from utils import ParseTarget, logger, path_to_id, get_json_data, asset_to_data, asset_path_to_data, parse_colon_colon, OPTIONS, JSON_FILE_CACHE, EXPORT_INDEX, SOURCE_MANIFEST, PHASE_PROFILER
+from options import set_options, get_options
+from optionsconfig import setup_logging
+from parsers.localization import Localization
 from parsers.localization_table import parse_localization
 
 from parsers.object import ParseObject
@@ -28,8 +35,11 @@ from parsers.image import parse_image_asset_path, Image
 
 from typing import Literal
 
+_MISSING = object() # a level without a value for a key
+
 class Module(ParseObject):
     objects = dict()
+    heavy_output = True
     
     def _parse(self): #Sparrow\Mechanics\Meta\Entities\Modules\DA_Module_ChassisRaven.json
         # Parse properties
@@ -123,28 +133,26 @@ class Module(ParseObject):
         })
         
         # Determine which stats need to be inverted (reciprocal taken of) based on if the stat has exponent/scaler that are negative
-        def format_stat_value(value, stat_type: Literal["primary", "secondary"]):
+        def format_stat_values(values: list, stat_type: Literal["primary", "secondary"]) -> list:
             stat_ref = parsed_scalars.get("primary_stat_ref") if stat_type == "primary" else parsed_scalars.get("secondary_stat_ref")
             if stat_ref is None:
-                return False
+                return [False] * len(values)
             stat_obj = ModuleStat.get_from_ref(stat_ref)
             if stat_obj is None:
                 logger.warning(f"Warning: Module {self.id} references {stat_type} ModuleStat {stat_ref} which does not exist")
-                return False
-            return stat_obj.format_value(value)
+                return [False] * len(values)
+            return stat_obj.format_values(values)
 
-        # Format PrimaryParameter and SecondaryParameter in level data
+        # Format PrimaryParameter and SecondaryParameter in level data, each over all levels at once
         levels_data = parsed_scalars.get("levels", {})
-        def invert(level):
-            if 'PrimaryParameter' in level:
-                level["PrimaryParameter"] = format_stat_value(level["PrimaryParameter"], "primary")
-            if 'SecondaryParameter' in level:
-                level["SecondaryParameter"] = format_stat_value(level["SecondaryParameter"], "secondary")
-
-        for level in levels_data.get("variables", []):
-            invert(level)
-        if "constants" in levels_data:
-            invert(levels_data["constants"])
+        levels = levels_data.get("variables", []) + ([levels_data["constants"]] if "constants" in levels_data else [])
+        for key, stat_type in (("PrimaryParameter", "primary"), ("SecondaryParameter", "secondary")):
+            levels_with_key = [level for level in levels if key in level]
+            if not levels_with_key:
+                continue
+            formatted_values = format_stat_values([level[key] for level in levels_with_key], stat_type)
+            for level, formatted_value in zip(levels_with_key, formatted_values):
+                level[key] = formatted_value
 
         module_name = parsed_scalars.get("module_name", None)
         if module_name is not None:
@@ -280,36 +288,36 @@ class Module(ParseObject):
         """
         Separates constants and variables from the data.
         Constants are those that do not change across levels.
-        Variables are those that change across levels.
+        Variables are those that change across levels, and those missing from the first level.
         """
-        
-        # Determine which stats are constants and which are not
+        if not levels_data:
+            return {}
+
+        # Determine which stats are not constants, in one pass over the levels
         first_level_data = levels_data[0]
         non_constants = dict() # {non_constant_key: True}
         for level in levels_data[1:]: # iterate levels starting from i=1
             for key, value in level.items():
-                if key in first_level_data and first_level_data[key] != value:
+                if key not in non_constants and first_level_data.get(key, _MISSING) != value:
                     non_constants[key] = True
-                
-        parsed_levels_variable_stats = [] # [levels] where level = {variable_stat_key: value}
-        parsed_constant_stats = dict() # {constant_stat_key: value}
-        for i, level in enumerate(levels_data):
-            parsed_level_variable_stats = dict()
-            for key, value in level.items():
-                if i == 0 and key not in non_constants: # if it's the first level and it's a constant, add it to parsed_constant_stats
-                    parsed_constant_stats[key] = value
-                if key in non_constants: # if it's not a constant, add it to parsed_level_variable_stats
-                    parsed_level_variable_stats[key] = level[key]
-
-            if parsed_level_variable_stats:
-                parsed_levels_variable_stats.append(parsed_level_variable_stats)
 
         ret = {}
+        parsed_constant_stats = {key: value for key, value in first_level_data.items() if key not in non_constants} # {constant_stat_key: value}
         if parsed_constant_stats:
             ret["constants"] = parsed_constant_stats
+        if not non_constants:
+            return ret
+
+        # Only the variables are picked out of each level, in the order of the first level, then of the levels missing them
+        variable_keys = [key for key in first_level_data if key in non_constants]
+        variable_keys.extend(key for key in non_constants if key not in first_level_data)
+        parsed_levels_variable_stats = [] # [levels] where level = {variable_stat_key: value}
+        for level in levels_data:
+            parsed_level_variable_stats = {key: level[key] for key in variable_keys if key in level}
+            if parsed_level_variable_stats:
+                parsed_levels_variable_stats.append(parsed_level_variable_stats)
         if parsed_levels_variable_stats:
             ret["variables"] = parsed_levels_variable_stats
-        
         return ret
 
     def _p_text_tags(self, data):
@@ -353,17 +361,88 @@ def find_module_element(path):
         return i, elem
     raise ValueError(f"Could not find module data in {path}")
 
+def _parse_module_file(modules_source_path: str, file: str):
+    full_path = os.path.join(modules_source_path, file)
+    element_index, module_element_data = find_module_element(full_path)
+    # replace the index in module_id with the index of the meat and potatoes element
+    file = f"{file.split('.')[0]}.{element_index}" # Cyclops.0 -> Cyclops.3 if the module data is the 4th element in the file
+    module_id = path_to_id(file)
+    logger.debug(f"Parsing {Module.__name__} {module_id} from {full_path}")
+    Module(module_id, module_element_data)
+
+def _init_module_worker(options, export_index, localizations: dict):
+    """
+    Initializes a parse_modules() worker process with the state of the main process that parsing modules relies on.
+    Module-level so it can be pickled to a worker process.
+    """
+    set_options(options)
+    setup_logging(log_file=options.log_file, log_level=options.log_level)
+    JSON_FILE_CACHE.configure(max_bytes=OPTIONS.json_cache_max_mb * 1024 * 1024)
+    EXPORT_INDEX.files, EXPORT_INDEX.export_dir = export_index.files, export_index.export_dir
+    Localization.objects.update(localizations)
+    ParseObject.drop_source_data = True # only the parsed state is sent back
+
+def _parse_module_batch(modules_source_path: str, files: list) -> tuple:
+    """
+    Parses a batch of module files in a worker process.
+    Every object created is removed from the worker's registries again, so each batch is parsed independently of the batches before it.
+    Module-level so it can be pickled to a worker process.
+    Returns:
+        (objects, image_paths, json_calls, json_bytes_read), see ParseObject.objects_since() for objects
+    """
+    # Resolved templates are forgotten too, as the objects and image paths created while resolving them are removed after each batch
+    ParseObject.clear_template_cache()
+    snapshot = ParseObject.registry_snapshot()
+    existing_image_paths = set(Image.image_paths)
+    json_calls, json_bytes_read = PHASE_PROFILER.json_reads()
+    for file in files:
+        _parse_module_file(modules_source_path, file)
+
+    objects = ParseObject.objects_since(snapshot, discard=True)
+    image_paths = [image_path for image_path in Image.image_paths if image_path not in existing_image_paths]
+    for image_path in image_paths:
+        del Image.image_paths[image_path]
+    end_json_calls, end_json_bytes_read = PHASE_PROFILER.json_reads()
+    return objects, image_paths, end_json_calls - json_calls, end_json_bytes_read - json_bytes_read
+
+def _parse_modules_in_workers(modules_source_path: str, files: list, num_workers: int):
+    """
+    Parses module files in batches in worker processes, then merges the objects of each batch into the registries in file order.
+    The registries end up with the same objects in the same order as parsing serially.
+    """
+    # Several batches per worker to balance the load. Objects shared between modules, i.e. ModuleRarity, are parsed once per batch that uses them.
+    batch_size = math.ceil(len(files) / (num_workers * 4))
+    batches = [files[i:i + batch_size] for i in range(0, len(files), batch_size)]
+    logger.debug(f"Parsing {len(files)} module files in {len(batches)} batches with {num_workers} worker processes")
+    # Spawned rather than forked, as forking while the profiler's sampler thread runs can deadlock
+    process_context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=num_workers, mp_context=process_context, initializer=_init_module_worker,
+                             initargs=(get_options(), EXPORT_INDEX, Localization.objects)) as executor:
+        results = list(executor.map(_parse_module_batch, [modules_source_path] * len(batches), batches))
+
+    object_batches = []
+    for batch, (objects, image_paths, json_calls, json_bytes_read) in zip(batches, results):
+        object_batches.append((f"{batch[0]}..{batch[-1]}", objects))
+        for image_path in image_paths:
+            Image(image_path)
+        PHASE_PROFILER.add_json_reads(json_calls, json_bytes_read)
+    num_objects = ParseObject.merge_objects(object_batches)
+    logger.debug(f"Merged {num_objects} objects parsed by module workers")
+
 def parse_modules(to_file=False):
     modules_source_path = os.path.join(OPTIONS.export_dir, r"WRFrontiers\Content\Sparrow\Mechanics\Meta\Entities\Modules")
-    for file in os.listdir(modules_source_path):
-        if file.endswith(".json"):
-            full_path = os.path.join(modules_source_path, file)
-            element_index, module_element_data = find_module_element(full_path)
-            # replace the index in module_id with the index of the meat and potatoes element
-            file = f"{file.split('.')[0]}.{element_index}" # Cyclops.0 -> Cyclops.3 if the module data is the 4th element in the file
-            module_id = path_to_id(file)
-            logger.debug(f"Parsing {Module.__name__} {module_id} from {full_path}")
-            module = Module(module_id, module_element_data)
+    # Batches of worker processes are merged in this order, so the registries have the same order regardless of MODULE_WORKERS
+    files = [file for file in os.listdir(modules_source_path) if file.endswith(".json")]
+
+    num_workers = min(OPTIONS.module_workers or os.cpu_count() or 1, len(files))
+    if num_workers > 1 and SOURCE_MANIFEST.enabled:
+        logger.debug("Parsing modules serially, as INCREMENTAL_MANIFEST_FILE tracks the objects each module creates in this process")
+        num_workers = 1
+    if num_workers <= 1:
+        for file in files:
+            _parse_module_file(modules_source_path, file)
+    else:
+        _parse_modules_in_workers(modules_source_path, files, num_workers)
 
     if to_file: # Condition prevents needlessly saving the same data multiple times, as it will also be saved if ran thru parse.py
         Module.to_file()
@@ -9,6 +9,7 @@ from loguru import logger
 
 class ModuleStat(ParseObject):
     objects = dict()  # Dictionary to hold all ModuleStat instances
+    _formatters = dict()  # {id: (ModuleStat, formatter)}, from get_formatter(). Kept off the instance so it is not output or pickled
     
     def _parse(self):
         props = self.source_data["Properties"]
@@ -31,6 +32,22 @@ class ModuleStat(ParseObject):
     
     def format_value(self, value):
         """Raw stat value is converted to the value that would be displayed in game."""
+        return self.get_formatter()(value)
+
+    def format_values(self, values: list) -> list:
+        """format_value() of each raw stat value, such as a stat's values over a module's levels."""
+        formatter = self.get_formatter()
+        return [formatter(value) for value in values]
+
+    def get_formatter(self):
+        """
+        Returns the function that format_value() applies, compiled from the unit attributes once per ModuleStat.
+        Warnings about the unit attributes are logged when it is compiled, rather than for every value.
+        """
+        cached = ModuleStat._formatters.get(self.id)
+        if cached is not None and cached[0] is self:
+            return cached[1]
+
         unit_baseline = getattr(self, "unit_baseline", 0.0)
         unit_scaler = getattr(self, "unit_scaler", 1.0)
         unit_exponent = getattr(self, "unit_exponent", 1.0)
@@ -40,7 +57,12 @@ class ModuleStat(ParseObject):
             logger.warning(f"New ModuleStat has both unit_exponent and unit_scaler. Please confirm the formula below is correct for these.")
         if unit_baseline not in [0.0, 1.0]:
             logger.warning(f"ModuleStat {self.id} has a non-standard baseline {unit_baseline}. Confirm the formula below is correct.")
-        return ((value - unit_baseline) * unit_scaler) ** unit_exponent
+
+        def formatter(value):
+            return ((value - unit_baseline) * unit_scaler) ** unit_exponent
+
+        ModuleStat._formatters[self.id] = (self, formatter)
+        return formatter
     
     def get_ui_value_format_indicator(self) -> str:
         """
@@ -3,12 +3,22 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from utils import OPTIONS, asset_to_asset_path, path_to_id, asset_path_to_file_path_and_index, get_json_data, logger, merge_dicts, asset_path_to_data, process_key_to_parser_function, sort_dict
+from utils import OPTIONS, asset_to_asset_path, path_to_id, asset_path_to_file_path_and_index, get_json_data, logger, merge_dicts, asset_path_to_data, process_key_to_parser_function, sort_dict, write_json_object_file, copy_containers, SOURCE_MANIFEST
+from parsers.image import Image
 
 import json
+import copy
 
 class ParseObject: #generic object that all classes extend
+    __slots__ = ()  # Subclasses still get a __dict__, unless they are a CompactParseObject
     objects = dict()  # Dictionary to hold all object instances
+    incremental = True  # Whether parsed objects are saved to and restored from SOURCE_MANIFEST
+    has_output_file = True  # Whether to_file() is called by parse.main's output stage
+    heavy_output = False  # Whether the output stage serializes this class in a worker process
+    drop_source_data = False  # Whether source_data is released after _parse(). Set on ParseObject from OPTIONS.drop_source_data by parse.main
+    memoize_templates = False  # Whether _parse_and_merge_template() resolves each template once per run. Only for classes whose _parse_from_data() does not set attributes on self
+    _resolved_templates = dict()  # {(class name, template asset path): merged template data}, see memoize_templates
+    _resolving_templates = []  # Asset paths of the template chain being resolved, to detect cycles
 
     def __init__(self, id: str = "", source_data: dict = {}):
         self.source_data = source_data
@@ -17,10 +27,115 @@ class ParseObject: #generic object that all classes extend
             return
         if id.startswith('OBJID_'):
             raise ValueError(f"Object ID should be just the ID, not the full reference: {id}")
-        self._parse()
+        if SOURCE_MANIFEST.enabled and self.incremental:
+            self._parse_incremental()
+        else:
+            self._parse()
+        if self.drop_source_data:
+            del self.source_data
 
         self.objects[id] = self  # Store the instance in the class dictionary
 
+    def _parse_incremental(self):
+        """
+        _parse() while SOURCE_MANIFEST tracks the files and objects it consumes.
+        A top-level object whose files are unchanged since the last run is instead restored, along with the objects it created.
+        """
+        if SOURCE_MANIFEST.in_unit():
+            SOURCE_MANIFEST.push_object()
+            self._parse()
+            SOURCE_MANIFEST.pop_object(self)
+            return
+
+        unit = SOURCE_MANIFEST.start_unit(self.__class__.__name__, self.id)
+        if unit is not None:
+            logger.debug(f"Restoring unchanged {self.__class__.__name__} {self.id}")
+            self._restore_unit(unit)
+            return
+        self._parse()
+        SOURCE_MANIFEST.pop_object(self)
+        SOURCE_MANIFEST.end_unit()
+
+    def _restore_unit(self, unit: dict):
+        classes = {cls.__name__: cls for cls in ParseObject._all_subclasses()}
+        for class_name, obj_id, state, _ in unit["objects"]:
+            if class_name == self.__class__.__name__ and obj_id == self.id:
+                self._set_state(copy.deepcopy(state))
+                continue
+            cls = classes[class_name]
+            if obj_id in cls.objects:
+                continue  # already created this run by another object
+            obj = cls.__new__(cls)
+            obj._set_state(copy.deepcopy(state))
+            cls.objects[obj_id] = obj
+        for image_path in unit["image_paths"]:
+            Image(image_path)
+
+    @classmethod
+    def _all_subclasses(cls):
+        for subclass in cls.__subclasses__():
+            yield subclass
+            yield from subclass._all_subclasses()
+
+    @staticmethod
+    def _registry_classes() -> dict:
+        """{class name: class} of every subclass with its own objects registry"""
+        return {cls.__name__: cls for cls in ParseObject._all_subclasses() if 'objects' in cls.__dict__}
+
+    @staticmethod
+    def registry_snapshot() -> dict:
+        """{class name: set of object ids} of every registry, to later find the objects created since with objects_since()"""
+        return {class_name: set(cls.objects) for class_name, cls in ParseObject._registry_classes().items()}
+
+    @staticmethod
+    def objects_since(snapshot: dict, discard: bool = False) -> list:
+        """
+        Returns [(class name, object id, state)] of every object created since snapshot, in creation order within each class.
+        State is the object's to_dict(), which can be pickled and restored with _set_state().
+        discard: Also remove these objects from their registries, restoring the registries to the snapshot.
+        """
+        created = []
+        for class_name, cls in ParseObject._registry_classes().items():
+            existing = snapshot.get(class_name, set())
+            new_ids = [obj_id for obj_id in cls.objects if obj_id not in existing]
+            for obj_id in new_ids:
+                created.append((class_name, obj_id, cls.objects[obj_id].to_dict()))
+            if discard:
+                for obj_id in new_ids:
+                    del cls.objects[obj_id]
+        return created
+
+    @staticmethod
+    def merge_objects(batches: list) -> int:
+        """
+        Adds the objects of each batch from objects_since() to the registries, i.e. objects parsed in worker processes.
+        Batches are merged in the order given, so registry order only depends on that order.
+        An object in several batches is kept once, and must have the same state in each, else it is a conflict.
+        Args:
+            batches: [(batch name, [(class name, object id, state)])], the name is only used in errors
+        Returns:
+            Number of objects added
+        """
+        classes = ParseObject._registry_classes()
+        merged_from = dict() # {(class name, object id): batch name}, of objects merged here
+        num_added = 0
+        for batch_name, objects in batches:
+            for class_name, obj_id, state in objects:
+                cls = classes[class_name]
+                key = (class_name, obj_id)
+                existing = cls.objects.get(obj_id)
+                if existing is not None:
+                    if existing.to_dict() != state:
+                        source = f"batch {merged_from[key]}" if key in merged_from else "the main process"
+                        raise ValueError(f"Conflict merging {class_name} {obj_id}: parsed differently in batch {batch_name} than in {source}")
+                    continue
+                obj = cls.__new__(cls)
+                obj._set_state(state)
+                cls.objects[obj_id] = obj
+                merged_from[key] = batch_name
+                num_added += 1
+        return num_added
+
     def _parse(self):
         """
         This method should be overridden by subclasses to parse the source data.
@@ -46,26 +161,47 @@ class ParseObject: #generic object that all classes extend
     def _parse_and_merge_template(self, template: dict):
         """
         Recursively parse and merge template ability data.
+        With memoize_templates, the merged data of each template is resolved once, and every caller gets its own copy of it.
         """
         asset_path = asset_to_asset_path(template)
-        template_data = asset_path_to_data(asset_path)
-        base_template_data = {}
-        if template_data and "Template" in template_data:
-            base_template_data = self._parse_and_merge_template(template_data["Template"])
-        parsed_template_data = self._parse_from_data(template_data) if template_data else {}
-        return merge_dicts(base_template_data, parsed_template_data)
+        if asset_path in ParseObject._resolving_templates:
+            chain = ParseObject._resolving_templates[ParseObject._resolving_templates.index(asset_path):] + [asset_path]
+            raise ValueError(f"Template cycle in {self.__class__.__name__} {self.id}: {' -> '.join(chain)}")
+        # An incremental unit must read the template files itself to record them as its sources
+        memoize = self.memoize_templates and not SOURCE_MANIFEST.enabled
+        key = (self.__class__.__name__, asset_path)
+        if memoize and key in ParseObject._resolved_templates:
+            return copy_containers(ParseObject._resolved_templates[key])
+
+        ParseObject._resolving_templates.append(asset_path)
+        try:
+            template_data = asset_path_to_data(asset_path)
+            base_template_data = {}
+            if template_data and "Template" in template_data:
+                base_template_data = self._parse_and_merge_template(template_data["Template"])
+            parsed_template_data = self._parse_from_data(template_data) if template_data else {}
+            merged_template_data = merge_dicts(base_template_data, parsed_template_data)
+        finally:
+            ParseObject._resolving_templates.pop()
+        if memoize:
+            ParseObject._resolved_templates[key] = copy_containers(merged_template_data)
+        return merged_template_data
+
+    @staticmethod
+    def clear_template_cache():
+        """Forgets every template resolved with memoize_templates"""
+        ParseObject._resolved_templates.clear()
 
     def to_dict(self):
         """
         Returns a dictionary representation of the object, excluding source_data.
+        The object itself is left unchanged; attribute values are shared, not copied.
         """
-        obj_as_dict = self.__dict__
-   
-        keys_to_remove = ['source_data']
-        for key in keys_to_remove:
-            if key in obj_as_dict:
-                del obj_as_dict[key]
-        return obj_as_dict
+        return {key: value for key, value in self.__dict__.items() if key != 'source_data'}
+
+    def _set_state(self, state: dict):
+        """Sets attributes from a to_dict() representation"""
+        self.__dict__.update(state)
 
     @classmethod
     def get_from_id(cls, id, default=None):
@@ -73,6 +209,8 @@ class ParseObject: #generic object that all classes extend
         Returns an object from the class dictionary by its ID, else default
         """
         # yes, this is a .get() wrapper. I know. Consider it paranoid future proofing.
+        if SOURCE_MANIFEST.enabled:
+            SOURCE_MANIFEST.record_use(cls.__name__, id)
         return cls.objects.get(id, default)
 
     @classmethod
@@ -149,7 +287,10 @@ class ParseObject: #generic object that all classes extend
     @classmethod
     def get_from_ref(cls, ref: str):
         """Get an object from it's reference string (see to_ref())"""
-        return cls.objects[(cls.ref_to_id(ref))]
+        id = cls.ref_to_id(ref)
+        if SOURCE_MANIFEST.enabled:
+            SOURCE_MANIFEST.record_use(cls.__name__, id)
+        return cls.objects[id]
     
     @classmethod
     def objects_to_dict(cls):
@@ -168,9 +309,57 @@ class ParseObject: #generic object that all classes extend
         """
         return json.dumps(cls.objects_to_dict(), indent=4, ensure_ascii=False)
     
+    @classmethod
+    def output_file_path(cls):
+        return os.path.join(OPTIONS.output_dir, 'Objects', f'{cls.__name__}.json')
+
+    @classmethod
+    def sorted_object_dicts(cls):
+        """
+        Returns (id, dict representation) of all objects in sorted id order, the same order as objects_to_dict()
+        """
+        return [(obj_id, cls.objects[obj_id].to_dict()) for obj_id in sorted(cls.objects)]
+
     @classmethod
     def to_file(cls):
         os.makedirs(os.path.join(OPTIONS.output_dir, 'Objects'), exist_ok=True)
-        file_path = os.path.join(OPTIONS.output_dir, 'Objects', f'{cls.__name__}.json')
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(cls.to_json())
\ No newline at end of file
+        # Same output as to_json(), written one object at a time
+        write_json_object_file(cls.output_file_path(), ((obj_id, cls.objects[obj_id].to_dict()) for obj_id in sorted(cls.objects)))
+
+class CompactParseObject(ParseObject):
+    """
+    A ParseObject stored in __slots__ instead of a per-instance __dict__, for fixed-shape classes with a very large number of objects.
+    Subclasses list their attributes in __slots__. source_data is only available during _parse().
+    to_ref(), to_dict(), objects_to_dict() and the output file are the same as for an equivalent ParseObject.
+    """
+    __slots__ = ('source_data', 'id')
+
+    def __init__(self, id: str = "", source_data: dict = {}):
+        super().__init__(id, source_data)
+        if hasattr(self, 'source_data'):
+            del self.source_data
+
+    @classmethod
+    def _fields(cls):
+        """Attribute names in the order they are output, the same order a ParseObject's __dict__ would have"""
+        fields = cls.__dict__.get('_cached_fields')
+        if fields is None:
+            fields = tuple(name for klass in reversed(cls.__mro__) for name in klass.__dict__.get('__slots__', ()) if name != 'source_data')
+            cls._cached_fields = fields
+        return fields
+
+    def to_dict(self):
+        """
+        Returns a dictionary representation of the object, excluding source_data and attributes that were never set.
+        """
+        obj_as_dict = dict()
+        for name in self._fields():
+            try:
+                obj_as_dict[name] = getattr(self, name)
+            except AttributeError:
+                pass
+        return obj_as_dict
+
+    def _set_state(self, state: dict):
+        for key, value in state.items():
+            setattr(self, key, value)
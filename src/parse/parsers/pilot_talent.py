@@ -5,7 +5,7 @@ import os
 from loguru import logger
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from parse.parsers.ability import p_actor_class
+from parsers.ability import p_actor_class
 from parsers.object import ParseObject
 from parsers.localization_table import parse_localization
 from parsers.image import parse_image_asset_path
@@ -3,9 +3,10 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from parsers.object import ParseObject
+from parsers.object import CompactParseObject
 
-class UpgradeCost(ParseObject):
+class UpgradeCost(CompactParseObject):  # One per module level and currency, the most numerous objects
+    __slots__ = ('currency_ref', 'amount')
     objects = dict()  # Dictionary to hold all UpgradeCost instances
 
     def __init__(self, id, currency_ref, amount):
@@ -6,9 +6,11 @@ import json
 # Add parent dirs to sys path for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from utils import logger
+from utils import logger, EXPORT_INDEX
 from options import OPTIONS
 
+IMAGE_EXTENSIONS = [".png", ".jpg", ".jpeg", ".svg"] # in order of preference
+
 def read_img_list(file_path):
     """Reads a list of parsed images from a given json file path."""
     with open(file_path, 'r', encoding='utf-8') as f:
@@ -20,6 +22,9 @@ def get_texture_list():
     parsed_imgs = read_img_list(parsed_imgs_list_file_path)
     logger.info(f"Total parsed images: {len(parsed_imgs)}")
 
+    if not EXPORT_INDEX.is_built_for(OPTIONS.export_dir):
+        EXPORT_INDEX.build(OPTIONS.export_dir, OPTIONS.export_index_file)
+
     texture_paths = [] #includes the extension that will be located
     num_passed = 0
     for img_path in parsed_imgs:
@@ -27,11 +32,16 @@ def get_texture_list():
         
         # The export img does not specify a file extension, so we need to find the actual file
         full_img_path = None
-        for ext in [".png", ".jpg", ".jpeg", ".svg"]:
-            candidate_path = export_img_path + ext
-            if os.path.exists(candidate_path):
-                full_img_path = candidate_path
-                break
+        ext = EXPORT_INDEX.find_extension(img_path.lstrip("/"), IMAGE_EXTENSIONS)
+        if ext is not None:
+            full_img_path = export_img_path + ext
+        else:
+            # The index is case-sensitive, probe the disk as a case-insensitive export may still have the file
+            for ext in IMAGE_EXTENSIONS:
+                candidate_path = export_img_path + ext
+                if os.path.exists(candidate_path):
+                    full_img_path = candidate_path
+                    break
 
         if not full_img_path:
             file_name = os.path.basename(export_img_path)
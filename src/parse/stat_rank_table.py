@@ -0,0 +1,71 @@
+"""
+Columnar module × stat table of level diffs, ranked per stat.
+
+Analysis ranks every module on each stat by its percent increase from base to max level.
+The table is built once from level_diffs_by_module: one row per module, one column per
+ranked stat, and a cell wherever the module has the stat. Modules mostly have the few stats
+of their category, so only the cells are kept. Each column is ranked, and every view
+(ranks per stat, percentiles per module, level diffs per stat) is read from the ranked columns.
+
+Ranking
+-------
+Modules with the stat are sorted by their increase, ascending when more is better and
+descending otherwise, stably in module order. Increases that are not numbers ("+5.0",
+an increase from 0) sort before every number. The last module of the sort gets rank 0,
+the first gets rank n - 1, and a module's percentile on a stat is rank / n.
+"""
+
+class StatRankTable:
+    """
+    Args:
+        level_diffs_by_module: {<module_ref>: {'stats_percent_increase': {<stat_key>: <increase>}}}
+        more_is_better_by_stat: {<stat_key>: <bool>} for each stat to rank
+    """
+    def __init__(self, level_diffs_by_module: dict, more_is_better_by_stat: dict):
+        self.level_diffs_by_module = level_diffs_by_module
+        self.module_ids = list(level_diffs_by_module)
+        self.stat_keys = sorted(more_is_better_by_stat)
+        self.more_is_better = [more_is_better_by_stat[stat_key] for stat_key in self.stat_keys]
+
+        # Cells of each column in one pass, in module order: (row, increase)
+        cells_by_stat = {stat_key: [] for stat_key in self.stat_keys}
+        for row, module_diff_data in enumerate(level_diffs_by_module.values()):
+            for stat_key, increase in module_diff_data['stats_percent_increase'].items():
+                cells = cells_by_stat.get(stat_key)
+                if cells is not None:
+                    cells.append((row, float('-inf') if isinstance(increase, str) else increase))
+
+        # Module rows of each column, from rank 0 up
+        self.ranked_rows = []
+        for cells, more_is_better in zip(cells_by_stat.values(), self.more_is_better):
+            cells.sort(key=lambda cell: cell[1], reverse=not more_is_better)
+            self.ranked_rows.append([row for row, _ in reversed(cells)])
+
+    def ranks_by_stat(self) -> dict:
+        """{<stat_key>: {<module_ref>: <rank>}}, in rank order"""
+        module_ids = self.module_ids
+        return {
+            stat_key: {module_ids[row]: rank for rank, row in enumerate(column_rows)}
+            for stat_key, column_rows in zip(self.stat_keys, self.ranked_rows)
+        }
+
+    def percentiles_by_module(self) -> dict:
+        """{<module_ref>: {<stat_key>: <rank / modules with the stat>}} for every module, stats in sorted order"""
+        percentiles = [{} for _ in self.module_ids]
+        for stat_key, column_rows in zip(self.stat_keys, self.ranked_rows):
+            count = len(column_rows)
+            for rank, row in enumerate(column_rows):
+                percentiles[row][stat_key] = rank / count
+        return dict(zip(self.module_ids, percentiles))
+
+    def level_diffs_by_stat(self) -> dict:
+        """{<stat_key>: {<module_ref>: <increase>}}, in rank order"""
+        module_ids = self.module_ids
+        level_diffs_by_module = self.level_diffs_by_module
+        return {
+            stat_key: {
+                module_ids[row]: level_diffs_by_module[module_ids[row]]['stats_percent_increase'][stat_key]
+                for row in column_rows
+            }
+            for stat_key, column_rows in zip(self.stat_keys, self.ranked_rows)
+        }
@@ -11,6 +11,7 @@ from options import set_options
 from parse.parse import main as parse_main
 from push.push import main as push_main
 from parse.process_parsed_images import main as process_images_main
+from utils import PHASE_PROFILER
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
@@ -72,6 +73,7 @@ def main():
         logger.debug(f"should_push_data is set to {options.should_push_data}, proceeding with pushing data.")
         push_main()
 
+    PHASE_PROFILER.log_summary()
     logger.info(f"WRFrontiersDB-Parser@run.py finished at time {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
 
 if __name__ == "__main__":
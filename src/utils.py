@@ -6,19 +6,111 @@ import os
 from loguru import logger
 import shutil
 import re
+import threading
+import hashlib
+import time
+import psutil
+from contextlib import contextmanager
+from collections import OrderedDict
 from options import OPTIONS
 
 ###############################
 #             FILE            #
 ###############################
 
-def get_json_data(file_path: str, index: int | None = None) -> dict:
+class JsonFileCache:
+    """
+    Process-wide LRU cache of decoded export files, keyed by normalized file path.
+
+    Entries are invalidated when the file's mtime or size changes. The memory budget is
+    measured in bytes of source file, which is a cheap and stable proxy for the decoded size.
+    Cached data is shared between callers and must be treated as read-only.
+    """
+    def __init__(self, max_bytes: int = 1024 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict() # {file_path: (mtime_ns, size, data)}
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bytes_read = 0
+
+    def configure(self, max_bytes: int) -> None:
+        """Set the memory budget, evicting entries if the cache is now over it. 0 disables caching."""
+        with self._lock:
+            self.max_bytes = max_bytes
+            self._evict()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+    def get(self, file_path: str):
+        """Returns the decoded content of file_path, loading it from disk on a miss."""
+        key = normalize_path(file_path)
+        stat = os.stat(key)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[2]
+            self.misses += 1
+
+        with open(key, encoding='utf-8') as file:
+            data = json.load(file)
+
+        with self._lock:
+            self.bytes_read += stat.st_size
+            if self.max_bytes > 0 and stat.st_size <= self.max_bytes:
+                if key in self._entries:
+                    self._total_bytes -= self._entries.pop(key)[1]
+                self._entries[key] = (stat.st_mtime_ns, stat.st_size, data)
+                self._total_bytes += stat.st_size
+                self._evict()
+        return data
+
+    def _evict(self) -> None:
+        while self._entries and self._total_bytes > self.max_bytes:
+            _, (_, size, _) = self._entries.popitem(last=False)
+            self._total_bytes -= size
+            self.evictions += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'cached_bytes': self._total_bytes,
+                'max_bytes': self.max_bytes,
+                'bytes_read': self.bytes_read,
+            }
+
+# Create the singleton instance, import this
+JSON_FILE_CACHE = JsonFileCache()
+
+def get_json_data(file_path: str, index: int | None = None, use_cache: bool = True) -> dict:
     """
     Reads a JSON file and returns its content.
+    Served from JSON_FILE_CACHE unless use_cache is False. Cached data is shared, so it must not be mutated.
+    Recorded in SOURCE_MANIFEST during an incremental parse.
     """
+    if SOURCE_MANIFEST.enabled:
+        SOURCE_MANIFEST.record_file(file_path)
+    PHASE_PROFILER.json_calls += 1
     data = None
-    with open(file_path, encoding='utf-8') as file:
-        data = json.load(file)
+    if use_cache:
+        data = JSON_FILE_CACHE.get(file_path)
+    else:
+        with open(file_path, encoding='utf-8') as file:
+            PHASE_PROFILER.json_uncached_bytes += os.fstat(file.fileno()).st_size
+            data = json.load(file)
     if data is None:
         raise ValueError(f"Error: {file_path} is empty or not a valid JSON file.")
     elif index is not None and isinstance(data, list):
@@ -28,6 +120,420 @@ def get_json_data(file_path: str, index: int | None = None) -> dict:
         logger.trace(f"Loaded data from {file_path}")
     return data
 
+def stream_json_object(f, items) -> None:
+    """
+    Writes (key, value) pairs to the file handle f as one JSON object, serializing one value at a time,
+    so the whole object never exists as a string in memory.
+    Output is identical to json.dump(dict(items), f, indent=4, ensure_ascii=False).
+    """
+    f.write("{")
+    is_empty = True
+    for key, value in items:
+        value_json = json.dumps(value, indent=4, ensure_ascii=False).replace("\n", "\n    ")
+        f.write(f"{'' if is_empty else ','}\n    {json.dumps(key, ensure_ascii=False)}: {value_json}")
+        is_empty = False
+    f.write("}" if is_empty else "\n}")
+
+def write_json_object_file(file_path: str, items) -> None:
+    """Writes (key, value) pairs to file_path with stream_json_object(). Module-level so it can be pickled to a worker process."""
+    with open(file_path, 'w', encoding='utf-8') as f:
+        stream_json_object(f, items)
+
+def timed_call(func, *args) -> float:
+    """Calls func(*args) and returns its wall time in seconds. Module-level so it can be pickled to a worker process."""
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+class ExportIndex:
+    """
+    One-time scan of the export directory, so resolving asset paths and probing file extensions become dict lookups.
+
+    Files are keyed by their path relative to the export dir, with forward slashes and without extension,
+    i.e. "WRFrontiers/Content/Sparrow/Mechanics/DA_Meta_Root" -> {".json": "<export_dir>/WRFrontiers/Content/Sparrow/Mechanics/DA_Meta_Root.json"}
+    Optionally persisted to an index file so later runs against the same export skip the scan.
+    """
+    INDEX_FILE_VERSION = 2
+
+    def __init__(self):
+        self.export_dir = None # as passed to build(), compared against OPTIONS.export_dir before use
+        self.files = dict() # {relative_stem: {extension: normalized_file_path}}
+
+    @staticmethod
+    def _dirs_unmodified(export_dir: str, dir_mtimes_ns: dict) -> bool:
+        """
+        Whether every directory of a saved index still has its saved mtime.
+        A directory's mtime changes when a file or directory is added to, removed from or renamed in it, which covers
+        every change to the indexed file names, so only the saved directories are stat'ed rather than walking the tree again.
+        """
+        for relative_dir, mtime_ns in dir_mtimes_ns.items():
+            try:
+                if os.stat(os.path.join(export_dir, relative_dir)).st_mtime_ns != mtime_ns:
+                    return False
+            except OSError:
+                return False
+        return True
+
+    def build(self, export_dir, index_file=None) -> None:
+        """Scan export_dir, or load the index from index_file if it was saved for the same export and no directory in it changed since."""
+        normalized_export_dir = normalize_path(str(export_dir))
+
+        stems = None
+        if index_file is not None and os.path.exists(index_file):
+            saved = get_json_data(index_file, use_cache=False)
+            if saved.get("version") == self.INDEX_FILE_VERSION and saved.get("export_dir") == normalized_export_dir and self._dirs_unmodified(normalized_export_dir, saved["dir_mtimes_ns"]):
+                stems = saved["files"]
+                logger.debug(f"Loaded export index of {len(stems)} assets from {index_file}")
+            else:
+                logger.debug(f"Export index {index_file} is stale, rescanning {normalized_export_dir}")
+
+        if stems is None:
+            stems = dict() # {relative_stem: [extension]}
+            dir_mtimes_ns = dict() # {relative_dir: mtime_ns}
+            for dir_path, _, file_names in os.walk(normalized_export_dir):
+                relative_dir = os.path.relpath(dir_path, normalized_export_dir).replace('\\', '/')
+                dir_mtimes_ns[relative_dir] = os.stat(dir_path).st_mtime_ns
+                for file_name in file_names:
+                    stem, ext = os.path.splitext(file_name)
+                    relative_stem = stem if relative_dir == '.' else f"{relative_dir}/{stem}"
+                    stems.setdefault(relative_stem, []).append(ext)
+            logger.debug(f"Indexed {len(stems)} assets in {normalized_export_dir}")
+            if index_file is not None:
+                os.makedirs(os.path.dirname(os.path.abspath(index_file)), exist_ok=True)
+                with open(index_file, 'w', encoding='utf-8') as f:
+                    json.dump({
+                        "version": self.INDEX_FILE_VERSION,
+                        "export_dir": normalized_export_dir,
+                        "dir_mtimes_ns": dir_mtimes_ns,
+                        "files": stems,
+                    }, f, ensure_ascii=False)
+
+        self.files = {
+            relative_stem: {ext: normalize_path(os.path.join(normalized_export_dir, relative_stem + ext)) for ext in exts}
+            for relative_stem, exts in stems.items()
+        }
+        self.export_dir = export_dir
+
+    def is_built_for(self, export_dir) -> bool:
+        return self.export_dir is not None and self.export_dir == export_dir
+
+    def get_file_path(self, relative_stem: str, ext: str) -> str | None:
+        """Returns the normalized path of relative_stem + ext, or None if no such file was indexed."""
+        exts = self.files.get(relative_stem)
+        if exts is None:
+            return None
+        return exts.get(ext)
+
+    def find_extension(self, relative_stem: str, exts: list) -> str | None:
+        """Returns the first of exts that relative_stem exists with, or None."""
+        indexed_exts = self.files.get(relative_stem)
+        if indexed_exts is None:
+            return None
+        for ext in exts:
+            if ext in indexed_exts:
+                return ext
+        return None
+
+# Create the singleton instance, import this
+EXPORT_INDEX = ExportIndex()
+
+class SourceManifest:
+    """
+    Records the export files consumed while parsing, so a later run only re-parses objects whose source files changed.
+
+    Parsing is tracked in units. A unit is one top-level ParseObject construction (i.e. by a parse_* function) plus every
+    object created while it parsed, and is restored or re-parsed as a whole. Each object depends on the files read while
+    it parsed, including by the objects it created, and on the files of already existing objects it looked up.
+    Files read just before an object is created are its own source file, i.e. create_from_asset_path() reading the asset,
+    so an object also depends on the files its creator read since the creator's previous object.
+    Files are keyed by their path relative to the export dir and compared by sha1, so units carry over between the export
+    dirs of different game versions. A change in any fingerprint file (parser code, localization) invalidates every unit.
+    """
+    MANIFEST_VERSION = 1
+
+    def __init__(self):
+        self.enabled = False # only tracks between load() and save()
+        self.export_dir = None
+        self.fingerprint = None
+        self.previous_files = dict() # {relative_path: [size, mtime_ns, sha1]} of the loaded manifest
+        self.previous_units = dict() # {unit_key: unit} of the loaded manifest
+        self.files = dict() # {relative_path: [size, mtime_ns, sha1]} hashed this run, None if missing
+        self.units = dict() # {unit_key: unit} parsed or restored this run
+        self.object_files = dict() # {object_key: [relative_path]} of objects parsed or restored this run
+        self.restored = 0
+        self.parsed = 0
+        self._pending_files = set() # read outside of a unit, claimed by the next unit
+        self._current = None # unit being parsed
+        self._stack = [] # (files, recent_files) of the objects being parsed, innermost last
+
+    @staticmethod
+    def key(class_name: str, obj_id: str) -> str:
+        return f"{class_name}::{obj_id}"
+
+    @staticmethod
+    def _hash_file(file_path) -> str:
+        sha1 = hashlib.sha1()
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                sha1.update(chunk)
+        return sha1.hexdigest()
+
+    def load(self, manifest_file, export_dir, fingerprint_files: list) -> None:
+        """Start tracking, and load the units of manifest_file if it was saved with the same fingerprint."""
+        self.__init__()
+        self.export_dir = normalize_path(str(export_dir))
+
+        fingerprint = hashlib.sha1()
+        for file_path in sorted(normalize_path(str(file_path)) for file_path in fingerprint_files):
+            fingerprint.update(os.path.basename(file_path).encode('utf-8'))
+            fingerprint.update(self._hash_file(file_path).encode('utf-8'))
+        self.fingerprint = fingerprint.hexdigest()
+
+        if not os.path.exists(manifest_file):
+            logger.info(f"No source manifest at {manifest_file}, parsing everything")
+        else:
+            saved = get_json_data(manifest_file, use_cache=False)
+            if saved.get("version") != self.MANIFEST_VERSION or saved.get("fingerprint") != self.fingerprint:
+                logger.info(f"Parser code or localization changed since {manifest_file} was saved, parsing everything")
+            else:
+                self.previous_files = saved["files"]
+                self.previous_units = saved["units"]
+                logger.debug(f"Loaded source manifest of {len(self.previous_units)} units from {manifest_file}")
+        self.enabled = True
+
+    def _relative_path(self, file_path) -> str | None:
+        """Path relative to the export dir, or None if file_path is not in it."""
+        try:
+            relative_path = os.path.relpath(normalize_path(str(file_path)), self.export_dir).replace('\\', '/')
+        except ValueError: # on another drive
+            return None
+        return None if relative_path.startswith('../') else relative_path
+
+    def _file_entry(self, relative_path: str) -> list | None:
+        """[size, mtime_ns, sha1] of the file currently on disk. Only rehashed if its size or mtime changed since the loaded manifest."""
+        if relative_path in self.files:
+            return self.files[relative_path]
+        file_path = os.path.join(self.export_dir, relative_path)
+        if not os.path.exists(file_path):
+            entry = None
+        else:
+            stat = os.stat(file_path)
+            previous = self.previous_files.get(relative_path)
+            if previous is not None and previous[0] == stat.st_size and previous[1] == stat.st_mtime_ns:
+                entry = previous
+            else:
+                entry = [stat.st_size, stat.st_mtime_ns, self._hash_file(file_path)]
+        self.files[relative_path] = entry
+        return entry
+
+    def record_file(self, file_path) -> None:
+        relative_path = self._relative_path(file_path)
+        if relative_path is None:
+            return
+        self._file_entry(relative_path)
+        if self._stack:
+            files, recent_files = self._stack[-1]
+            files.add(relative_path)
+            recent_files.add(relative_path)
+        else:
+            self._pending_files.add(relative_path)
+
+    def record_use(self, class_name: str, obj_id: str) -> None:
+        """Makes the object being parsed depend on the files of an existing object it looked up."""
+        if not self._stack:
+            return
+        object_files = self.object_files.get(self.key(class_name, obj_id))
+        if object_files is not None:
+            self._stack[-1][0].update(object_files)
+
+    def record_image_path(self, image_path: str) -> None:
+        if self._current is not None:
+            self._current["image_paths"].add(image_path)
+
+    def in_unit(self) -> bool:
+        return self._current is not None
+
+    def push_object(self) -> None:
+        """Called before parsing an object within the current unit."""
+        _, parent_recent_files = self._stack[-1]
+        self._stack.append((set(parent_recent_files), set()))
+        parent_recent_files.clear()
+
+    def pop_object(self, obj) -> None:
+        """Called after parsing obj, see push_object()"""
+        files, _ = self._stack.pop()
+        if self._stack:
+            parent_files, parent_recent_files = self._stack[-1]
+            parent_files.update(files)
+            parent_recent_files.clear()
+        self.object_files[self.key(type(obj).__name__, obj.id)] = sorted(files)
+        self._current["objects"].append(obj)
+
+    def start_unit(self, class_name: str, obj_id: str) -> dict | None:
+        """
+        Called before parsing a top-level object.
+        Returns:
+            The saved unit if its files are unchanged, for the caller to restore instead of parsing.
+            Else None, and the object is tracked as the top of a new unit until end_unit().
+        """
+        unit_key = self.key(class_name, obj_id)
+        claimed_files = self._pending_files
+        self._pending_files = set()
+
+        unit = self.previous_units.get(unit_key)
+        # The top-level object's own source file must be one it was parsed from before
+        if unit is not None and claimed_files.issubset(unit["files"]) and all(self._is_file_unchanged(relative_path) for relative_path in unit["files"]):
+            self.units[unit_key] = unit
+            for obj_class_name, obj_id, _, files in unit["objects"]:
+                self.object_files[self.key(obj_class_name, obj_id)] = files
+            self.restored += 1
+            return unit
+
+        self._current = {"key": unit_key, "objects": [], "image_paths": set()}
+        self._stack.append((claimed_files, set()))
+        return None
+
+    def end_unit(self) -> None:
+        """Snapshots the state of every object created in the current unit, after pop_object() of the top-level object."""
+        current = self._current
+        self._current = None
+        objects = []
+        for obj in current["objects"]:
+            state = obj.to_dict()
+            object_key = self.key(type(obj).__name__, obj.id)
+            objects.append([type(obj).__name__, obj.id, json.loads(json.dumps(state)), self.object_files[object_key]])
+        self.units[current["key"]] = {
+            "files": self.object_files[current["key"]], # the top-level object's files include all others
+            "objects": objects,
+            "image_paths": sorted(current["image_paths"]),
+        }
+        self.parsed += 1
+
+    def _is_file_unchanged(self, relative_path: str) -> bool:
+        previous = self.previous_files.get(relative_path)
+        current = self._file_entry(relative_path)
+        return previous is not None and current is not None and previous[2] == current[2]
+
+    def save(self, manifest_file) -> None:
+        """Saves the units of this run and stops tracking."""
+        files = dict()
+        for unit in self.units.values():
+            for relative_path in unit["files"]:
+                files[relative_path] = self.files[relative_path]
+        os.makedirs(os.path.dirname(os.path.abspath(manifest_file)), exist_ok=True)
+        with open(manifest_file, 'w', encoding='utf-8') as f:
+            json.dump({
+                "version": self.MANIFEST_VERSION,
+                "fingerprint": self.fingerprint,
+                "files": files,
+                "units": self.units,
+            }, f, ensure_ascii=False)
+        self.enabled = False
+        logger.debug(f"Saved source manifest of {len(self.units)} units to {manifest_file}")
+
+    def stats(self) -> dict:
+        return {
+            "restored_units": self.restored,
+            "parsed_units": self.parsed,
+            "checked_files": sum(1 for entry in self.files.values() if entry is not None),
+        }
+
+# Create the singleton instance, import this
+SOURCE_MANIFEST = SourceManifest()
+
+class PhaseProfiler:
+    """
+    Records the wall time, CPU time, peak RSS and get_json_data() reads of each named phase of a run.
+    CPU time includes threads, and worker processes that finished during the phase.
+    Peak RSS is sampled by a background thread with psutil, so spikes shorter than the sample interval can be missed.
+    """
+    def __init__(self, sample_interval: float = 0.05):
+        self.sample_interval = sample_interval
+        self.phases = [] # [{name, wall_s, cpu_s, peak_rss_mb, end_rss_mb, json_calls, json_bytes_read, tasks}]
+        self.json_calls = 0 # incremented by get_json_data()
+        self.json_uncached_bytes = 0 # bytes read by get_json_data() with use_cache=False
+        self._process = psutil.Process()
+        self._current = None
+
+    def _cpu_seconds(self) -> float:
+        cpu_times = self._process.cpu_times()
+        return cpu_times.user + cpu_times.system + cpu_times.children_user + cpu_times.children_system
+
+    def _sample_peak_rss(self, stop: threading.Event, peak: list) -> None:
+        while not stop.wait(self.sample_interval):
+            peak[0] = max(peak[0], self._process.memory_info().rss)
+
+    @contextmanager
+    def phase(self, name: str):
+        """Context manager that records the enclosed code as one phase. Phases are not nested."""
+        phase = {"name": name, "tasks": dict()}
+        peak = [self._process.memory_info().rss]
+        stop = threading.Event()
+        sampler = threading.Thread(target=self._sample_peak_rss, args=(stop, peak), daemon=True)
+        json_calls, json_bytes_read = self.json_calls, JSON_FILE_CACHE.bytes_read + self.json_uncached_bytes
+        cpu_start = self._cpu_seconds()
+        wall_start = time.perf_counter()
+        self._current = phase
+        sampler.start()
+        try:
+            yield phase
+        finally:
+            stop.set()
+            sampler.join()
+            self._current = None
+            end_rss = self._process.memory_info().rss
+            phase["wall_s"] = round(time.perf_counter() - wall_start, 4)
+            phase["cpu_s"] = round(self._cpu_seconds() - cpu_start, 4)
+            phase["peak_rss_mb"] = round(max(peak[0], end_rss) / (1024 * 1024), 1)
+            phase["end_rss_mb"] = round(end_rss / (1024 * 1024), 1)
+            phase["json_calls"] = self.json_calls - json_calls
+            phase["json_bytes_read"] = JSON_FILE_CACHE.bytes_read + self.json_uncached_bytes - json_bytes_read
+            self.phases.append(phase)
+
+    def record_task(self, name: str, seconds: float) -> None:
+        """Records the wall time of a named task within the current phase, i.e. one class's to_file()"""
+        if self._current is not None:
+            self._current["tasks"][name] = round(seconds, 4)
+
+    def json_reads(self) -> tuple:
+        """Returns (get_json_data() calls, bytes read) of this process so far"""
+        return self.json_calls, JSON_FILE_CACHE.bytes_read + self.json_uncached_bytes
+
+    def add_json_reads(self, json_calls: int, json_bytes_read: int) -> None:
+        """Counts get_json_data() reads made in a worker process, so they are included in the current phase"""
+        self.json_calls += json_calls
+        self.json_uncached_bytes += json_bytes_read
+
+    def report(self) -> dict:
+        return {
+            "phases": self.phases,
+            "total": {
+                "wall_s": round(sum(phase["wall_s"] for phase in self.phases), 4),
+                "cpu_s": round(sum(phase["cpu_s"] for phase in self.phases), 4),
+                "peak_rss_mb": max((phase["peak_rss_mb"] for phase in self.phases), default=0),
+                "json_calls": sum(phase["json_calls"] for phase in self.phases),
+                "json_bytes_read": sum(phase["json_bytes_read"] for phase in self.phases),
+            },
+        }
+
+    def save(self, report_file) -> None:
+        os.makedirs(os.path.dirname(os.path.abspath(report_file)), exist_ok=True)
+        with open(report_file, 'w', encoding='utf-8') as f:
+            json.dump(self.report(), f, indent=4)
+        logger.debug(f"Saved phase profile to {report_file}")
+
+    def log_summary(self) -> None:
+        if not self.phases:
+            return
+        lines = [f"{'Phase':<28}{'Wall s':>9}{'CPU s':>9}{'Peak MB':>10}{'Files':>9}{'Read MB':>10}"]
+        for phase in self.phases + [{"name": "total", **self.report()["total"]}]:
+            lines.append(f"{phase['name']:<28}{phase['wall_s']:>9.2f}{phase['cpu_s']:>9.2f}{phase['peak_rss_mb']:>10.1f}"
+                         f"{phase['json_calls']:>9}{phase['json_bytes_read'] / (1024 * 1024):>10.1f}")
+        logger.info("Phase profile:\n" + "\n".join(lines))
+
+# Create the singleton instance, import this
+PHASE_PROFILER = PhaseProfiler()
+
 def clear_dir(dir_path: str, keep_git: bool = True) -> None:
     """Clear directory contents but keep the directory itself. 
     Keep the .git directory if keep_git is True."""
@@ -109,6 +615,13 @@ def asset_path_to_file_path(asset_path):
     
     # Convert the asset path to a relative path, replacing /Game/ with the appropriate game content path
     relative_path = asset_path.split('.')[0].replace("/Game/", f"{game_name}/Content/")
+
+    # Fast path, the file was found when the export dir was indexed
+    if EXPORT_INDEX.is_built_for(OPTIONS.export_dir):
+        file_path = EXPORT_INDEX.get_file_path(relative_path, ".json")
+        if file_path is not None:
+            return file_path
+
     # Convert forward slashes to the correct path separator for the current OS
     relative_path_parts = relative_path.split('/')
     
@@ -190,10 +703,12 @@ def parse_editor_curve_data(data: dict):
     return data # used to be unique restructuring here, but it needs to be 1:1 now.
 
 def parse_curve(data: dict):
-    if 'DistToDamage' in data and'EditorCurveData' in data["DistToDamage"]:
-        data["DistToDamage"]["EditorCurveData"] = parse_editor_curve_data(data["DistToDamage"]["EditorCurveData"])
-    elif 'FloatCurve' in data and'EditorCurveData' in data["FloatCurve"]:
-        data["FloatCurve"]["EditorCurveData"] = parse_editor_curve_data(data["FloatCurve"]["EditorCurveData"])
+    """Returns data with its curve parsed. data is usually cached JSON, so the dicts on the way to the curve are copied rather than written to."""
+    for curve_key in ('DistToDamage', 'FloatCurve'):
+        if curve_key in data and 'EditorCurveData' in data[curve_key]:
+            curve = dict(data[curve_key])
+            curve["EditorCurveData"] = parse_editor_curve_data(curve["EditorCurveData"])
+            return {**data, curve_key: curve}
 
     return data
 
@@ -201,70 +716,195 @@ def parse_curve(data: dict):
 #           String            #
 ###############################
 
+class SnakeCaseConverter:
+    """
+    Memoized snake_case conversion.
+    The vocabulary of property keys is small and repeats for every parsed object, so the memo is unbounded.
+    """
+    _WORD_PATTERN = re.compile('(.)([A-Z][a-z]+)')
+    _BOUNDARY_PATTERN = re.compile('([a-z0-9])([A-Z])')
+
+    def __init__(self):
+        self._memo = dict() # {text: snake_case}
+        self.hits = 0
+        self.misses = 0
+
+    def convert(self, text: str) -> str:
+        snake_case = self._memo.get(text)
+        if snake_case is not None:
+            self.hits += 1
+            return snake_case
+        self.misses += 1
+        # Remove pre-existing underscores to avoid double underscores
+        s0 = text.replace('_', '')
+        # Insert underscore before uppercase letters that follow lowercase letters
+        s1 = self._WORD_PATTERN.sub(r'\1_\2', s0)
+        # Insert underscore before uppercase letters that follow lowercase letters or numbers
+        s2 = self._BOUNDARY_PATTERN.sub(r'\1_\2', s1)
+        # Replace spaces with underscores and convert to lowercase
+        s3 = s2.replace(' ', '_').lower()
+        snake_case = s3.strip('_')
+        self._memo[text] = snake_case
+        return snake_case
+
+    def clear(self) -> None:
+        self._memo.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'entries': len(self._memo),
+        }
+
+# Create the singleton instance, import this
+SNAKE_CASE_CONVERTER = SnakeCaseConverter()
+
 def to_snake_case(text):
     """Convert text to snake_case"""
-    # Remove pre-existing underscores to avoid double underscores
-    s0 = text.replace('_', '')
-    # Insert underscore before uppercase letters that follow lowercase letters
-    s1 = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', s0)
-    # Insert underscore before uppercase letters that follow lowercase letters or numbers
-    s2 = re.sub('([a-z0-9])([A-Z])', r'\1_\2', s1)
-    # Replace spaces with underscores and convert to lowercase
-    s3 = s2.replace(' ', '_').lower()
-    return s3.strip('_')
+    return SNAKE_CASE_CONVERTER.convert(text)
 
 
 ###############################
 #        Dictionary           #
 ###############################
 
+def _sorted_dict(d: dict, sorted_values: dict | None) -> dict:
+    """d sorted by keys, with the values in sorted_values replaced. d itself if it is already sorted and nothing is replaced."""
+    keys = sorted(d)
+    if sorted_values is None:
+        return d if keys == list(d) else {key: d[key] for key in keys}
+    return {key: sorted_values[key] if key in sorted_values else d[key] for key in keys}
+
 def sort_dict(d: dict, num_levels: int = -1) -> dict:
-    """Recursively sort the first num_levels levels of a dictionary by keys."""
-    # num_levels=-1 means sort all levels
-    if not isinstance(d, dict):
-        return d
-    if num_levels == 0:
+    """
+    Sort the first num_levels levels of a dictionary by keys, all levels if num_levels is -1.
+    Dicts that are already sorted, along with their nested dicts, are returned as is instead of being rebuilt.
+    Iterative, so the nesting depth is not limited by the recursion limit.
+    """
+    if not isinstance(d, dict) or num_levels == 0:
         return d
     num_levels = num_levels if num_levels > 0 else float('inf')
-    sorted_dict = {}
-    for key in sorted(d.keys()):
-        sorted_dict[key] = sort_dict(d[key], num_levels - 1)
-    return sorted_dict
+    # Frames of the dicts being sorted: [dict, its remaining items, {key: sorted dict} of its nested dicts that were rebuilt, levels left, key in parent]
+    stack = [[d, iter(d.items()), None, num_levels, None]]
+    while True:
+        frame = stack[-1]
+        levels = frame[3]
+        child = None
+        if levels > 1:
+            for key, value in frame[1]:
+                if isinstance(value, dict):
+                    child = [value, iter(value.items()), None, levels - 1, key]
+                    break
+        if child is not None:
+            stack.append(child)
+            continue
+        stack.pop()
+        result = _sorted_dict(frame[0], frame[2])
+        if not stack:
+            return result
+        if result is not frame[0]:
+            parent = stack[-1]
+            if parent[2] is None:
+                parent[2] = {}
+            parent[2][frame[4]] = result
+
+def _is_blank(value) -> bool:
+    """Whether remove_blank_values() removes value: None, or an empty str, list or dict."""
+    return value is None or (isinstance(value, (str, list, dict)) and not value)
 
-EMPTY_VALUES = [None, "", [], {}]
 def remove_blank_values(d: dict) -> dict:
-    """Remove keys with blank values from a dictionary- recursively."""
-    if d in EMPTY_VALUES:
-        return d
-    if not isinstance(d, dict):
+    """
+    Remove keys with blank values from a dictionary- recursively.
+    Blank values are None, and empty strings, lists and dicts, including dicts that only held blank values.
+    Dicts are always rebuilt, lists are kept as is. Iterative, so the nesting depth is not limited by the recursion limit.
+    """
+    if not isinstance(d, dict) or not d:
         return d
-    res = {}
-    for k, v in d.items():
-        if v not in EMPTY_VALUES:
-            res_v = remove_blank_values(v)
-            if res_v not in EMPTY_VALUES:
-                res[k] = res_v
-    return res
-
-def merge_dicts(base: dict, overlay: dict) -> dict:
-    """Recursively merge two dictionaries."""
-    result = dict(base if base else {})
-    if not overlay:
-        return result
-    for key, value in overlay.items():
-        if value is not None and value != []:
-            val1 = value
-            val2 = result.get(key)
-            type_1 = type(val1)
-            type_2 = type(val2)
-            if val1 is not None and val2 is not None and type_1 != type_2:
-                raise TypeError(f"Type mismatch for key '{key}': {type_1} vs {type_2}")
-            if isinstance(value, dict) and isinstance(result.get(key), dict):
-                result[key] = merge_dicts(result[key], value)
+    result = {}
+    # Frames of the dicts being rebuilt: (remaining items, rebuilt dict, parent's rebuilt dict, key in parent)
+    stack = [(iter(d.items()), result, None, None)]
+    while stack:
+        items, res, parent, parent_key = stack[-1]
+        for key, value in items:
+            if isinstance(value, dict):
+                if value:
+                    stack.append((iter(value.items()), {}, res, key))
+                    break
+            elif value is not None and not (isinstance(value, (str, list)) and not value):
+                res[key] = value
+        else:
+            stack.pop()
+            if res and parent is not None:
+                parent[parent_key] = res
+    return result
+
+def copy_containers(value):
+    """Copies the dicts and lists of value recursively, sharing every other value. Cheaper than copy.deepcopy() for parsed JSON-like data."""
+    if isinstance(value, dict):
+        return {k: copy_containers(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [copy_containers(v) for v in value]
+    return value
+
+def _check_merge_types(key, value, base_value) -> None:
+    if base_value is not None and type(value) != type(base_value):
+        raise TypeError(f"Type mismatch for key '{key}': {type(value)} vs {type(base_value)}")
+
+def _merge_pruned(base: dict, overlay: dict) -> dict:
+    """Merges overlay onto base into a new dict, pruning blank values during the walk instead of rescanning the merged result."""
+    result = {}
+    for key, value in base.items():
+        overlay_value = overlay.get(key)
+        if overlay_value is None or overlay_value == []:
+            value = remove_blank_values(value)
+        else:
+            _check_merge_types(key, overlay_value, value)
+            if isinstance(overlay_value, dict) and isinstance(value, dict):
+                value = _merge_pruned(value, overlay_value)
             else:
-                # use overlay's value
+                value = remove_blank_values(overlay_value)
+        if not _is_blank(value):
+            result[key] = value
+    for key, value in overlay.items():
+        if key not in base:
+            value = remove_blank_values(value)
+            if not _is_blank(value):
                 result[key] = value
-    return remove_blank_values(result)
+    return result
+
+def _merge_pruned_into(result: dict, overlay: dict) -> None:
+    """Merges overlay onto result in place. result must be a merged result, which is already pruned and shares no dicts."""
+    for key, value in overlay.items():
+        if value is None or value == []:
+            continue
+        current = result.get(key)
+        _check_merge_types(key, value, current)
+        if isinstance(value, dict) and isinstance(current, dict):
+            _merge_pruned_into(current, value)
+            if not current:
+                del result[key]
+            continue
+        value = remove_blank_values(value)
+        if not _is_blank(value):
+            result[key] = value
+        elif current is not None:
+            del result[key]
+
+def merge_dicts(base: dict, *overlays: dict) -> dict:
+    """
+    Recursively merge dictionaries, each overlay onto the result of the previous ones, i.e. a whole template chain from its root.
+    None and [] overlay values are ignored, and blank values are removed from the result, unless every overlay is empty.
+    """
+    overlays = [overlay for overlay in overlays if overlay]
+    if not overlays:
+        return dict(base if base else {})
+    result = _merge_pruned(base if base else {}, overlays[0])
+    for overlay in overlays[1:]:
+        _merge_pruned_into(result, overlay)
+    return result
 
 class ParseAction:
     ATTRIBUTE = "attribute"
@@ -275,6 +915,126 @@ class ParseTarget:
     MATCH_KEY_SNAKE = "match_key_snake"  # Convert key to snake_case
     MATCH_KEY_NO_DEFAULT = "match_key_no_default"  # Use original key as-is, without the 'Default' prefix
 
+DEFAULT_PARSER_CONFIGURATION = {
+    'parser': "value",  # Default parser is "value"
+    'action': ParseAction.ATTRIBUTE,  # Default action is to set an attribute
+    'target_dict_path': None,  # Default is no nested dict path
+    'target': ParseTarget.MATCH_KEY_SNAKE  # Default target is to match key in snake_case
+}
+
+_INDEXED_KEY_PATTERN = re.compile(r'.+\[\d+\]$')
+_TRAILING_INDEX_PATTERN = re.compile(r'\[\d+\]$')
+
+# Where a compiled entry finds its parser. Parsers are often bound methods of the object being parsed,
+# so only where to find them is compiled, the parser itself is taken from the map on each call.
+PARSER_SOURCE_VALUE = 0  # "value", the value is stored as-is, with its dicts and lists copied
+PARSER_SOURCE_CONFIG = 1  # the config is the parser
+PARSER_SOURCE_TUPLE = 2  # (parser, target)
+PARSER_SOURCE_DICT = 3  # {'parser': parser}
+PARSER_SOURCE_DEFAULT = 4  # the default configuration's parser
+
+# {(class_name, key, config_signature, default_signature): compiled entry}
+# Key to parser function maps are rebuilt on every call, but have the same shape for a given class and key
+PARSER_PLAN_CACHE = dict()
+
+def _parser_signature(parser):
+    if isinstance(parser, str) and parser == "value":
+        return "value"
+    return "callable" if callable(parser) else type(parser)
+
+def _config_signature(config):
+    """Hashable shape of a key's config, which is everything that goes into its compiled entry besides the parser callable."""
+    if callable(config) or config == "value":
+        return (_parser_signature(config),)
+    elif isinstance(config, tuple):
+        return ("tuple", _parser_signature(config[0]) if config else None, config[1:])
+    elif isinstance(config, dict):
+        return ("dict",) + tuple(sorted((k, _parser_signature(v) if k == 'parser' else v) for k, v in config.items()))
+    return ("invalid", type(config))
+
+def _default_configuration_signature(default_configuration):
+    return tuple(sorted((k, _parser_signature(v) if k == 'parser' else v) for k, v in default_configuration.items()))
+
+def compile_parser_entry(class_name, key, config, default_configuration={}, default_signature=None):
+    """
+    Resolves the config of one key of a key to parser function map (see process_key_to_parser_function()) into
+    (parser_source, action, target_name, path_parts, target_error)
+    Cached in PARSER_PLAN_CACHE, so the shortcut formats and target are only interpreted once per class and key.
+    target_error is raised by the caller if the parsed value is not None, as an invalid target only matters once there is a value to store.
+    """
+    if default_signature is None:
+        default_signature = _default_configuration_signature(default_configuration)
+    try:
+        cache_key = (class_name, key, _config_signature(config), default_signature)
+        entry = PARSER_PLAN_CACHE.get(cache_key)
+    except TypeError: # unhashable config values, compile without caching
+        cache_key = None
+        entry = None
+    if entry is not None:
+        return entry
+
+    # Handle function directly - use as parser with defaults
+    if callable(config) or config == "value":
+        parser_source = PARSER_SOURCE_VALUE if config == "value" else PARSER_SOURCE_CONFIG
+        config = {
+            'parser': config,
+        }
+    
+    # Handle legacy tuple format for backwards compatibility
+    elif isinstance(config, tuple):
+        parser_source = PARSER_SOURCE_TUPLE
+        config = {
+            'parser': config[0],
+            'target': config[1]
+        }
+
+    else:
+        parser_source = PARSER_SOURCE_DICT if isinstance(config, dict) and 'parser' in config else PARSER_SOURCE_DEFAULT
+    
+    # Handle new dictionary format
+    if not isinstance(config, dict):
+        raise TypeError(f"{class_name} Value for key '{key}' must be a dict, tuple, callable, or None, got {type(config)}")
+
+    parser = config.get('parser', default_configuration.get('parser', DEFAULT_PARSER_CONFIGURATION['parser']))
+    action = config.get('action', default_configuration.get('action', DEFAULT_PARSER_CONFIGURATION['action']))
+    target_dict_path = config.get('target_dict_path', default_configuration.get('target_dict_path', DEFAULT_PARSER_CONFIGURATION['target_dict_path']))
+    target = config.get('target', default_configuration.get('target', DEFAULT_PARSER_CONFIGURATION['target']))
+    
+    # Validate configuration
+    if action == ParseAction.DICT_ENTRY and not target_dict_path:
+        raise ValueError(f"{class_name} target_dict_path required for DICT_ENTRY action on key '{key}'")
+    elif action == ParseAction.ATTRIBUTE and target_dict_path:
+        #raise ValueError(f"{class_name} target_dict_path should not be provided for ATTRIBUTE action on key '{key}'")
+        # this is now allowed for defaulting it in configuration. Its simply ignored if not DICT_ENTRY
+        pass
+
+    if isinstance(parser, str) and parser == "value":
+        parser_source = PARSER_SOURCE_VALUE
+    elif not callable(parser):
+        raise TypeError(f"{class_name} Parser for key '{key}' must be callable or 'value', got {type(parser)}")
+
+    # Determine target name
+    target_name = None
+    target_error = None
+    if target == ParseTarget.MATCH_KEY:
+        target_name = key
+    elif target == ParseTarget.MATCH_KEY_SNAKE:
+        target_name = to_snake_case(key)
+    elif target == ParseTarget.MATCH_KEY_NO_DEFAULT:
+        target_name = key.replace('Default', '', 1) if key.startswith('Default') else key
+    elif isinstance(target, str):
+        # Custom string target
+        target_name = target
+    else:
+        target_error = ValueError(f"{class_name} Target must be ParseTarget.MATCH_KEY, ParseTarget.MATCH_KEY_SNAKE, or a string for key '{key}', got {type(target)}")
+
+    path_parts = tuple(target_dict_path.split('.')) if action == ParseAction.DICT_ENTRY else None
+
+    entry = (parser_source, action, target_name, path_parts, target_error)
+    if cache_key is not None:
+        PARSER_PLAN_CACHE[cache_key] = entry
+    return entry
+
 def process_key_to_parser_function(key_to_parser_function_map, data, obj=None, log_descriptor="", set_attrs=True, default_configuration={}):
     """
     Enhanced version that supports flexible target destinations.
@@ -323,131 +1083,88 @@ def process_key_to_parser_function(key_to_parser_function_map, data, obj=None, l
     # Get class name for logging
     class_name = obj.__class__.__name__ if obj else None
 
-    # Determine the default configuration
-    default_config_to_use = {
-        'parser': "value",  # Default parser is "value"
-        'action': ParseAction.ATTRIBUTE,  # Default action is to set an attribute
-        'target_dict_path': None,  # Default is no nested dict path
-        'target': ParseTarget.MATCH_KEY_SNAKE  # Default target is to match key in snake_case
-    }
-    # Update with any provided default configuration
-    for key, value in default_configuration.items():
-        if key in default_config_to_use:
-            default_config_to_use[key] = value
-        else:
+    # Update the default configuration with any provided default configuration
+    for key in default_configuration:
+        if key not in DEFAULT_PARSER_CONFIGURATION:
             raise ValueError(f"Unknown default configuration key: {key}")
+    default_parser = default_configuration.get('parser', DEFAULT_PARSER_CONFIGURATION['parser'])
+    default_signature = _default_configuration_signature(default_configuration)
         
     parsed_data = dict()
 
     for key, value in data.items():
         # Remove trailing indexing from key if present
         # i.e. 'Id_ColorParam[2]' -> 'Id_ColorParam'
-        if isinstance(key, str) and re.match(r'.+\[\d+\]$', key):
-            key = re.sub(r'\[\d+\]$', '', key)
+        if isinstance(key, str) and key.endswith(']') and _INDEXED_KEY_PATTERN.match(key):
+            key = _TRAILING_INDEX_PATTERN.sub('', key)
 
         if not key in key_to_parser_function_map:
             obj_id = getattr(obj, 'id', 'Error, no id found for obj') if obj else None
             obj_class_ref_str = f"{class_name} {obj_id} has unknown property: '{key}' of value '{value.__str__()}'"
             logger.warning(f"Warning: {obj_class_ref_str} {log_descriptor}")
+            continue
+
+        config = key_to_parser_function_map[key]
         
+        # Handle None (skip processing)
+        if config is None:
+            continue
+
+        parser_source, action, target_name, path_parts, target_error = compile_parser_entry(class_name, key, config, default_configuration, default_signature)
+        
+        # Parse the value
+        if parser_source == PARSER_SOURCE_VALUE:
+            parsed_value = copy_containers(value) # data is usually cached JSON, which must not be shared with the parsed object
+        elif parser_source == PARSER_SOURCE_CONFIG:
+            parsed_value = config(value)
+        elif parser_source == PARSER_SOURCE_TUPLE:
+            parsed_value = config[0](value)
+        elif parser_source == PARSER_SOURCE_DICT:
+            parsed_value = config['parser'](value)
         else:
-            config = key_to_parser_function_map[key]
-            
-            # Handle None (skip processing)
-            if config is None:
-                continue
-            
-            # Handle function directly - use as parser with defaults
-            if callable(config) or config == "value":
-                config = {
-                    'parser': config,
-                }
-            
-            # Handle legacy tuple format for backwards compatibility
-            elif isinstance(config, tuple):
-                config = {
-                    'parser': config[0],
-                    'target': config[1]
-                }
-            
-            # Handle new dictionary format
-            if not isinstance(config, dict):
-                raise TypeError(f"{class_name} Value for key '{key}' must be a dict, tuple, callable, or None, got {type(config)}")
-
-            parser = config.get('parser', default_config_to_use['parser'])
-            action = config.get('action', default_config_to_use['action'])
-            target_dict_path = config.get('target_dict_path', default_config_to_use['target_dict_path'])
-            target = config.get('target', default_config_to_use['target'])
-            
-            # Validate configuration
-            if action == ParseAction.DICT_ENTRY and not target_dict_path:
-                raise ValueError(f"{class_name} target_dict_path required for DICT_ENTRY action on key '{key}'")
-            elif action == ParseAction.ATTRIBUTE and target_dict_path:
-                #raise ValueError(f"{class_name} target_dict_path should not be provided for ATTRIBUTE action on key '{key}'")
-                # this is now allowed for defaulting it in configuration. Its simply ignored if not DICT_ENTRY
-                pass
-            
-            # Parse the value
-            if parser == "value":
-                parsed_value = value
-            elif callable(parser):
-                parsed_value = parser(value)
-            else:
-                raise TypeError(f"{class_name} Parser for key '{key}' must be callable or 'value', got {type(parser)}")
-            
-            if parsed_value is None:
-                continue
-            
-            # Determine target name
-            if target == ParseTarget.MATCH_KEY:
-                target_name = key
-            elif target == ParseTarget.MATCH_KEY_SNAKE:
-                target_name = to_snake_case(key)
-            elif target == ParseTarget.MATCH_KEY_NO_DEFAULT:
-                target_name = key.replace('Default', '', 1) if key.startswith('Default') else key
-            elif isinstance(target, str):
-                # Custom string target
-                target_name = target
+            parsed_value = default_parser(value)
+        
+        if parsed_value is None:
+            continue
+
+        if target_error is not None:
+            raise target_error
+        
+        # Store the parsed value
+        if action == ParseAction.ATTRIBUTE:
+            # Direct attribute assignment
+            if set_attrs:
+                setattr(obj, target_name, parsed_value)
             else:
-                raise ValueError(f"{class_name} Target must be ParseTarget.MATCH_KEY, ParseTarget.MATCH_KEY_SNAKE, or a string for key '{key}', got {type(target)}")
-            
-            # Store the parsed value
-            if action == ParseAction.ATTRIBUTE:
-                # Direct attribute assignment
-                if set_attrs:
-                    setattr(obj, target_name, parsed_value)
-                else:
-                    parsed_data[target_name] = parsed_value
-                    
-            elif action == ParseAction.DICT_ENTRY:
-                # Handle dot notation for nested dictionaries
-                path_parts = target_dict_path.split('.')
+                parsed_data[target_name] = parsed_value
                 
-                if set_attrs:
-                    current = obj
-                    # Navigate/create the nested structure
-                    for part in path_parts:
-                        if isinstance(current, dict):
-                            # Current is a dictionary, use dictionary access
-                            if part not in current:
-                                current[part] = {}
-                            current = current[part]
-                        else:
-                            # Current is an object, use attribute access
-                            if not hasattr(current, part):
-                                setattr(current, part, {})
-                            current = getattr(current, part)
-                    current[target_name] = parsed_value
-                else:
-                    # For non-attribute setting, store in nested structure
-                    current = parsed_data
-                    for part in path_parts[:-1]:
+        elif action == ParseAction.DICT_ENTRY:
+            # Handle dot notation for nested dictionaries
+            if set_attrs:
+                current = obj
+                # Navigate/create the nested structure
+                for part in path_parts:
+                    if isinstance(current, dict):
+                        # Current is a dictionary, use dictionary access
                         if part not in current:
                             current[part] = {}
                         current = current[part]
-                    if path_parts[-1] not in current:
-                        current[path_parts[-1]] = {}
-                    current[path_parts[-1]][target_name] = parsed_value
+                    else:
+                        # Current is an object, use attribute access
+                        if not hasattr(current, part):
+                            setattr(current, part, {})
+                        current = getattr(current, part)
+                current[target_name] = parsed_value
+            else:
+                # For non-attribute setting, store in nested structure
+                current = parsed_data
+                for part in path_parts[:-1]:
+                    if part not in current:
+                        current[part] = {}
+                    current = current[part]
+                if path_parts[-1] not in current:
+                    current[path_parts[-1]] = {}
+                current[path_parts[-1]][target_name] = parsed_value
 
     if not set_attrs:
         return parsed_data
\ No newline at end of file
@@ -0,0 +1,94 @@
+import copy
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+os.environ['SHOULD_PARSE'] = 'false'
+os.environ.setdefault('EXPORT_DIR', '/tmp/test_export')
+os.environ.setdefault('OUTPUT_DIR', '/tmp/test_output')
+
+src_path = os.path.join(os.path.dirname(__file__), '..', '..', 'src')
+parse_path = os.path.join(src_path, 'parse')
+sys.path.insert(0, src_path)
+sys.path.insert(0, parse_path)
+
+from analysis import Analysis, ALLOY_CURRENCY_REF
+from enrichment import enrich_rarity_upgrade_costs
+from parsers.module import Module
+from parsers.rarity_upgrade_cost import RarityUpgradeCost
+from parsers.stat import Stat
+
+
+RARITY_REF = "OBJID_ModuleRarity::DA_ModuleRarity_Test.0"
+
+# {stage method: its result}
+STAGES = {
+    "get_frequency_map": {RARITY_REF: {1: {ALLOY_CURRENCY_REF: {"upgrade_cost": {100: 5}}}}},
+    "determine_standard_cost_and_scrap": {RARITY_REF: {1: {ALLOY_CURRENCY_REF: {"upgrade_cost": 100, "scrap_reward": 0}}}},
+    "get_level_diffs_per_module": {
+        "level_diffs": {"DA_Module_A": {"stats_percent_increase": {"Damage": 0.5}}},
+        "distinct_stat_keys": ["Damage"],
+    },
+    "get_modules_upgrade_costs": {"DA_Module_A": {"upgrade_costs": {ALLOY_CURRENCY_REF: 100}}},
+    "calculate_factory_preset_upgrade_costs": {},
+    "analyze_ability_descriptions": {},
+    "analyze_shoulder_profiles": {},
+}
+
+
+class TestAnalysisStages(unittest.TestCase):
+    def setUp(self):
+        self.original_objects = {cls: cls.objects for cls in (Module, RarityUpgradeCost, Stat)}
+        for cls in self.original_objects:
+            cls.objects = dict()
+        self.stages = {}
+        for name, result in STAGES.items():
+            # A copy for each call, as the level diffs are updated in place by later stages
+            patcher = patch.object(Analysis, name, side_effect=lambda *args, result=result: copy.deepcopy(result))
+            self.stages[name] = patcher.start()
+            self.addCleanup(patcher.stop)
+        # Ranked for real, counting calls
+        patcher = patch.object(Analysis, "get_stat_rank_table", autospec=True, side_effect=Analysis.get_stat_rank_table)
+        self.stages["get_stat_rank_table"] = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        for cls, objects in self.original_objects.items():
+            cls.objects = objects
+
+    def assert_computed_once(self):
+        for name, stage in self.stages.items():
+            self.assertEqual(stage.call_count, 1, name)
+
+    def test_nothing_computed_on_init(self):
+        Analysis()
+        for name, stage in self.stages.items():
+            self.assertEqual(stage.call_count, 0, name)
+
+    def test_enrichment_and_analysis_share_stages(self):
+        analysis = Analysis()
+        enrich_rarity_upgrade_costs(analysis)
+        self.assertEqual(RarityUpgradeCost.objects[RARITY_REF].costs["1"]["salvage"]["standard"], 100)
+        self.stages["determine_standard_cost_and_scrap"].assert_called_once()
+
+        bundle = analysis._bundle_self()
+        self.assert_computed_once()
+        self.assertEqual(bundle["json"]["level_diffs_by_module"], {"DA_Module_A": {
+            "stats_percent_increase": {"Damage": 0.5},
+            "stats_percentile": {"Damage": 0.0},
+            "total_upgrade_cost": {ALLOY_CURRENCY_REF: 100},
+        }})
+        self.assertEqual(bundle["json"]["level_diffs_by_stat"], {"Damage": {"DA_Module_A": 0.5}})
+
+    def test_stages_computed_once_in_any_order(self):
+        analysis = Analysis()
+        self.assertEqual(analysis.level_diffs_by_stat, {"Damage": {"DA_Module_A": 0.5}})
+        self.assertEqual(analysis.total_upgrade_costs, {})
+        analysis._bundle_self()
+        analysis._bundle_self()
+        self.assert_computed_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+
+os.environ['SHOULD_PARSE'] = 'false'
+os.environ.setdefault('EXPORT_DIR', '/tmp/test_export')
+os.environ.setdefault('OUTPUT_DIR', '/tmp/test_output')
+
+src_path = os.path.join(os.path.dirname(__file__), '..', '..', 'src')
+parse_path = os.path.join(src_path, 'parse')
+sys.path.insert(0, src_path)
+sys.path.insert(0, parse_path)
+
+import utils
+from utils import JSON_FILE_CACHE, asset_path_to_data
+from parsers.honor_reward import HonorReward
+
+
+ASSETS = {
+    "Sparrow/Honor/DA_Honor_Kill": [{"Properties": {
+        "HonorPoints": 5,
+        "TitanCharge": {"Amount": [1, 2]},
+        "RewardProcessor": {"ObjectPath": "/Game/Sparrow/Honor/DA_Processor_Kill.0"},
+    }}],
+    "Sparrow/Honor/DA_Processor_Kill": [{"Properties": {"PlayerStateProperty": {"Name": "Kills", "Tags": ["pvp"]}}}],
+}
+
+
+class TestCachedJsonIsolation(unittest.TestCase):
+    """Parsed objects get their own copies of the cached JSON they were parsed from"""
+    def setUp(self):
+        self.export_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.export_dir, True)
+        for relative_path, data in ASSETS.items():
+            file_path = os.path.join(self.export_dir, "WRFrontiers", "Content", *relative_path.split('/')) + ".json"
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            with open(file_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+
+        options = Mock()
+        options.game_name = "WRFrontiers"
+        options.export_dir = self.export_dir
+        patcher = patch.object(utils, "OPTIONS", options)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        JSON_FILE_CACHE.clear()
+        self.addCleanup(JSON_FILE_CACHE.clear)
+        self.original_objects = HonorReward.objects
+        HonorReward.objects = dict()
+
+    def tearDown(self):
+        HonorReward.objects = self.original_objects
+
+    def parse(self, honor_id: str) -> HonorReward:
+        return HonorReward(honor_id, asset_path_to_data("/Game/Sparrow/Honor/DA_Honor_Kill.0"))
+
+    def test_mutating_parsed_object_leaves_cache_intact(self):
+        first = self.parse("DA_Honor_Kill.0")
+        self.assertEqual(first.condition, ASSETS["Sparrow/Honor/DA_Processor_Kill"][0]["Properties"])
+        self.assertEqual(first.titan_charge, {"Amount": [1, 2]})
+        first.condition["PlayerStateProperty"]["Tags"].append("mutated")
+        first.condition.pop("PlayerStateProperty")
+        first.titan_charge["Amount"].clear()
+
+        second = self.parse("DA_Honor_Kill.1")
+        self.assertEqual(second.condition, ASSETS["Sparrow/Honor/DA_Processor_Kill"][0]["Properties"])
+        self.assertEqual(second.titan_charge, {"Amount": [1, 2]})
+        for relative_path, data in ASSETS.items():
+            with self.subTest(asset=relative_path):
+                self.assertEqual(asset_path_to_data(f"/Game/{relative_path}.0"), data[0])
+        self.assertGreater(JSON_FILE_CACHE.stats()['hits'], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+import os
+import sys
+import unittest
+
+os.environ['SHOULD_PARSE'] = 'false'
+os.environ.setdefault('EXPORT_DIR', '/tmp/test_export')
+os.environ.setdefault('OUTPUT_DIR', '/tmp/test_output')
+
+src_path = os.path.join(os.path.dirname(__file__), '..', '..', 'src')
+parse_path = os.path.join(src_path, 'parse')
+sys.path.insert(0, src_path)
+sys.path.insert(0, parse_path)
+
+from parsers.object import ParseObject
+from parsers.upgrade_cost import UpgradeCost
+from parsers.scrap_reward import ScrapReward
+
+
+class DictUpgradeCost(ParseObject):
+    """UpgradeCost as it was before it became a CompactParseObject"""
+    objects = dict()
+    has_output_file = False
+
+    def __init__(self, id, currency_ref, amount):
+        super().__init__(id, {
+            "currency_ref": currency_ref,
+            "amount": amount
+        })
+
+    def _parse(self):
+        self.currency_ref = self.source_data.get("currency_ref")
+        self.amount = self.source_data.get("amount")
+
+
+class TestCompactParseObject(unittest.TestCase):
+    def setUp(self):
+        self.original_objects = (UpgradeCost.objects, ScrapReward.objects)
+        UpgradeCost.objects = dict()
+        ScrapReward.objects = dict()
+        DictUpgradeCost.objects = dict()
+
+    def tearDown(self):
+        UpgradeCost.objects, ScrapReward.objects = self.original_objects
+
+    def test_no_instance_dict(self):
+        upgrade_cost = UpgradeCost("DA_Module_A_1", "OBJID_Currency::DA_Meta_Currency_Alloys", 100)
+        scrap_reward = ScrapReward("DA_Module_A_1_0", "OBJID_Currency::DA_Meta_Currency_Alloys", 50)
+        self.assertFalse(hasattr(upgrade_cost, '__dict__'))
+        self.assertFalse(hasattr(scrap_reward, '__dict__'))
+        self.assertFalse(hasattr(upgrade_cost, 'source_data'))
+
+    def test_same_as_dict_object(self):
+        for i in (3, 1, 2):
+            UpgradeCost(f"DA_Module_A_{i}", "OBJID_Currency::DA_Meta_Currency_Alloys", i * 100)
+            DictUpgradeCost(f"DA_Module_A_{i}", "OBJID_Currency::DA_Meta_Currency_Alloys", i * 100)
+        UpgradeCost("DA_Module_B_1", None, 0)
+        DictUpgradeCost("DA_Module_B_1", None, 0)
+
+        compact = UpgradeCost.objects["DA_Module_A_1"]
+        self.assertEqual(compact.to_ref(), "OBJID_UpgradeCost::DA_Module_A_1")
+        self.assertIs(UpgradeCost.get_from_ref(compact.to_ref()), compact)
+        self.assertEqual(list(compact.to_dict().items()), list(DictUpgradeCost.objects["DA_Module_A_1"].to_dict().items()))
+        self.assertEqual(UpgradeCost.to_json(), DictUpgradeCost.to_json())
+
+    def test_set_state(self):
+        scrap_reward = ScrapReward.__new__(ScrapReward)
+        scrap_reward._set_state({"id": "DA_Module_A_1_0", "currency_ref": "OBJID_Currency::DA_Meta_Currency_Intel", "amount": 5})
+        self.assertEqual(scrap_reward.to_dict(), {"id": "DA_Module_A_1_0", "currency_ref": "OBJID_Currency::DA_Meta_Currency_Intel", "amount": 5})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,162 @@
+import os
+import sys
+import unittest
+
+os.environ['SHOULD_PARSE'] = 'false'
+os.environ.setdefault('EXPORT_DIR', '/tmp/test_export')
+os.environ.setdefault('OUTPUT_DIR', '/tmp/test_output')
+
+src_path = os.path.join(os.path.dirname(__file__), '..', '..', 'src')
+parse_path = os.path.join(src_path, 'parse')
+sys.path.insert(0, src_path)
+sys.path.insert(0, parse_path)
+
+from enrichment import EnrichmentIndex, enrich_modules_with_bots
+from parsers.bot_ai_preset import BotAIPreset
+from parsers.character_preset import CharacterPreset
+from parsers.drop_team import DropTeam
+from parsers.localization import Localization
+from parsers.module import Module
+from parsers.module_group import ModuleGroup
+from parsers.virtual_bot import VirtualBot
+
+
+REGISTRIES = (Module, CharacterPreset, ModuleGroup, VirtualBot, BotAIPreset, DropTeam, Localization)
+
+# {module id: (module type id, English name)}
+MODULES = {
+    "DA_Module_FalconChassis": ("DA_ModuleType_Chassis.0", "Falcon"),
+    "DA_Module_FalconTorso": ("DA_ModuleType_Torso.0", "Falcon Torso"),
+    "DA_Module_RavenTorso": ("DA_ModuleType_Torso.0", "Raven Torso"),
+    "DA_Module_ShoulderA": ("DA_ModuleType_Shoulder.0", "Shoulder A"),
+    "DA_Module_ShoulderB": ("DA_ModuleType_Shoulder.0", "Shoulder B"),
+    "DA_Module_RavenChassis": ("DA_ModuleType_Chassis.0", "Raven"),
+    "DA_Module_Rifle": ("DA_ModuleType_Weapon.0", "Rifle"),
+    "DA_Module_UnusedChassis": ("DA_ModuleType_Chassis.0", "Unused"),
+    "DA_Module_GrimChassis": ("DA_ModuleType_TitanGrimChassis.0", "Grim"),
+    "DA_Module_GrimWeapon": ("DA_ModuleType_TitanWeapon.0", "Grim Cannon"),
+    "DA_Module_GrimBotWeapon": ("DA_ModuleType_TitanWeaponTank.0", "Grim Bot Cannon"),
+}
+
+# {preset id: (is factory preset, [(module id, socket name)])}
+PRESETS = {
+    "DA_Preset_B": (True, [("DA_Module_FalconChassis", "None"), ("DA_Module_FalconTorso", "Torso"), ("DA_Module_ShoulderA", "Shoulder_L"),
+                           ("DA_Module_ShoulderB", "Shoulder_R"), ("DA_Module_Rifle", "Weapon_L")]),
+    "DA_Preset_A": (True, [("DA_Module_FalconChassis", "None"), ("DA_Module_RavenTorso", "Torso"), ("DA_Module_ShoulderA", "Shoulder_L"),
+                           ("DA_Module_ShoulderA", "Shoulder_R")]),
+    "DA_Preset_C": (True, [("DA_Module_RavenChassis", "None"), ("DA_Module_RavenTorso", "Torso"), ("DA_Module_ShoulderB", "Shoulder_L"), ("DA_Module_ShoulderB", "Shoulder_R")]),
+    "DA_Preset_Titan": (True, [("DA_Module_GrimChassis", "None"), ("DA_Module_GrimWeapon", "Weapon_L")]),
+    "Grim": (False, [("DA_Module_GrimChassis", "None"), ("DA_Module_GrimBotWeapon", "Weapon_L"), ("DA_Module_Rifle", "Weapon_R")]),
+}
+
+
+class EnglishNames:
+    """Stands in for the English Localization, returning the 'en' of each name"""
+    def localize_from_name(self, name: dict):
+        return name.get("en", "")
+
+
+def add_object(cls, obj_id: str, **attrs):
+    obj = cls.__new__(cls)
+    obj.id = obj_id
+    for name, value in attrs.items():
+        setattr(obj, name, value)
+    cls.objects[obj_id] = obj
+    return obj
+
+
+class TestEnrichVirtualBots(unittest.TestCase):
+    def setUp(self):
+        self.original_objects = {cls: cls.objects for cls in REGISTRIES}
+        for cls in REGISTRIES:
+            cls.objects = dict()
+
+        Localization.objects["en"] = EnglishNames()
+        for group_id, virtual_bot_module in (("non-titan-chassis", True), ("non-titan-torsos", True), ("non-titan-shoulder", True),
+                                             ("light-weapon", False), ("titan-chassis", True), ("titan-weapon", True)):
+            ModuleGroup(id=group_id, name={}, sort_order=0, titan=group_id.startswith("titan"), virtual_bot_module=virtual_bot_module)
+        for module_id, (type_id, name) in MODULES.items():
+            add_object(Module, module_id, module_type_ref=f"OBJID_ModuleType::{type_id}", name={"Key": module_id, "en": name},
+                       module_group_ref=ModuleGroup.id_to_ref(ModuleGroup.get_group_id_for_type(type_id)))
+        for preset_id, (is_factory_preset, modules) in PRESETS.items():
+            add_object(CharacterPreset, preset_id, name={"Key": preset_id, "en": preset_id}, is_factory_preset=is_factory_preset,
+                       character_type="Titan" if "Grim" in preset_id or "Titan" in preset_id else "Mech", icon=f"/Icons/{preset_id}",
+                       modules=[{"module_ref": Module.id_to_ref(module_id), "socket_name": socket_name} for module_id, socket_name in modules])
+        add_object(DropTeam, "DA_DropTeam_0", character_presets_refs=[CharacterPreset.id_to_ref("Grim")])
+        add_object(DropTeam, "DA_DropTeam_1", character_presets_refs=[CharacterPreset.id_to_ref("DA_Preset_Titan"), CharacterPreset.id_to_ref("Grim")])
+        add_object(BotAIPreset, "DA_BotAIPreset_0", drop_teams_refs=[DropTeam.id_to_ref("DA_DropTeam_0")])
+        add_object(BotAIPreset, "DA_BotAIPreset_1", drop_teams_refs=[DropTeam.id_to_ref("DA_DropTeam_1"), DropTeam.id_to_ref("DA_DropTeam_Missing")])
+
+    def tearDown(self):
+        for cls, objects in self.original_objects.items():
+            cls.objects = objects
+
+    def enrich(self):
+        index = EnrichmentIndex()
+        index.build()
+        enrich_modules_with_bots(index)
+
+    def test_ai_bot_preset_index(self):
+        """Each AI bot preset is indexed once, however many drop teams it is in, and factory presets in drop teams are skipped"""
+        index = EnrichmentIndex()
+        index.build()
+        self.assertEqual(index.ai_preset_slugs, {"Grim": "grim"})
+        self.assertEqual(index.preset_titan_weapon_ids, {"Grim": ["DA_Module_GrimBotWeapon"]})
+
+    def test_virtual_bots(self):
+        self.enrich()
+        bots = {bot_id: bot.to_dict() for bot_id, bot in VirtualBot.objects.items()}
+        self.assertEqual(bots, {
+            # Named after the chassis of the first factory preset by id that uses its first module, DA_Preset_A
+            "falcon": {
+                "id": "falcon",
+                "name": {"Key": "DA_Module_FalconChassis", "en": "Falcon"},
+                "character_type": "Mech",
+                "core_module_refs": ["OBJID_Module::DA_Module_FalconChassis", "OBJID_Module::DA_Module_RavenTorso", "OBJID_Module::DA_Module_ShoulderA",
+                                     "OBJID_Module::DA_Module_FalconTorso", "OBJID_Module::DA_Module_ShoulderB"],
+                "factory_preset_refs": ["OBJID_CharacterPreset::DA_Preset_B", "OBJID_CharacterPreset::DA_Preset_A"],
+                "has_distinct_shoulders": False,
+                "icon_path": "/Icons/DA_Preset_A",
+            },
+            # Only DA_Module_RavenChassis was still unassigned, but every virtual bot module of the preset is a core module
+            "raven": {
+                "id": "raven",
+                "name": {"Key": "DA_Module_RavenChassis", "en": "Raven"},
+                "character_type": "Mech",
+                "core_module_refs": ["OBJID_Module::DA_Module_RavenChassis", "OBJID_Module::DA_Module_RavenTorso", "OBJID_Module::DA_Module_ShoulderB"],
+                "factory_preset_refs": ["OBJID_CharacterPreset::DA_Preset_C"],
+                "has_distinct_shoulders": False,
+                "icon_path": "/Icons/DA_Preset_C",
+            },
+            # The titan weapon of the AI bot preset with the same name is added
+            "grim": {
+                "id": "grim",
+                "name": {"Key": "DA_Module_GrimChassis", "en": "Grim"},
+                "character_type": "Titan",
+                "core_module_refs": ["OBJID_Module::DA_Module_GrimChassis", "OBJID_Module::DA_Module_GrimWeapon", "OBJID_Module::DA_Module_GrimBotWeapon"],
+                "factory_preset_refs": ["OBJID_CharacterPreset::DA_Preset_Titan"],
+                "has_distinct_shoulders": False,
+                "icon_path": "/Icons/DA_Preset_Titan",
+            },
+        })
+
+    def test_modules(self):
+        self.enrich()
+        modules = {module_id: (getattr(module, "virtual_bot_ref", None), getattr(module, "shoulder_side", None)) for module_id, module in Module.objects.items()}
+        self.assertEqual(modules, {
+            "DA_Module_FalconChassis": ("OBJID_VirtualBot::falcon", None),
+            "DA_Module_FalconTorso": ("OBJID_VirtualBot::falcon", None),
+            "DA_Module_RavenTorso": ("OBJID_VirtualBot::falcon", None),
+            "DA_Module_ShoulderA": ("OBJID_VirtualBot::falcon", None), # on both sides in DA_Preset_A
+            "DA_Module_ShoulderB": ("OBJID_VirtualBot::falcon", None), # right in DA_Preset_B, both sides in DA_Preset_C
+            "DA_Module_RavenChassis": ("OBJID_VirtualBot::raven", None),
+            "DA_Module_Rifle": (None, None),
+            "DA_Module_UnusedChassis": (None, None),
+            "DA_Module_GrimChassis": ("OBJID_VirtualBot::grim", None),
+            "DA_Module_GrimWeapon": ("OBJID_VirtualBot::grim", None),
+            "DA_Module_GrimBotWeapon": ("OBJID_VirtualBot::grim", None),
+        })
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,143 @@
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+os.environ['SHOULD_PARSE'] = 'false'
+os.environ.setdefault('EXPORT_DIR', '/tmp/test_export')
+os.environ.setdefault('OUTPUT_DIR', '/tmp/test_output')
+
+src_path = os.path.join(os.path.dirname(__file__), '..', '..', 'src')
+parse_path = os.path.join(src_path, 'parse')
+sys.path.insert(0, src_path)
+sys.path.insert(0, parse_path)
+
+from utils import SOURCE_MANIFEST, get_json_data
+from parsers.object import ParseObject
+from parsers.image import Image
+
+
+class Part(ParseObject):
+    objects = dict()
+    parse_count = 0
+
+    def _parse(self):
+        Part.parse_count += 1
+        self.value = self.source_data["value"]
+
+
+class Robot(ParseObject):
+    objects = dict()
+    parse_count = 0
+
+    def _parse(self):
+        Robot.parse_count += 1
+        self.name = self.source_data["name"]
+        self.part_refs = []
+        for part_file in self.source_data["parts"]:
+            part_id = part_file.split('.')[0]
+            part = Part.get_from_id(part_id)
+            if part is None:
+                part = Part(part_id, get_json_data(os.path.join(EXPORT_DIR, part_file)))
+            self.part_refs.append(part.to_ref())
+        Image(f"/Robots/{self.id}")
+
+
+EXPORT_DIR = None
+
+
+class TestIncrementalParse(unittest.TestCase):
+    def setUp(self):
+        global EXPORT_DIR
+        self.temp_dir = tempfile.mkdtemp()
+        EXPORT_DIR = os.path.join(self.temp_dir, "export")
+        os.makedirs(EXPORT_DIR)
+        self.manifest_file = os.path.join(self.temp_dir, "manifest.json")
+        self.fingerprint_file = os.path.join(self.temp_dir, "parser.py")
+        with open(self.fingerprint_file, 'w') as f:
+            f.write("# v1")
+
+        self._write("Robot_A.json", {"name": "A", "parts": ["Part_Gun.json", "Part_Leg.json"]})
+        self._write("Robot_B.json", {"name": "B", "parts": ["Part_Gun.json", "Part_Arm.json"]})
+        self._write("Robot_C.json", {"name": "C", "parts": ["Part_Arm.json"]})
+        self._write("Part_Gun.json", {"value": 1})
+        self._write("Part_Leg.json", {"value": 2})
+        self._write("Part_Arm.json", {"value": 3})
+
+    def tearDown(self):
+        SOURCE_MANIFEST.__init__()
+        Image.image_paths = dict()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _write(self, file_name, data):
+        with open(os.path.join(EXPORT_DIR, file_name), 'w') as f:
+            json.dump(data, f)
+        # Size alone may not change, so force a distinct mtime
+        stat = os.stat(os.path.join(EXPORT_DIR, file_name))
+        os.utime(os.path.join(EXPORT_DIR, file_name), ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    def _run(self):
+        """Mimics parse.main: load the manifest, parse every robot, save the manifest."""
+        Robot.objects = dict()
+        Part.objects = dict()
+        Robot.parse_count = 0
+        Part.parse_count = 0
+        Image.image_paths = dict()
+        SOURCE_MANIFEST.load(self.manifest_file, EXPORT_DIR, [self.fingerprint_file])
+        for robot_id in ["Robot_A", "Robot_B", "Robot_C"]:
+            Robot(robot_id, get_json_data(os.path.join(EXPORT_DIR, f"{robot_id}.json")))
+        SOURCE_MANIFEST.save(self.manifest_file)
+        return {
+            "Robot": {obj_id: obj.to_dict() for obj_id, obj in Robot.objects.items()},
+            "Part": {obj_id: obj.to_dict() for obj_id, obj in Part.objects.items()},
+            "Image": dict(Image.image_paths),
+        }
+
+    def test_unchanged_run_restores_everything(self):
+        full = self._run()
+        self.assertEqual(Robot.parse_count, 3)
+        restored = self._run()
+        self.assertEqual(Robot.parse_count, 0)
+        self.assertEqual(Part.parse_count, 0)
+        self.assertEqual(restored, full)
+        self.assertEqual(SOURCE_MANIFEST.stats()["restored_units"], 3)
+
+    def test_changed_part_reparses_dependents(self):
+        self._run()
+        self._write("Part_Arm.json", {"value": 30})
+        incremental = self._run()
+        # A owns Part_Gun which B uses, neither owns nor uses Part_Arm
+        self.assertEqual(Robot.parse_count, 2)
+        self.assertEqual(incremental["Part"]["Part_Arm"]["value"], 30)
+
+        SOURCE_MANIFEST.__init__()
+        os.remove(self.manifest_file)
+        self.assertEqual(self._run(), incremental)
+
+    def test_changed_used_object_reparses_user(self):
+        self._run()
+        self._write("Part_Gun.json", {"value": 10})
+        self._run()
+        # B looked up Part_Gun created by A, so both are re-parsed
+        self.assertEqual(Robot.parse_count, 2)
+        self.assertEqual(set(Robot.objects), {"Robot_A", "Robot_B", "Robot_C"})
+
+    def test_changed_fingerprint_reparses_everything(self):
+        self._run()
+        with open(self.fingerprint_file, 'w') as f:
+            f.write("# v2")
+        self._run()
+        self.assertEqual(Robot.parse_count, 3)
+
+    def test_restored_state_is_not_shared(self):
+        self._run()
+        self._run()
+        Robot.objects["Robot_A"].part_refs.append("mutated")
+        self._run()
+        self.assertNotIn("mutated", Robot.objects["Robot_A"].part_refs)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest.mock import Mock
+
+os.environ['SHOULD_PARSE'] = 'false'
+os.environ.setdefault('EXPORT_DIR', '/tmp/test_export')
+os.environ.setdefault('OUTPUT_DIR', '/tmp/test_output')
+
+src_path = os.path.join(os.path.dirname(__file__), '..', '..', 'src')
+parse_path = os.path.join(src_path, 'parse')
+sys.path.insert(0, src_path)
+sys.path.insert(0, parse_path)
+
+# Imported as the parsers use it, as a second copy of the Localization class would be registered as a duplicate ParseObject subclass
+import parsers.localization as localization_module
+
+Localization = localization_module.Localization
+index_table_namespaces = localization_module.index_table_namespaces
+
+SOURCE_DATA = {
+    "Component_Tags": {"HNG_Torso": "Torso", "HNG_Chassis": "Chassis"},
+    "ModuleStatKeys": {"ModuleInfo_Primary": "Primary {\"quoted\"} [x]", "Multi": "line\nbreak"},
+    "Empty": {},
+    "Unicode": {"Key": "Ракета 火箭"},
+}
+
+
+class TestLazyLocalization(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.source_file = os.path.join(self.temp_dir, "Game.json")
+        with open(self.source_file, 'w', encoding='utf-8') as f:
+            json.dump(SOURCE_DATA, f, indent=4, ensure_ascii=False)
+        self.original_options = localization_module.OPTIONS
+        localization_module.OPTIONS = Mock(output_dir=self.temp_dir)
+        self.original_objects = Localization.objects
+        Localization.objects = dict()
+
+    def tearDown(self):
+        localization_module.OPTIONS = self.original_options
+        Localization.objects = self.original_objects
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _create_lazy(self, lang_code="en"):
+        table_spans = index_table_namespaces(self.source_file)
+        return Localization.create_lazy(lang_code, self.source_file, table_spans)
+
+    def test_index_table_namespaces_order(self):
+        table_spans = index_table_namespaces(self.source_file)
+        self.assertEqual(list(table_spans), list(SOURCE_DATA))
+
+    def test_index_rejects_non_table_values(self):
+        with open(self.source_file, 'w', encoding='utf-8') as f:
+            json.dump({"Table": {"a": "b"}, "Scalar": 5}, f)
+        self.assertIsNone(index_table_namespaces(self.source_file))
+
+    def test_tables_decoded_on_first_use(self):
+        localization = self._create_lazy()
+        self.assertEqual(localization.source_data, {})
+        self.assertEqual(localization.localize("Component_Tags", "HNG_Torso"), "Torso")
+        self.assertEqual(list(localization.source_data), ["Component_Tags"])
+
+    def test_localize_matches_eager(self):
+        lazy = self._create_lazy("lazy")
+        eager = Localization("eager", json.loads(json.dumps(SOURCE_DATA)))
+        for table_namespace, table in SOURCE_DATA.items():
+            for key in table:
+                self.assertEqual(lazy.localize(table_namespace, key), eager.localize(table_namespace, key))
+        self.assertEqual(lazy.localize("Missing", "Key"), "Key")
+        self.assertEqual(lazy.localize_from_name({"TableNamespace": "Component_Tags", "Key": "Missing", "en": "Fallback"}), "Fallback")
+
+    def test_streamed_file_matches_eager(self):
+        lazy = self._create_lazy("lazy")
+        lazy.localize("Unicode", "Key")  # mix of decoded and undecoded tables
+        eager = Localization("eager", json.loads(json.dumps(SOURCE_DATA)))
+        lazy._to_file()
+        eager._to_file()
+        with open(os.path.join(self.temp_dir, 'Localization', 'lazy.json'), encoding='utf-8') as f:
+            lazy_output = f.read()
+        with open(os.path.join(self.temp_dir, 'Localization', 'eager.json'), encoding='utf-8') as f:
+            eager_output = f.read()
+        self.assertEqual(lazy_output, eager_output)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import os
+import sys
+import unittest
+
+os.environ['SHOULD_PARSE'] = 'false'
+os.environ.setdefault('EXPORT_DIR', '/tmp/test_export')
+os.environ.setdefault('OUTPUT_DIR', '/tmp/test_output')
+
+src_path = os.path.join(os.path.dirname(__file__), '..', '..', 'src')
+parse_path = os.path.join(src_path, 'parse')
+sys.path.insert(0, src_path)
+sys.path.insert(0, parse_path)
+
+from parsers.object import ParseObject
+from parsers.upgrade_cost import UpgradeCost
+
+
+class Sprocket(ParseObject):
+    objects = dict()
+    has_output_file = False
+
+    def _parse(self):
+        self.size = self.source_data["size"]
+
+
+class TestMergeObjects(unittest.TestCase):
+    def setUp(self):
+        self.original_upgrade_costs = UpgradeCost.objects
+        UpgradeCost.objects = dict()
+        Sprocket.objects = dict()
+
+    def tearDown(self):
+        UpgradeCost.objects = self.original_upgrade_costs
+        Sprocket.objects = dict()
+
+    def parse_batch(self, sprockets: dict) -> list:
+        """Parses sprockets as a worker would, returning the created objects and leaving the registries as they were"""
+        snapshot = ParseObject.registry_snapshot()
+        for sprocket_id, size in sprockets.items():
+            Sprocket(sprocket_id, {"size": size})
+        UpgradeCost(f"cost_{len(sprockets)}", "OBJID_Currency::DA_Meta_Currency_Alloys", len(sprockets))
+        return ParseObject.objects_since(snapshot, discard=True)
+
+    def test_objects_since(self):
+        Sprocket("existing", {"size": 0})
+        objects = self.parse_batch({"b": 2, "a": 1})
+        self.assertEqual([(class_name, obj_id) for class_name, obj_id, _ in objects if class_name == "Sprocket"], [("Sprocket", "b"), ("Sprocket", "a")])
+        self.assertIn(("UpgradeCost", "cost_2", {"id": "cost_2", "currency_ref": "OBJID_Currency::DA_Meta_Currency_Alloys", "amount": 2}), objects)
+        self.assertEqual(list(Sprocket.objects), ["existing"])
+        self.assertEqual(UpgradeCost.objects, {})
+
+    def test_merge_in_batch_order(self):
+        first = self.parse_batch({"c": 3, "shared": 5})
+        second = self.parse_batch({"shared": 5, "a": 1})
+        self.assertEqual(ParseObject.merge_objects([("first", first), ("second", second)]), 4)
+        self.assertEqual(list(Sprocket.objects), ["c", "shared", "a"])
+        self.assertEqual(Sprocket.objects["shared"].to_dict(), {"id": "shared", "size": 5})
+        self.assertEqual(UpgradeCost.objects["cost_2"].to_dict()["amount"], 2)
+
+    def test_conflict(self):
+        first = self.parse_batch({"shared": 5})
+        second = self.parse_batch({"shared": 6})
+        with self.assertRaisesRegex(ValueError, "Sprocket shared: parsed differently in batch second than in batch first"):
+            ParseObject.merge_objects([("first", first), ("second", second)])
+
+    def test_conflict_with_main_process(self):
+        batch = self.parse_batch({"shared": 5})
+        Sprocket("shared", {"size": 4})
+        with self.assertRaisesRegex(ValueError, "than in the main process"):
+            ParseObject.merge_objects([("batch", batch)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+os.environ['SHOULD_PARSE'] = 'false'
+os.environ.setdefault('EXPORT_DIR', '/tmp/test_export')
+os.environ.setdefault('OUTPUT_DIR', '/tmp/test_output')
+
+src_path = os.path.join(os.path.dirname(__file__), '..', '..', 'src')
+parse_path = os.path.join(src_path, 'parse')
+sys.path.insert(0, src_path)
+sys.path.insert(0, parse_path)
+
+from parsers.module_stat import ModuleStat
+
+
+VALUES = [0, 1, 2.5, 10, 0.125, -3]
+
+
+def module_stat(stat_id: str, **attrs) -> ModuleStat:
+    stat = ModuleStat.__new__(ModuleStat)
+    stat.id = stat_id
+    for name, value in attrs.items():
+        setattr(stat, name, value)
+    return stat
+
+
+def reference_format_value(stat: ModuleStat, value):
+    """ModuleStat.format_value before the formatter was compiled once per stat"""
+    unit_baseline = getattr(stat, "unit_baseline", 0.0)
+    unit_scaler = getattr(stat, "unit_scaler", 1.0)
+    unit_exponent = getattr(stat, "unit_exponent", 1.0)
+    return ((value - unit_baseline) * unit_scaler) ** unit_exponent
+
+
+class TestModuleStatFormat(unittest.TestCase):
+    def setUp(self):
+        self.original_formatters = ModuleStat._formatters
+        ModuleStat._formatters = dict()
+
+    def tearDown(self):
+        ModuleStat._formatters = self.original_formatters
+
+    def test_matches_reference(self):
+        stats = [
+            module_stat("DA_ModuleStat_Default"),
+            module_stat("DA_ModuleStat_Percent", unit_scaler=100.0),
+            module_stat("DA_ModuleStat_Complement", unit_baseline=1.0, unit_scaler=-100.0),
+            module_stat("DA_ModuleStat_Inverted", unit_baseline=0.0, unit_exponent=-1.0),
+            module_stat("DA_ModuleStat_Int", unit_baseline=0, unit_scaler=1, unit_exponent=1),
+            module_stat("DA_ModuleStat_IntScaler", unit_baseline=0, unit_scaler=100), # float values, from the default exponent
+        ]
+        for stat in stats:
+            for value in VALUES:
+                if value == 0 and getattr(stat, "unit_exponent", 1.0) < 0:
+                    continue
+                with self.subTest(stat=stat.id, value=value):
+                    expected = reference_format_value(stat, value)
+                    result = stat.format_value(value)
+                    self.assertEqual(result, expected)
+                    self.assertIs(type(result), type(expected))
+
+    def test_default_exponent_gives_floats(self):
+        stat = module_stat("DA_ModuleStat_IntScaler", unit_baseline=0, unit_scaler=100)
+        self.assertIs(type(stat.format_value(2)), float)
+        self.assertEqual(stat.format_values([1, 2]), [100.0, 200.0])
+        self.assertTrue(all(type(value) is float for value in stat.format_values([1, 2])))
+
+    def test_format_values(self):
+        stat = module_stat("DA_ModuleStat_Percent", unit_scaler=100.0)
+        self.assertEqual(stat.format_values(VALUES), [reference_format_value(stat, value) for value in VALUES])
+        self.assertEqual(stat.format_values([]), [])
+
+    def test_warnings_logged_once(self):
+        stat = module_stat("DA_ModuleStat_Odd", unit_baseline=0.5, unit_scaler=2.0, unit_exponent=-1.0, more_is_better=True)
+        with patch("parsers.module_stat.logger.warning") as warning:
+            for value in VALUES[1:]:
+                stat.format_value(value)
+            stat.format_values(VALUES[1:])
+        self.assertEqual(warning.call_count, 3)
+
+    def test_compiled_once_per_object(self):
+        stat = module_stat("DA_ModuleStat_Percent", unit_scaler=100.0)
+        self.assertIs(stat.get_formatter(), stat.get_formatter())
+        # A new ModuleStat with the same id, as when modules are parsed again, gets its own formatter
+        reparsed = module_stat("DA_ModuleStat_Percent", unit_scaler=10.0)
+        self.assertEqual(reparsed.format_value(2), 20.0)
+        self.assertEqual(stat.format_value(2), 200.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest.mock import Mock
+
+os.environ['SHOULD_PARSE'] = 'false'
+os.environ.setdefault('EXPORT_DIR', '/tmp/test_export')
+os.environ.setdefault('OUTPUT_DIR', '/tmp/test_output')
+
+src_path = os.path.join(os.path.dirname(__file__), '..', '..', 'src')
+parse_path = os.path.join(src_path, 'parse')
+sys.path.insert(0, src_path)
+sys.path.insert(0, parse_path)
+
+import parsers.object as object_module
+from parsers.object import ParseObject
+
+
+class Widget(ParseObject):
+    objects = dict()
+
+    def _parse(self):
+        for key, value in self.source_data.items():
+            setattr(self, key, value)
+
+
+class TestObjectToFile(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.original_options = object_module.OPTIONS
+        object_module.OPTIONS = Mock(output_dir=self.temp_dir)
+        Widget.objects = dict()
+
+    def tearDown(self):
+        object_module.OPTIONS = self.original_options
+        Widget.objects = dict()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _written(self):
+        with open(os.path.join(self.temp_dir, 'Objects', 'Widget.json'), encoding='utf-8') as f:
+            return f.read()
+
+    def _expected(self):
+        objects_dict = {obj_id: {k: v for k, v in obj.__dict__.items() if k != 'source_data'} for obj_id, obj in Widget.objects.items()}
+        return json.dumps(dict(sorted(objects_dict.items())), indent=4, ensure_ascii=False)
+
+    def test_matches_to_json(self):
+        Widget("DA_Zeta", {"name": "Zeta", "levels": [{"a": 1}, {"b": [1, 2, {}]}], "empty": {}, "none": None})
+        Widget("DA_Alpha", {"name": "Ракета \"火箭\"\nline", "nested": {"z": 1, "a": {"deep": []}}})
+        Widget("DA_Mid", {"value": 1.5})
+        expected = self._expected()
+        Widget.to_file()
+        self.assertEqual(self._written(), expected)
+
+    def test_to_dict_leaves_object_unchanged(self):
+        widget = Widget("DA_Widget", {"name": "Widget", "levels": [1, 2]})
+        obj_dict = widget.to_dict()
+        self.assertEqual(obj_dict, {"id": "DA_Widget", "name": "Widget", "levels": [1, 2]})
+        self.assertEqual(widget.source_data, {"name": "Widget", "levels": [1, 2]})
+        self.assertIs(obj_dict["levels"], widget.levels)
+        self.assertEqual(Widget.to_json(), Widget.to_json())
+
+    def test_drop_source_data(self):
+        Widget.drop_source_data = True
+        try:
+            widget = Widget("DA_Widget", {"name": "Widget"})
+        finally:
+            del Widget.drop_source_data
+        self.assertFalse(hasattr(widget, "source_data"))
+        self.assertEqual(widget.to_dict(), {"id": "DA_Widget", "name": "Widget"})
+
+    def test_empty_class(self):
+        Widget.to_file()
+        self.assertEqual(self._written(), json.dumps({}, indent=4))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest.mock import Mock
+
+os.environ['SHOULD_PARSE'] = 'false'
+os.environ.setdefault('EXPORT_DIR', '/tmp/test_export')
+os.environ.setdefault('OUTPUT_DIR', '/tmp/test_output')
+
+src_path = os.path.join(os.path.dirname(__file__), '..', '..', 'src')
+parse_path = os.path.join(src_path, 'parse')
+sys.path.insert(0, src_path)
+sys.path.insert(0, parse_path)
+
+import output as output_module
+import parsers.object as object_module
+import parsers.image as image_module
+from parsers.object import ParseObject
+from parsers.image import Image
+
+
+class Gadget(ParseObject):
+    objects = dict()
+
+    def _parse(self):
+        self.value = self.source_data["value"]
+
+
+class HeavyGadget(ParseObject):
+    objects = dict()
+    heavy_output = True
+
+    def _parse(self):
+        self.values = self.source_data["values"]
+
+
+class HiddenGadget(ParseObject):
+    objects = dict()
+    has_output_file = False
+
+    def _parse(self):
+        pass
+
+
+class TestWriteOutputFiles(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.original_options = (output_module.OPTIONS, object_module.OPTIONS, image_module.OPTIONS)
+        Image.image_paths = {"/b": True, "/a": True}
+
+    def tearDown(self):
+        output_module.OPTIONS, object_module.OPTIONS, image_module.OPTIONS = self.original_options
+        Image.image_paths = dict()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _write(self, output_workers):
+        output_dir = os.path.join(self.temp_dir, str(output_workers))
+        os.makedirs(output_dir)
+        options = Mock(output_dir=output_dir, output_workers=output_workers)
+        output_module.OPTIONS = object_module.OPTIONS = image_module.OPTIONS = options
+
+        Gadget.objects = dict()
+        HeavyGadget.objects = dict()
+        HiddenGadget.objects = dict()
+        for i in range(20):
+            Gadget(f"Gadget_{i}", {"value": i})
+            HeavyGadget(f"Heavy_{i}", {"values": [{"level": level, "name": "ünïcode"} for level in range(i)]})
+        HiddenGadget("Hidden", {"x": 1})
+
+        output_module.write_output_files()
+
+        files = dict()
+        for dir_path, _, file_names in os.walk(output_dir):
+            for file_name in file_names:
+                with open(os.path.join(dir_path, file_name), encoding='utf-8') as f:
+                    files[os.path.relpath(os.path.join(dir_path, file_name), output_dir)] = f.read()
+        return files
+
+    def test_registry(self):
+        names = [cls.__name__ for cls in output_module.get_output_classes()]
+        self.assertIn("Gadget", names)
+        self.assertIn("HeavyGadget", names)
+        self.assertNotIn("HiddenGadget", names)
+        self.assertNotIn("CompactParseObject", names)
+        self.assertEqual(names, sorted(names))
+
+    def test_registry_rejects_duplicate_class_names(self):
+        duplicate = type("Gadget", (ParseObject,), {"objects": dict(), "__module__": "duplicate"})
+        try:
+            with self.assertRaises(ValueError):
+                output_module.get_output_classes()
+        finally:
+            duplicate.has_output_file = False
+
+    def test_parallel_matches_serial(self):
+        serial = self._write(1)
+        parallel = self._write(3)
+        self.assertEqual(parallel, serial)
+        self.assertIn(os.path.join("Objects", "HeavyGadget.json"), parallel)
+        self.assertNotIn(os.path.join("Objects", "HiddenGadget.json"), parallel)
+        self.assertIn("Image.json", parallel)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+
+os.environ['SHOULD_PARSE'] = 'false'
+os.environ.setdefault('EXPORT_DIR', '/tmp/test_export')
+os.environ.setdefault('OUTPUT_DIR', '/tmp/test_output')
+
+src_path = os.path.join(os.path.dirname(__file__), '..', '..', 'src')
+parse_path = os.path.join(src_path, 'parse')
+sys.path.insert(0, src_path)
+sys.path.insert(0, parse_path)
+
+import process_parsed_images
+from utils import ExportIndex
+
+
+class TestGetTextureList(unittest.TestCase):
+    def setUp(self):
+        self.export_dir = tempfile.mkdtemp()
+        self.output_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.export_dir, True)
+        self.addCleanup(shutil.rmtree, self.output_dir, True)
+        self.ui_dir = os.path.join(self.export_dir, "WRFrontiers", "Content", "Sparrow", "UI")
+        os.makedirs(self.ui_dir)
+        for file_name in ["T_Icon.png", "T_Icon.svg", "T_Banner.jpg"]:
+            open(os.path.join(self.ui_dir, file_name), 'w').close()
+
+        options = Mock()
+        options.export_dir = self.export_dir
+        options.output_dir = self.output_dir
+        options.export_index_file = None
+        index = ExportIndex()
+        index.build(self.export_dir)
+        for name, value in (("OPTIONS", options), ("EXPORT_INDEX", index)):
+            patcher = patch.object(process_parsed_images, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def get_texture_list(self, img_paths: list) -> list:
+        with open(os.path.join(self.output_dir, "Image.json"), 'w', encoding='utf-8') as f:
+            json.dump(img_paths, f)
+        return process_parsed_images.get_texture_list()
+
+    def test_indexed_extension(self):
+        texture_paths = self.get_texture_list(["/WRFrontiers/Content/Sparrow/UI/T_Icon", "/WRFrontiers/Content/Sparrow/UI/T_Banner"])
+        self.assertEqual(texture_paths, [
+            os.path.join(self.export_dir, "WRFrontiers/Content/Sparrow/UI/T_Icon") + ".png",
+            os.path.join(self.export_dir, "WRFrontiers/Content/Sparrow/UI/T_Banner") + ".jpg",
+        ])
+
+    def test_index_miss_probes_disk(self):
+        """A file the index does not have, as when the export's casing differs from Image.json on a case-insensitive filesystem, is still found on disk"""
+        open(os.path.join(self.ui_dir, "T_Unindexed.jpeg"), 'w').close()
+        texture_paths = self.get_texture_list(["/WRFrontiers/Content/Sparrow/UI/T_Unindexed", "/WRFrontiers/Content/Sparrow/UI/T_Missing"])
+        self.assertEqual(texture_paths, [os.path.join(self.export_dir, "WRFrontiers/Content/Sparrow/UI/T_Unindexed") + ".jpeg"])
+
+
+if __name__ == "__main__":
+    unittest.main()
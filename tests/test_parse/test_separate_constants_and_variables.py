@@ -0,0 +1,133 @@
+import json
+import os
+import random
+import sys
+import unittest
+
+os.environ['SHOULD_PARSE'] = 'false'
+os.environ.setdefault('EXPORT_DIR', '/tmp/test_export')
+os.environ.setdefault('OUTPUT_DIR', '/tmp/test_output')
+
+src_path = os.path.join(os.path.dirname(__file__), '..', '..', 'src')
+parse_path = os.path.join(src_path, 'parse')
+sys.path.insert(0, src_path)
+sys.path.insert(0, parse_path)
+
+from parsers.module import Module
+
+
+def reference_separate_constants_and_variables(levels_data):
+    """Module._separate_constants_and_variables before the single pass, which dropped keys missing from the first level"""
+    first_level_data = levels_data[0]
+    non_constants = dict()
+    for level in levels_data[1:]:
+        for key, value in level.items():
+            if key in first_level_data and first_level_data[key] != value:
+                non_constants[key] = True
+
+    parsed_levels_variable_stats = []
+    parsed_constant_stats = dict()
+    for i, level in enumerate(levels_data):
+        parsed_level_variable_stats = dict()
+        for key, value in level.items():
+            if i == 0 and key not in non_constants:
+                parsed_constant_stats[key] = value
+            if key in non_constants:
+                parsed_level_variable_stats[key] = level[key]
+        if parsed_level_variable_stats:
+            parsed_levels_variable_stats.append(parsed_level_variable_stats)
+
+    ret = {}
+    if parsed_constant_stats:
+        ret["constants"] = parsed_constant_stats
+    if parsed_levels_variable_stats:
+        ret["variables"] = parsed_levels_variable_stats
+    return ret
+
+
+def separate(levels_data):
+    return Module._separate_constants_and_variables(Module.__new__(Module), levels_data)
+
+
+KEYS = ["upgrade_cost_ref", "scrap_rewards_refs", "LoadCapacity", "Armor", "ShieldAmount", "Damage", "PrimaryParameter", "ReloadTime"]
+
+
+def random_levels(rng: random.Random, first_level_has_every_key: bool) -> list:
+    """
+    Levels as _p_levels_data parses them: keys in the same order in each level, some left out of some levels.
+    Few distinct values, so that keys are often constant, including 1 and 1.0.
+    """
+    keys = rng.sample(KEYS, rng.randint(1, len(KEYS)))
+    levels = []
+    for level_index in range(rng.randint(1, 13)):
+        level = {}
+        for key in keys:
+            if level_index == 0 and first_level_has_every_key:
+                pass
+            elif rng.random() < 0.15:
+                continue # missing from this level
+            if key == "scrap_rewards_refs":
+                level[key] = rng.choice([["OBJID_ScrapReward::a"], ["OBJID_ScrapReward::a", "OBJID_ScrapReward::b"]])
+            elif rng.random() < 0.6:
+                level[key] = 1 if rng.random() < 0.5 else 1.0
+            else:
+                level[key] = rng.choice([0.5, 2, "OBJID_UpgradeCost::x"])
+        levels.append(level)
+    return levels
+
+
+def reconstruct(separated: dict, level_index: int) -> dict:
+    """A level's values from the constants and its variables, when no level lacks every variable"""
+    return {**separated.get("constants", {}), **separated.get("variables", [{}] * (level_index + 1))[level_index]}
+
+
+class TestSeparateConstantsAndVariables(unittest.TestCase):
+    def test_example(self):
+        levels = [
+            {"upgrade_cost_ref": "lvl1", "Armor": 100, "LoadCapacity": 5},
+            {"upgrade_cost_ref": "lvl2", "Armor": 100, "LoadCapacity": 5},
+            {"upgrade_cost_ref": "lvl3", "Armor": 100},
+        ]
+        self.assertEqual(json.dumps(separate(levels)), json.dumps({
+            "constants": {"Armor": 100, "LoadCapacity": 5},
+            "variables": [{"upgrade_cost_ref": "lvl1"}, {"upgrade_cost_ref": "lvl2"}, {"upgrade_cost_ref": "lvl3"}],
+        }))
+
+    def test_key_missing_from_first_level_is_variable(self):
+        levels = [
+            {"Armor": 100},
+            {"Armor": 110, "LoadCapacity": 5},
+            {"Armor": 120, "LoadCapacity": 5},
+        ]
+        self.assertEqual(separate(levels), {"variables": [{"Armor": 100}, {"Armor": 110, "LoadCapacity": 5}, {"Armor": 120, "LoadCapacity": 5}]})
+
+    def test_single_level(self):
+        self.assertEqual(separate([{"Armor": 100}]), {"constants": {"Armor": 100}})
+        self.assertEqual(separate([{}]), {})
+
+    def test_matches_reference(self):
+        """Identical JSON to the previous implementation whenever the first level has every key"""
+        rng = random.Random(24)
+        for i in range(500):
+            levels = random_levels(rng, first_level_has_every_key=True)
+            with self.subTest(i=i):
+                self.assertEqual(json.dumps(separate(levels)), json.dumps(reference_separate_constants_and_variables(levels)))
+
+    def test_no_values_lost(self):
+        """With keys missing from any level, each level's values are still its constants and variables"""
+        rng = random.Random(2400)
+        for i in range(500):
+            levels = random_levels(rng, first_level_has_every_key=False)
+            separated = separate(levels)
+            if len(separated.get("variables", [])) not in (0, len(levels)):
+                continue # a level without any variable is left out, so variables no longer line up with the levels
+            with self.subTest(i=i):
+                for level_index, level in enumerate(levels):
+                    reconstructed = reconstruct(separated, level_index)
+                    self.assertEqual({key: reconstructed[key] for key in level}, level)
+                    for key in separated.get("variables", [{}] * len(levels))[level_index]:
+                        self.assertIn(key, level)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+import os
+import random
+import sys
+import unittest
+
+src_path = os.path.join(os.path.dirname(__file__), '..', '..', 'src')
+parse_path = os.path.join(src_path, 'parse')
+sys.path.insert(0, parse_path)
+
+from stat_rank_table import StatRankTable
+
+
+def reference_ranks(level_diffs_by_module, more_is_better_by_stat):
+    """Analysis.get_ranks_per_stat, get_ranks_per_module and get_level_diffs_per_stat before the table"""
+    stat_ranks = {key: {} for key in more_is_better_by_stat}
+    for stat_key in stat_ranks:
+        module_increases = []
+        for module_id, module_diff_data in level_diffs_by_module.items():
+            percent_increase = module_diff_data['stats_percent_increase'].get(stat_key)
+            if percent_increase is not None:
+                module_increases.append((module_id, percent_increase))
+        module_increases.sort(key=lambda x: (float('-inf') if isinstance(x[1], str) else x[1]), reverse=not more_is_better_by_stat[stat_key])
+        for rank, (module_id, _) in enumerate(module_increases[::-1]):
+            stat_ranks[stat_key][module_id] = rank
+
+    per_module_ranks = {}
+    for module_id in level_diffs_by_module:
+        my_module_ranks = {
+            stat: stat_ranks[stat].get(module_id, 0) / len(stat_ranks[stat]) if stat in stat_ranks and len(stat_ranks[stat]) > 0 else 0
+            for stat in stat_ranks if module_id in stat_ranks[stat]
+        }
+        per_module_ranks[module_id] = dict(sorted(my_module_ranks.items()))
+
+    level_diffs_by_stat = {
+        stat_key: {module_id: level_diffs_by_module[module_id]['stats_percent_increase'][stat_key] for module_id in stat_rank}
+        for stat_key, stat_rank in stat_ranks.items()
+    }
+    return stat_ranks, per_module_ranks, level_diffs_by_stat
+
+
+def random_level_diffs(rng: random.Random, num_modules: int, stat_keys: list) -> dict:
+    """Few distinct increases, so that many tie, and some increases from 0"""
+    level_diffs_by_module = {}
+    for i in rng.sample(range(num_modules), num_modules):
+        increases = {}
+        for stat_key in sorted(rng.sample(stat_keys, rng.randint(0, len(stat_keys)))):
+            increases[stat_key] = rng.choice([-0.5, 0.25, 0.25, 1.5, 3, f"+{rng.randint(1, 3)}.0"])
+        level_diffs_by_module[f"OBJID_Module::DA_Module_{i}"] = {'stats_percent_increase': increases}
+    return level_diffs_by_module
+
+
+class TestStatRankTable(unittest.TestCase):
+    def assert_matches_reference(self, level_diffs_by_module, more_is_better_by_stat):
+        stat_ranks, per_module_ranks, level_diffs_by_stat = reference_ranks(level_diffs_by_module, more_is_better_by_stat)
+        table = StatRankTable(level_diffs_by_module, more_is_better_by_stat)
+
+        ranks = table.ranks_by_stat()
+        self.assertEqual(ranks, stat_ranks)
+        for stat_key in stat_ranks:
+            self.assertEqual(list(ranks[stat_key]), list(stat_ranks[stat_key]))
+
+        percentiles = table.percentiles_by_module()
+        self.assertEqual(percentiles, per_module_ranks)
+        self.assertEqual(list(percentiles), list(per_module_ranks))
+        for module_id in per_module_ranks:
+            self.assertEqual(list(percentiles[module_id]), list(per_module_ranks[module_id]))
+
+        diffs = table.level_diffs_by_stat()
+        self.assertEqual(diffs, level_diffs_by_stat)
+        for stat_key in level_diffs_by_stat:
+            self.assertEqual(list(diffs[stat_key]), list(level_diffs_by_stat[stat_key]))
+
+    def test_ties_keep_reversed_module_order(self):
+        level_diffs_by_module = {
+            "A": {'stats_percent_increase': {"Damage": 0.5, "Reload": 0.5}},
+            "B": {'stats_percent_increase': {"Damage": 0.5, "Reload": "+1.0"}},
+            "C": {'stats_percent_increase': {"Damage": 1.0}},
+            "D": {'stats_percent_increase': {}},
+        }
+        table = StatRankTable(level_diffs_by_module, {"Damage": True, "Reload": False})
+        self.assertEqual(table.ranks_by_stat(), {"Damage": {"C": 0, "B": 1, "A": 2}, "Reload": {"B": 0, "A": 1}})
+        self.assertEqual(table.percentiles_by_module()["D"], {})
+        self.assert_matches_reference(level_diffs_by_module, {"Damage": True, "Reload": False})
+
+    def test_unranked_stats_ignored(self):
+        level_diffs_by_module = {"A": {'stats_percent_increase': {"Damage": 0.5, "PrimaryParameter": 2.0}}}
+        table = StatRankTable(level_diffs_by_module, {"Damage": True})
+        self.assertEqual(table.ranks_by_stat(), {"Damage": {"A": 0}})
+
+    def test_no_modules(self):
+        self.assert_matches_reference({}, {"Damage": True})
+
+    def test_randomized(self):
+        rng = random.Random(22)
+        stat_keys = [f"Stat{i}" for i in range(8)]
+        for _ in range(50):
+            level_diffs_by_module = random_level_diffs(rng, rng.randint(1, 40), stat_keys)
+            more_is_better_by_stat = {stat_key: rng.random() < 0.5 for stat_key in stat_keys}
+            with self.subTest(modules=len(level_diffs_by_module)):
+                self.assert_matches_reference(level_diffs_by_module, more_is_better_by_stat)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+
+root_path = os.path.join(os.path.dirname(__file__), '..', '..')
+bench_parse_path = os.path.join(root_path, 'benchmarks', 'bench_parse.py')
+
+
+class TestSyntheticParse(unittest.TestCase):
+    """Runs the parse benchmark at a small scale, so a full parse of the synthetic export is covered in CI."""
+
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def run_bench_parse(self, work_dir: str, *parse_args):
+        subprocess.run([sys.executable, bench_parse_path, "--work-dir", work_dir, "--report-file", os.path.join(work_dir, "report.json"),
+                        "--modules", "28", "--languages", "2", "--template-depth", "2", "--presets", "4", "--output-workers", "1", *parse_args],
+                       cwd=root_path, check=True, capture_output=True)
+
+    def read_output(self, work_dir: str) -> dict:
+        files = dict()
+        output_dir = os.path.join(work_dir, "output")
+        for dir_path, _, file_names in os.walk(output_dir):
+            for file_name in file_names:
+                with open(os.path.join(dir_path, file_name), 'rb') as f:
+                    files[os.path.relpath(os.path.join(dir_path, file_name), output_dir)] = f.read()
+        return files
+
+    def test_full_parse(self):
+        self.run_bench_parse(self.work_dir)
+        report_file = os.path.join(self.work_dir, "report.json")
+
+        with open(report_file) as f:
+            report = json.load(f)
+        phase_names = [phase["name"] for phase in report["phases"]]
+        self.assertEqual(phase_names[0], "setup")
+        self.assertIn("parse_modules", phase_names)
+        self.assertEqual(phase_names[-3:], ["enrich", "analyze", "write_output_files"])
+        self.assertEqual(report["export"]["modules"], 28)
+        self.assertGreater(report["total"]["json_calls"], 0)
+
+        objects_dir = os.path.join(self.work_dir, "output", "Objects")
+        with open(os.path.join(objects_dir, "Module.json")) as f:
+            self.assertEqual(len(json.load(f)), 28)
+        with open(os.path.join(objects_dir, "VirtualBot.json")) as f:
+            self.assertTrue(json.load(f))
+
+    def test_module_workers_match_serial(self):
+        serial_dir, parallel_dir = os.path.join(self.work_dir, "serial"), os.path.join(self.work_dir, "parallel")
+        self.run_bench_parse(serial_dir, "--module-workers", "1")
+        self.run_bench_parse(parallel_dir, "--module-workers", "3")
+        serial, parallel = self.read_output(serial_dir), self.read_output(parallel_dir)
+        self.assertIn(os.path.join("Objects", "Module.json"), serial)
+        self.assertEqual(serial.keys(), parallel.keys())
+        for file_path in serial:
+            self.assertEqual(serial[file_path], parallel[file_path], file_path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+import copy
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+os.environ['SHOULD_PARSE'] = 'false'
+os.environ.setdefault('EXPORT_DIR', '/tmp/test_export')
+os.environ.setdefault('OUTPUT_DIR', '/tmp/test_output')
+
+src_path = os.path.join(os.path.dirname(__file__), '..', '..', 'src')
+parse_path = os.path.join(src_path, 'parse')
+sys.path.insert(0, src_path)
+sys.path.insert(0, parse_path)
+
+from utils import SOURCE_MANIFEST
+from parsers.object import ParseObject
+
+
+TEMPLATES = {
+    "/Templates/Base": {"Damage": 10, "Tags": ["base"], "Nested": {"Range": 100}},
+    "/Templates/Middle": {"Template": {"ObjectPath": "/Templates/Base"}, "Damage": 20},
+    "/Templates/CycleA": {"Template": {"ObjectPath": "/Templates/CycleB"}, "Damage": 1},
+    "/Templates/CycleB": {"Template": {"ObjectPath": "/Templates/CycleA"}, "Damage": 2},
+}
+
+
+class Gadget(ParseObject):
+    objects = dict()
+    has_output_file = False
+    memoize_templates = True
+
+    def _parse(self):
+        self.template = self._parse_and_merge_template(self.source_data["Template"])
+
+    def _parse_from_data(self, source_data: dict):
+        return {key: copy.deepcopy(value) for key, value in source_data.items() if key != "Template"}
+
+
+class TestTemplateCache(unittest.TestCase):
+    def setUp(self):
+        ParseObject.clear_template_cache()
+        Gadget.objects = dict()
+        self.reads = []
+        patcher = patch("parsers.object.asset_path_to_data", side_effect=self.read_template)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        ParseObject.clear_template_cache()
+        Gadget.objects = dict()
+
+    def read_template(self, asset_path):
+        self.reads.append(asset_path)
+        return TEMPLATES[asset_path]
+
+    def gadget(self, gadget_id: str, template_path: str = "/Templates/Middle") -> Gadget:
+        return Gadget(gadget_id, {"Template": {"ObjectPath": template_path}})
+
+    def test_chain_resolved_once(self):
+        first = self.gadget("first")
+        second = self.gadget("second")
+        self.assertEqual(first.template, {"Damage": 20, "Tags": ["base"], "Nested": {"Range": 100}})
+        self.assertEqual(second.template, first.template)
+        self.assertEqual(self.reads, ["/Templates/Middle", "/Templates/Base"])
+
+    def test_base_template_reused_by_other_chain(self):
+        self.gadget("middle")
+        base = self.gadget("base", "/Templates/Base")
+        self.assertEqual(base.template, TEMPLATES["/Templates/Base"])
+        self.assertEqual(self.reads, ["/Templates/Middle", "/Templates/Base"])
+
+    def test_mutation_does_not_leak(self):
+        first = self.gadget("first")
+        first.template["Tags"].append("mutated")
+        first.template["Nested"].pop("Range")
+        second = self.gadget("second")
+        self.assertEqual(second.template, {"Damage": 20, "Tags": ["base"], "Nested": {"Range": 100}})
+
+    def test_cycle(self):
+        with self.assertRaisesRegex(ValueError, "Template cycle in Gadget looped: /Templates/CycleA -> /Templates/CycleB -> /Templates/CycleA"):
+            self.gadget("looped", "/Templates/CycleA")
+        # The resolving stack is unwound, so unrelated templates still resolve
+        self.assertEqual(self.gadget("fine").template["Damage"], 20)
+
+    def test_not_memoized_by_default(self):
+        with patch.object(Gadget, "memoize_templates", False):
+            self.gadget("first")
+            self.gadget("second")
+        self.assertEqual(len(self.reads), 4)
+
+    def test_not_memoized_while_tracking_sources(self):
+        with patch.object(SOURCE_MANIFEST, "enabled", True), patch.object(Gadget, "incremental", False):
+            self.gadget("first")
+            self.gadget("second")
+        self.assertEqual(len(self.reads), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,136 @@
+import unittest
+import sys
+import os
+import shutil
+import tempfile
+from unittest.mock import Mock
+
+# Set required environment variables before importing utils to prevent OPTIONS validation errors
+os.environ['SHOULD_PARSE'] = 'false'  # Disable parsing to avoid requiring EXPORT_DIR and OUTPUT_DIR
+os.environ.setdefault('EXPORT_DIR', '/tmp/test_export')  # Fallback if SHOULD_PARSE somehow becomes true
+os.environ.setdefault('OUTPUT_DIR', '/tmp/test_output')  # Fallback if SHOULD_PARSE somehow becomes true
+
+# Add the src directory to the Python path to import utils
+src_path = os.path.join(os.path.dirname(__file__), '..', '..', 'src')
+sys.path.insert(0, src_path)
+
+# Import directly from the src.utils module to avoid conflicts with tests.utils
+import importlib.util
+spec = importlib.util.spec_from_file_location("src_utils", os.path.join(src_path, "utils.py"))
+src_utils = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(src_utils)
+
+ExportIndex = src_utils.ExportIndex
+asset_path_to_file_path = src_utils.asset_path_to_file_path
+
+
+class TestExportIndex(unittest.TestCase):
+    """Test cases for the ExportIndex class."""
+
+    def setUp(self):
+        """Create a small export directory and mock OPTIONS pointing at it."""
+        self.export_dir = tempfile.mkdtemp()
+        for relative_path in [
+            "WRFrontiers/Content/Sparrow/Mechanics/DA_Meta_Root.json",
+            "WRFrontiers/Content/Sparrow/UI/T_Icon.png",
+            "WRFrontiers/Content/Sparrow/UI/T_Icon.svg",
+            "WRFrontiers/Content/Sparrow/UI/T_Banner.jpg",
+        ]:
+            file_path = os.path.join(self.export_dir, *relative_path.split('/'))
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            with open(file_path, 'w') as f:
+                f.write("[]")
+
+        self.mock_options = Mock()
+        self.mock_options.game_name = "WRFrontiers"
+        self.mock_options.export_dir = self.export_dir
+        src_utils.OPTIONS = self.mock_options
+
+    def tearDown(self):
+        """Remove the export directory and reset the shared index."""
+        src_utils.EXPORT_INDEX = ExportIndex()
+        shutil.rmtree(self.export_dir, ignore_errors=True)
+
+    def test_get_file_path(self):
+        """Test lookup of indexed and missing files."""
+        index = ExportIndex()
+        index.build(self.export_dir)
+        expected = src_utils.normalize_path(os.path.join(self.export_dir, "WRFrontiers", "Content", "Sparrow", "Mechanics", "DA_Meta_Root.json"))
+        self.assertEqual(index.get_file_path("WRFrontiers/Content/Sparrow/Mechanics/DA_Meta_Root", ".json"), expected)
+        self.assertIsNone(index.get_file_path("WRFrontiers/Content/Sparrow/Mechanics/DA_Meta_Root", ".png"))
+        self.assertIsNone(index.get_file_path("WRFrontiers/Content/Missing", ".json"))
+
+    def test_find_extension_preference_order(self):
+        """Test that the first matching extension in the given order is returned."""
+        index = ExportIndex()
+        index.build(self.export_dir)
+        exts = [".png", ".jpg", ".jpeg", ".svg"]
+        self.assertEqual(index.find_extension("WRFrontiers/Content/Sparrow/UI/T_Icon", exts), ".png")
+        self.assertEqual(index.find_extension("WRFrontiers/Content/Sparrow/UI/T_Banner", exts), ".jpg")
+        self.assertIsNone(index.find_extension("WRFrontiers/Content/Sparrow/UI/T_Missing", exts))
+
+    def test_asset_path_resolution_matches_unindexed(self):
+        """Test that indexed resolution returns the same path as the string computation."""
+        asset_paths = [
+            "/Game/Sparrow/Mechanics/DA_Meta_Root.DA_Meta_Root",
+            "/Game/Sparrow/Mechanics/DA_Meta_Root.0",
+            "DataAsset'/Game/Sparrow/Mechanics/DA_Meta_Root.DA_Meta_Root'",
+            "/Game/Sparrow/Mechanics/DA_Not_Exported.0",
+        ]
+        unindexed = [asset_path_to_file_path(asset_path) for asset_path in asset_paths]
+        src_utils.EXPORT_INDEX.build(self.export_dir)
+        indexed = [asset_path_to_file_path(asset_path) for asset_path in asset_paths]
+        self.assertEqual(indexed, unindexed)
+
+    def test_index_not_used_for_other_export_dir(self):
+        """Test that an index built for another export dir is ignored."""
+        src_utils.EXPORT_INDEX.build(self.export_dir)
+        self.mock_options.export_dir = "F:\\TestExports"
+        result = asset_path_to_file_path("/Game/Sparrow/Mechanics/DA_Meta_Root.0")
+        self.assertEqual(result, src_utils.normalize_path("F:\\TestExports\\WRFrontiers\\Content\\Sparrow\\Mechanics\\DA_Meta_Root.json"))
+
+    def build_with_index_file(self) -> tuple:
+        index_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, index_dir, True)
+        index_file = os.path.join(index_dir, "export_index.json")
+        built = ExportIndex()
+        built.build(self.export_dir, index_file)
+        self.assertTrue(os.path.exists(index_file))
+        return index_file, built
+
+    def test_index_file_round_trip(self):
+        """Test that a saved index is reused while the export is unchanged."""
+        index_file, built = self.build_with_index_file()
+        loaded = ExportIndex()
+        loaded.build(self.export_dir, index_file)
+        self.assertEqual(loaded.files, built.files)
+
+    def test_index_file_stale_after_nested_change(self):
+        """Test that files added, removed or moved in nested directories invalidate the saved index, though the export dir's own mtime is unchanged."""
+        ui_dir = os.path.join(self.export_dir, "WRFrontiers", "Content", "Sparrow", "UI")
+        mechanics_dir = os.path.join(self.export_dir, "WRFrontiers", "Content", "Sparrow", "Mechanics")
+        changes = [
+            lambda: open(os.path.join(ui_dir, "T_New.png"), 'w').close(),
+            lambda: os.remove(os.path.join(ui_dir, "T_Banner.jpg")),
+            lambda: os.rename(os.path.join(mechanics_dir, "DA_Meta_Root.json"), os.path.join(ui_dir, "DA_Meta_Root.json")),
+        ]
+        for change in changes:
+            with self.subTest(change=change):
+                # Date every directory back, so the change moves the mtimes even where they are coarse
+                for dir_path, _, _ in os.walk(self.export_dir):
+                    os.utime(dir_path, ns=(0, 0))
+                index_file, _ = self.build_with_index_file()
+                change()
+                self.assertEqual(os.stat(self.export_dir).st_mtime_ns, 0)
+
+                rebuilt = ExportIndex()
+                rebuilt.build(self.export_dir, index_file)
+                scanned = ExportIndex()
+                scanned.build(self.export_dir)
+                self.assertEqual(rebuilt.files, scanned.files)
+
+        self.assertEqual(scanned.find_extension("WRFrontiers/Content/Sparrow/UI/T_New", [".png"]), ".png")
+        self.assertIsNone(scanned.get_file_path("WRFrontiers/Content/Sparrow/Mechanics/DA_Meta_Root", ".json"))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+import unittest
+import sys
+import os
+import json
+import shutil
+import tempfile
+
+# Set required environment variables before importing utils to prevent OPTIONS validation errors
+os.environ['SHOULD_PARSE'] = 'false'  # Disable parsing to avoid requiring EXPORT_DIR and OUTPUT_DIR
+os.environ.setdefault('EXPORT_DIR', '/tmp/test_export')  # Fallback if SHOULD_PARSE somehow becomes true
+os.environ.setdefault('OUTPUT_DIR', '/tmp/test_output')  # Fallback if SHOULD_PARSE somehow becomes true
+
+# Add the src directory to the Python path to import utils
+src_path = os.path.join(os.path.dirname(__file__), '..', '..', 'src')
+sys.path.insert(0, src_path)
+
+# Import directly from the src.utils module to avoid conflicts with tests.utils
+import importlib.util
+spec = importlib.util.spec_from_file_location("src_utils", os.path.join(src_path, "utils.py"))
+src_utils = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(src_utils)
+
+JsonFileCache = src_utils.JsonFileCache
+
+
+class TestJsonFileCache(unittest.TestCase):
+    """Test cases for the JsonFileCache class."""
+
+    def setUp(self):
+        """Create a temporary directory of JSON files."""
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _write(self, name, data):
+        file_path = os.path.join(self.temp_dir, name)
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        return file_path
+
+    def test_repeated_get_is_hit(self):
+        """Test that the second read of a file is served from the cache."""
+        cache = JsonFileCache()
+        file_path = self._write("a.json", [{"a": 1}])
+        first = cache.get(file_path)
+        second = cache.get(file_path)
+        self.assertIs(first, second)
+        self.assertEqual(cache.stats()['hits'], 1)
+        self.assertEqual(cache.stats()['misses'], 1)
+
+    def test_equivalent_paths_share_entry(self):
+        """Test that unnormalized paths to the same file share one entry."""
+        cache = JsonFileCache()
+        file_path = self._write("a.json", {"a": 1})
+        cache.get(file_path)
+        cache.get(os.path.join(self.temp_dir, ".", "a.json"))
+        self.assertEqual(cache.stats()['hits'], 1)
+        self.assertEqual(cache.stats()['entries'], 1)
+
+    def test_modified_file_is_reloaded(self):
+        """Test that a change in mtime or size invalidates the entry."""
+        cache = JsonFileCache()
+        file_path = self._write("a.json", {"a": 1})
+        cache.get(file_path)
+        self._write("a.json", {"a": 12345})
+        self.assertEqual(cache.get(file_path), {"a": 12345})
+        self.assertEqual(cache.stats()['misses'], 2)
+        self.assertEqual(cache.stats()['entries'], 1)
+
+    def test_lru_eviction_over_budget(self):
+        """Test that the least recently used entry is evicted once over budget."""
+        file_a = self._write("a.json", {"a": "x" * 100})
+        file_b = self._write("b.json", {"b": "x" * 100})
+        file_c = self._write("c.json", {"c": "x" * 100})
+        cache = JsonFileCache(max_bytes=os.path.getsize(file_a) * 2)
+        cache.get(file_a)
+        cache.get(file_b)
+        cache.get(file_a)  # a is now most recently used
+        cache.get(file_c)  # evicts b
+        self.assertEqual(cache.stats()['evictions'], 1)
+        cache.get(file_a)
+        self.assertEqual(cache.stats()['hits'], 2)
+        cache.get(file_b)
+        self.assertEqual(cache.stats()['misses'], 4)
+
+    def test_zero_budget_disables_caching(self):
+        """Test that a budget of 0 never stores entries."""
+        cache = JsonFileCache(max_bytes=0)
+        file_path = self._write("a.json", {"a": 1})
+        cache.get(file_path)
+        cache.get(file_path)
+        self.assertEqual(cache.stats()['hits'], 0)
+        self.assertEqual(cache.stats()['entries'], 0)
+
+    def test_configure_shrinks_cache(self):
+        """Test that lowering the budget evicts existing entries."""
+        cache = JsonFileCache()
+        cache.get(self._write("a.json", {"a": 1}))
+        cache.get(self._write("b.json", {"b": 1}))
+        cache.configure(max_bytes=0)
+        self.assertEqual(cache.stats()['entries'], 0)
+        self.assertEqual(cache.stats()['cached_bytes'], 0)
+
+    def test_get_json_data_index(self):
+        """Test that get_json_data still indexes into list files."""
+        file_path = self._write("list.json", [{"a": 1}, {"b": 2}])
+        self.assertEqual(src_utils.get_json_data(file_path, 1), {"b": 2})
+        self.assertEqual(src_utils.get_json_data(file_path, 0, use_cache=False), {"a": 1})
+
+    def test_parse_curve_leaves_cached_data_intact(self):
+        """Test that parsing a curve read through the cache does not write to the cached data."""
+        file_path = self._write("curve.json", {"FloatCurve": {"EditorCurveData": {"Keys": [{"Time": 0, "Value": 1}]}}, "Other": 1})
+        cached = src_utils.get_json_data(file_path)
+        before = json.dumps(cached)
+        curve = cached["FloatCurve"]
+        parsed = src_utils.parse_curve(cached)
+        self.assertEqual(parsed, json.loads(before))
+        self.assertIsNot(parsed, cached)
+        self.assertIs(cached["FloatCurve"], curve)
+        self.assertEqual(json.dumps(src_utils.get_json_data(file_path)), before)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,3 +1,5 @@
+import copy
+import random
 import unittest
 import sys
 import os
@@ -18,6 +20,40 @@ src_utils = importlib.util.module_from_spec(spec)
 spec.loader.exec_module(src_utils)
 
 merge_dicts = src_utils.merge_dicts
+remove_blank_values = src_utils.remove_blank_values
+
+
+def reference_merge_dicts(base: dict, overlay: dict) -> dict:
+    """The original two-dict merge_dicts, which removed blank values by rescanning the result at every level."""
+    result = dict(base if base else {})
+    if not overlay:
+        return result
+    for key, value in overlay.items():
+        if value is not None and value != []:
+            base_value = result.get(key)
+            if base_value is not None and type(value) != type(base_value):
+                raise TypeError(f"Type mismatch for key '{key}': {type(value)} vs {type(base_value)}")
+            if isinstance(value, dict) and isinstance(base_value, dict):
+                result[key] = reference_merge_dicts(base_value, value)
+            else:
+                result[key] = value
+    return remove_blank_values(result)
+
+
+def random_layer(rng: random.Random, depth: int) -> dict:
+    """A random dict over a small key space, so layers overlap, with blank values and nested dicts"""
+    layer = {}
+    for key in rng.sample("abcdef", rng.randint(0, 4)):
+        roll = rng.random()
+        if depth > 0 and roll < 0.35:
+            layer[key] = random_layer(rng, depth - 1)
+        elif roll < 0.5:
+            layer[key] = rng.choice([None, "", [], {}])
+        elif roll < 0.6:
+            layer[key] = [rng.randint(0, 2)]
+        else:
+            layer[key] = rng.randint(0, 3)
+    return layer
 
 
 class TestMergeDicts(unittest.TestCase):
@@ -443,6 +479,44 @@ class TestMergeDicts(unittest.TestCase):
         result = merge_dicts(base, overlay)
         self.assertEqual(result, expected)
 
+    def test_multiple_overlays(self):
+        """Test that overlays are merged in order, each onto the result of the previous ones."""
+        root = {"name": "Root", "stats": {"damage": 10, "range": 100}, "tags": ["root"]}
+        middle = {"stats": {"damage": 20, "spread": ""}, "tags": None}
+        leaf = {"name": "Leaf", "stats": {"range": 150}, "icon": {}}
+        expected = {"name": "Leaf", "stats": {"damage": 20, "range": 150}, "tags": ["root"]}
+        self.assertEqual(merge_dicts(root, middle, leaf), expected)
+        self.assertEqual(merge_dicts(root, middle, leaf), merge_dicts(merge_dicts(root, middle), leaf))
+
+    def test_multiple_overlays_not_modified(self):
+        """Test that merging several overlays in place does not modify any of them."""
+        layers = [{"a": {"x": 1}}, {"a": {"y": 2}, "b": {"c": {"d": 1}}}, {"a": {"x": 3}, "b": {"c": {"d": 2}}}]
+        layers_copy = copy.deepcopy(layers)
+        self.assertEqual(merge_dicts(*layers), {"a": {"x": 3, "y": 2}, "b": {"c": {"d": 2}}})
+        self.assertEqual(layers, layers_copy)
+
+    def test_blank_overlay_removes_base_value(self):
+        """Test that a blank overlay value that is not None or [] removes the base value, as the original rescan did."""
+        self.assertEqual(merge_dicts({"a": "x", "b": {"c": 1}}, {"a": "", "b": {"c": None}}), {"b": {"c": 1}})
+        self.assertEqual(merge_dicts({"a": "x"}, {"b": 1}, {"a": ""}, {"a": "y"}), {"b": 1, "a": "y"})
+
+    def test_matches_reference_merge(self):
+        """Test random layer chains against the original implementation, folded over the layers."""
+        rng = random.Random(16)
+        for _ in range(2000):
+            layers = [random_layer(rng, 3) for _ in range(rng.randint(1, 4))]
+            try:
+                expected = layers[0]
+                for overlay in layers[1:]:
+                    expected = reference_merge_dicts(expected, overlay)
+            except TypeError:
+                with self.assertRaises(TypeError):
+                    merge_dicts(*layers)
+                continue
+            result = merge_dicts(*layers)
+            self.assertEqual(result, expected, layers)
+            self.assertEqual(list(result), list(expected), layers)
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,92 @@
+import unittest
+import sys
+import os
+import json
+import shutil
+import tempfile
+
+# Set required environment variables before importing utils to prevent OPTIONS validation errors
+os.environ['SHOULD_PARSE'] = 'false'  # Disable parsing to avoid requiring EXPORT_DIR and OUTPUT_DIR
+os.environ.setdefault('EXPORT_DIR', '/tmp/test_export')  # Fallback if SHOULD_PARSE somehow becomes true
+os.environ.setdefault('OUTPUT_DIR', '/tmp/test_output')  # Fallback if SHOULD_PARSE somehow becomes true
+
+# Add the src directory to the Python path to import utils
+src_path = os.path.join(os.path.dirname(__file__), '..', '..', 'src')
+sys.path.insert(0, src_path)
+
+# Import directly from the src.utils module to avoid conflicts with tests.utils
+import importlib.util
+spec = importlib.util.spec_from_file_location("src_utils", os.path.join(src_path, "utils.py"))
+src_utils = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(src_utils)
+
+PhaseProfiler = src_utils.PhaseProfiler
+
+
+class TestPhaseProfiler(unittest.TestCase):
+    """Test cases for the PhaseProfiler class."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.original_profiler = src_utils.PHASE_PROFILER
+        self.profiler = PhaseProfiler(sample_interval=0.001)
+        src_utils.PHASE_PROFILER = self.profiler
+        src_utils.JSON_FILE_CACHE.clear()
+        self.file_path = os.path.join(self.temp_dir, "data.json")
+        with open(self.file_path, 'w') as f:
+            json.dump({"value": list(range(100))}, f)
+        self.file_size = os.path.getsize(self.file_path)
+
+    def tearDown(self):
+        src_utils.PHASE_PROFILER = self.original_profiler
+        src_utils.JSON_FILE_CACHE.clear()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_json_reads_per_phase(self):
+        with self.profiler.phase("first"):
+            src_utils.get_json_data(self.file_path)
+            src_utils.get_json_data(self.file_path) # cache hit, no bytes read
+        with self.profiler.phase("second"):
+            src_utils.get_json_data(self.file_path, use_cache=False)
+        with self.profiler.phase("empty"):
+            pass
+
+        first, second, empty = self.profiler.phases
+        self.assertEqual((first["name"], first["json_calls"], first["json_bytes_read"]), ("first", 2, self.file_size))
+        self.assertEqual((second["name"], second["json_calls"], second["json_bytes_read"]), ("second", 1, self.file_size))
+        self.assertEqual((empty["json_calls"], empty["json_bytes_read"]), (0, 0))
+        self.assertEqual(self.profiler.report()["total"]["json_calls"], 3)
+
+    def test_time_and_memory(self):
+        with self.profiler.phase("work"):
+            sum(i * i for i in range(200000))
+            self.profiler.record_task("Module", 0.5)
+        self.profiler.record_task("outside", 1.0) # ignored outside a phase
+
+        phase = self.profiler.phases[0]
+        self.assertGreater(phase["wall_s"], 0)
+        self.assertGreaterEqual(phase["cpu_s"], 0)
+        self.assertGreaterEqual(phase["peak_rss_mb"], phase["end_rss_mb"])
+        self.assertGreater(phase["end_rss_mb"], 0)
+        self.assertEqual(phase["tasks"], {"Module": 0.5})
+
+    def test_phase_recorded_on_error(self):
+        with self.assertRaises(ValueError):
+            with self.profiler.phase("failing"):
+                raise ValueError("parse error")
+        self.assertEqual(self.profiler.phases[0]["name"], "failing")
+
+    def test_save(self):
+        with self.profiler.phase("work"):
+            pass
+        report_file = os.path.join(self.temp_dir, "reports", "parse_profile.json")
+        self.profiler.save(report_file)
+        with open(report_file) as f:
+            report = json.load(f)
+        self.assertEqual([phase["name"] for phase in report["phases"]], ["work"])
+        self.assertIn("peak_rss_mb", report["total"])
+        self.profiler.log_summary()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -505,6 +505,46 @@ class TestProcessKeyToParserFunction(unittest.TestCase):
         self.assertEqual(self.mock_obj.data["key2"], "keep_this")     # Preserved
         self.assertEqual(self.mock_obj.data["key3"], 42)             # New
 
+    def test_compiled_entry_uses_current_parser(self):
+        """Test that a cached entry still calls the parser of the map it is called with."""
+        class Parsed:
+            def __init__(self, id, suffix):
+                self.id = id
+                self.suffix = suffix
+
+            def parse(self, value):
+                return f"{value}_{self.suffix}"
+
+        first = Parsed("first", "a")
+        second = Parsed("second", "b")
+        process_key_to_parser_function({"SimpleKey": (first.parse, "parsed")}, self.sample_data, first)
+        process_key_to_parser_function({"SimpleKey": (second.parse, "parsed")}, self.sample_data, second)
+
+        self.assertEqual(first.parsed, "simple_value_a")
+        self.assertEqual(second.parsed, "simple_value_b")
+
+    def test_compiled_entry_per_config_shape(self):
+        """Test that the same key with a different config shape is not served a stale entry."""
+        process_key_to_parser_function({"SimpleKey": "value"}, self.sample_data, self.mock_obj)
+        process_key_to_parser_function({"SimpleKey": ("value", "custom")}, self.sample_data, self.mock_obj)
+        result = process_key_to_parser_function({"SimpleKey": "value"}, self.sample_data, set_attrs=False, default_configuration={
+            'target': ParseTarget.MATCH_KEY
+        })
+
+        self.assertEqual(self.mock_obj.simple_key, "simple_value")
+        self.assertEqual(self.mock_obj.custom, "simple_value")
+        self.assertEqual(result, {"SimpleKey": "simple_value"})
+
+    def test_compiled_entry_invalid_target_only_raises_with_value(self):
+        """Test that an invalid target is only an error once there is a parsed value to store, every call."""
+        key_map = {"SimpleKey": (lambda value: None, None)}
+        process_key_to_parser_function(key_map, self.sample_data, self.mock_obj)
+
+        key_map = {"SimpleKey": (lambda value: value, None)}
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                process_key_to_parser_function(key_map, self.sample_data, self.mock_obj)
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
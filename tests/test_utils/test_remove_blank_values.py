@@ -399,6 +399,36 @@ class TestRemoveBlankValues(unittest.TestCase):
         }
         self.assertEqual(result, expected)
 
+    def test_dicts_rebuilt_lists_kept(self):
+        """Test that every dict is rebuilt, even without blank values, while lists are kept as is."""
+        original = {"nested": {"keep": 1}, "list": [{}, None]}
+        result = remove_blank_values(original)
+        self.assertIsNot(result, original)
+        self.assertIsNot(result["nested"], original["nested"])
+        self.assertIs(result["list"], original["list"])
+
+    def test_falsy_non_blank_types_preserved(self):
+        """Test that only None and empty str, list and dict are blank, not other empty or falsy values."""
+        original = {"tuple": (), "set": set(), "zero": 0.0, "false": False, "bytes": b""}
+        self.assertEqual(remove_blank_values(original), original)
+
+    def test_deeper_than_recursion_limit(self):
+        """Test that nesting deeper than the recursion limit is cleaned, keeping key order."""
+        depth = sys.getrecursionlimit() * 2
+        original = {}
+        innermost = original
+        for _ in range(depth):
+            innermost["next"] = {}
+            innermost["blank"] = ""
+            innermost["keep"] = 1
+            innermost = innermost["next"]
+        innermost["blank"] = None
+        result = remove_blank_values(original)
+        for _ in range(depth - 1):
+            self.assertEqual(list(result.keys()), ["next", "keep"])
+            result = result["next"]
+        self.assertEqual(result, {"keep": 1})
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -217,6 +217,35 @@ class TestSortDict(unittest.TestCase):
         expected = {"a": {"b": 2}, "b": {"a": 1}}
         self.assertEqual(result, expected)
 
+    def test_sorted_dict_not_rebuilt(self):
+        """Test that dicts already sorted at every level are returned as is."""
+        input_dict = {"a": {"x": 1, "y": [2]}, "b": 3}
+        self.assertIs(sort_dict(input_dict), input_dict)
+
+    def test_unsorted_nested_dict_rebuilds_parents(self):
+        """Test that a sorted dict holding an unsorted dict is rebuilt, leaving the input unchanged, while sorted siblings are reused."""
+        sorted_sibling = {"m": 1, "n": 2}
+        input_dict = {"a": {"b": {"z": 1, "y": 2}}, "c": sorted_sibling}
+        result = sort_dict(input_dict)
+        self.assertIsNot(result, input_dict)
+        self.assertEqual(list(result["a"]["b"].keys()), ["y", "z"])
+        self.assertEqual(list(input_dict["a"]["b"].keys()), ["z", "y"])
+        self.assertIs(result["c"], sorted_sibling)
+
+    def test_deeper_than_recursion_limit(self):
+        """Test that nesting deeper than the recursion limit is sorted."""
+        depth = sys.getrecursionlimit() * 2
+        input_dict = {}
+        innermost = input_dict
+        for _ in range(depth):
+            innermost["z"] = 1
+            innermost["next"] = {}
+            innermost = innermost["next"]
+        result = sort_dict(input_dict)
+        for _ in range(depth):
+            self.assertEqual(list(result.keys()), ["next", "z"])
+            result = result["next"]
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -158,6 +158,18 @@ class TestToSnakeCase(unittest.TestCase):
         self.assertEqual(to_snake_case("Test123ABC"), "test123_abc")
         self.assertEqual(to_snake_case("Version2.0Beta"), "version2.0_beta")
 
+    def test_memoized(self):
+        """Test that repeated conversions are served from the memo with the same result."""
+        converter = src_utils.SnakeCaseConverter()
+        self.assertEqual(converter.convert("ModuleRarity"), "module_rarity")
+        self.assertEqual(converter.convert("ModuleRarity"), "module_rarity")
+        self.assertEqual(converter.convert("_"), "")
+        self.assertEqual(converter.convert("_"), "")
+        stats = converter.stats()
+        self.assertEqual(stats['hits'], 2)
+        self.assertEqual(stats['misses'], 2)
+        self.assertEqual(stats['entries'], 2)
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file